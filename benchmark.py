@@ -0,0 +1,1096 @@
+import argparse
+import csv
+import functools
+import gc
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import five_oh_six as utl
+import last_assignment as la
+import problem_set_11 as ps11
+
+
+# Constants
+COMPRESSION_FORMATS = (None, "gzip", "bz2", "xz", "zstd")
+IMPORT_CACHE_SIZES = (0, 1000, 10000)
+BASE_SIZES = {"episodes": 133, "articles": 250, "planets": 120, "people": 90, "starships": 60}
+NEWS_DESKS = ("Arts&Leisure", "Business Day", "Culture", "Movies", "National", "Science", "Weekend")
+PARALLEL_CSV_CHUNKS = 4  # byte ranges the parallel CSV reader splits the planets file into
+REGRESSION_THRESHOLD = 1.25
+REPO_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SCALES = (1, 10, 100)
+SWAPI_ENDPOINT = "https://swapi.py4e.com/api"
+
+KEY_MAPPINGS = {
+    "droid": {
+        "url": "url",
+        "name": "name",
+        "model": "model",
+        "manufacturer": "manufacturer",
+        "create_year": "create_date",
+        "height": "height_cm",
+        "mass": "mass_kg",
+        "equipment": "equipment",
+        "instructions": "instructions",
+    },
+    "person": {
+        "url": "url",
+        "name": "name",
+        "birth_year": "birth_date",
+        "height": "height_cm",
+        "mass": "mass_kg",
+        "homeworld": "homeworld",
+        "species": "species",
+        "force_sensitive": "force_sensitive",
+    },
+    "planet": {
+        "url": "url",
+        "name": "name",
+        "region": "region",
+        "sector": "sector",
+        "suns": "suns",
+        "moons": "moons",
+        "orbital_period": "orbital_period_days",
+        "diameter": "diameter_km",
+        "gravity": "gravity_std",
+        "climate": "climate",
+        "terrain": "terrain",
+        "population": "population",
+    },
+    "species": {
+        "url": "url",
+        "name": "name",
+        "classification": "classification",
+        "designation": "designation",
+        "average_lifespan": "average_lifespan_yrs",
+        "average_height": "average_height_cm",
+        "language": "language",
+    },
+    "starship": {
+        "url": "url",
+        "name": "name",
+        "model": "model",
+        "starship_class": "starship_class",
+        "manufacturer": "manufacturer",
+        "length": "length_m",
+        "hyperdrive_rating": "hyperdrive_rating",
+        "MGLT": "max_megalight_hr",
+        "max_atmosphering_speed": "max_atmosphering_speed_kph",
+        "crew": "crew_size",
+        "crew_members": "crew_members",
+        "passengers": "max_passengers",
+        "passengers_on_board": "passengers_on_board",
+        "cargo_capacity": "cargo_capacity_kg",
+        "consumables": "consumables",
+        "armament": "armament",
+    },
+}
+
+
+def _time(func):
+    """Returns the seconds taken by a single call of the zero-argument < func >."""
+
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def generate_articles(count, rng):
+    """Returns < count > synthetic New York Times article dictionaries.
+
+    Parameters:
+        count (int): number of articles
+        rng (random.Random): random number generator
+
+    Returns:
+        list: article dictionaries
+    """
+
+    return [
+        {
+            "web_url": f"https://www.nytimes.com/{i}.html",
+            "headline": {"main": f"Headline {i}"},
+            "news_desk": rng.choice(NEWS_DESKS + ("None",)),
+            "byline": {"original": f"By Reporter {i % 40}"},
+            "document_type": "article",
+            "type_of_material": rng.choice(("News", "Review", "Op-Ed")),
+            "abstract": f"Abstract for article {i}.",
+            "word_count": rng.choice((0, rng.randint(100, 3000))),
+            "pub_date": f"{1977 + i % 45}-05-25T00:00:00+0000",
+        }
+        for i in range(count)
+    ]
+
+
+def generate_episodes(count, rng):
+    """Returns < count > synthetic Clone Wars episode rows (string values, as read from CSV).
+
+    Parameters:
+        count (int): number of episodes
+        rng (random.Random): random number generator
+
+    Returns:
+        list: episode dictionaries
+    """
+
+    directors = [f"Director{i} Surname{i % 17}" for i in range(30)]
+    writers = [f"Writer{i} Lastname{i % 11}" for i in range(40)]
+    return [
+        {
+            "series_title": "Star Wars: The Clone Wars",
+            "series_season_num": str(i // 22 + 1),
+            "series_episode_num": str(i + 1),
+            "season_episode_num": str(i % 22 + 1),
+            "episode_title": f"Episode {i + 1}",
+            "episode_director": ", ".join(rng.sample(directors, rng.choice((1, 1, 1, 2)))),
+            "episode_writers": ", ".join(rng.sample(writers, rng.randint(1, 3))),
+            "episode_release_date": f"{2008 + i % 13}-10-03",
+            "episode_prod_code": f"{i // 22 + 1}.{i % 22 + 1:02d}",
+            "episode_us_viewers_mm": rng.choice(("", "n/a", f"{rng.uniform(0.5, 4.5):.2f}")),
+        }
+        for i in range(count)
+    ]
+
+
+def generate_mandalorian_people(count, planets, rng):
+    """Returns < count > synthetic Wookieepedia person rows (string values, as read from CSV) in
+    the problem set 11 layout, whose "homeworld" values name the passed in < planets >.
+
+    Parameters:
+        count (int): number of people
+        planets (list): generated planet dictionaries
+        rng (random.Random): random number generator
+
+    Returns:
+        list: person dictionaries
+    """
+
+    return [
+        {
+            "url": f"{SWAPI_ENDPOINT}/people/{i + 1}/",
+            "name": f"Person {i:06d}",
+            "birth_year": rng.choice(("unknown", f"{rng.randint(1, 900)}BBY")),
+            "height": rng.choice(("n/a", str(rng.randint(60, 230)))),
+            "mass": rng.choice(("unknown", str(rng.randint(20, 160)))),
+            "homeworld": rng.choice(planets)["name"].upper(),  # matched case insensitively
+            "force_sensitive": rng.choice(("True", "False", "")),
+        }
+        for i in range(count)
+    ]
+
+
+def generate_names(count, rng):
+    """Returns < count > synthetic two-word names (e.g., "Korrivan Tessa") built from random
+    syllables, for benchmarking name matching.
+
+    Parameters:
+        count (int): number of names
+        rng (random.Random): random number generator
+
+    Returns:
+        list: name strings
+    """
+
+    syllables = ("ka", "ro", "vin", "tes", "sa", "mar", "dun", "el", "qui", "zor", "an", "ri", "ba")
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize()
+
+    return [f"{word()} {word()}" for _ in range(count)]
+
+
+def generate_planets(count, rng):
+    """Returns < count > synthetic Wookieepedia planet rows (string values, as read from CSV).
+
+    Parameters:
+        count (int): number of planets
+        rng (random.Random): random number generator
+
+    Returns:
+        list: planet dictionaries
+    """
+
+    return [
+        {
+            "url": f"{SWAPI_ENDPOINT}/planets/{i + 1}/",
+            "name": f"Planet {i:06d}",
+            "region": rng.choice(("Outer Rim Territories", "Mid Rim", "Core Worlds", "unknown")),
+            "sector": f"Sector {i % 50}",
+            "system": f"System {i % 200}",
+            "suns": str(rng.randint(1, 3)),
+            "moons": rng.choice(("unknown", str(rng.randint(0, 5)))),
+            "orbital_period": str(rng.randint(200, 600)),
+            "diameter": rng.choice(("unknown", f"{rng.randint(4000, 20000):,}")),
+            "gravity": rng.choice(("1 standard", "0.98", "N/A")),
+            "climate": rng.choice(("arid", "temperate", "temperate, tropical", "frozen")),
+            "terrain": rng.choice(("desert", "grasslands, mountains", "jungle, swamp")),
+            "population": rng.choice(("unknown", f"{rng.randint(1000, 10**12):,}")),
+        }
+        for i in range(count)
+    ]
+
+
+def generate_people(count, planet_count, rng):
+    """Returns < count > synthetic SWAPI person dictionaries whose "homeworld" and "species" URLs
+    refer to the generated planets and a small set of species.
+
+    Parameters:
+        count (int): number of people
+        planet_count (int): number of generated planets that may serve as a homeworld
+        rng (random.Random): random number generator
+
+    Returns:
+        list: person dictionaries
+    """
+
+    return [
+        {
+            "url": f"{SWAPI_ENDPOINT}/people/{i + 1}/",
+            "name": f"Person {i:06d}",
+            "birth_year": rng.choice(("unknown", f"{rng.randint(1, 900)}BBY")),
+            "height": str(rng.randint(60, 230)),
+            "mass": rng.choice(("unknown", str(rng.randint(20, 160)))),
+            "homeworld": f"{SWAPI_ENDPOINT}/planets/{rng.randint(1, planet_count)}/",
+            "species": [f"{SWAPI_ENDPOINT}/species/{rng.randint(1, 10)}/"],
+            "force_sensitive": rng.choice(("True", "False")),
+        }
+        for i in range(count)
+    ]
+
+
+def generate_starships(count, rng):
+    """Returns < count > synthetic Wookieepedia starship rows (string values, as read from CSV).
+
+    Parameters:
+        count (int): number of starships
+        rng (random.Random): random number generator
+
+    Returns:
+        list: starship dictionaries
+    """
+
+    return [
+        {
+            "url": f"{SWAPI_ENDPOINT}/starships/{i + 1}/",
+            "name": f"Starship {i:06d}",
+            "model": f"Model {i % 25}",
+            "starship_class": rng.choice(("Starfighter", "Freighter", "Star Destroyer")),
+            "manufacturer": f"Manufacturer {i % 12}",
+            "length": f"{rng.uniform(5, 1600):,.1f}",
+            "hyperdrive_rating": rng.choice(("unknown", f"{rng.uniform(0.5, 4):.1f}")),
+            "MGLT": rng.choice(("unknown", str(rng.randint(10, 120)))),
+            "max_atmosphering_speed": rng.choice(("n/a", str(rng.randint(800, 1500)))),
+            "crew": str(rng.randint(1, 9)),
+            "passengers": str(rng.randint(0, 20)),
+            "cargo_capacity": f"{rng.randint(0, 10**6):,}",
+            "consumables": rng.choice(("1 week", "1 month", "2 years")),
+            "armament": "Laser cannons,Ion cannon",
+        }
+        for i in range(count)
+    ]
+
+
+def generate_swapi_fixtures(planets, species_count=10):
+    """Returns a fixture store (see < utl.set_fetch_mode >) containing SWAPI representations of
+    the passed in < planets > and < species_count > species so that person transforms can
+    retrieve linked resources without network access.
+
+    Parameters:
+        planets (list): generated planet dictionaries
+        species_count (int): number of species to generate
+
+    Returns:
+        dict: cache keys mapped to SWAPI resources
+    """
+
+    fixtures = {utl.create_cache_key(planet["url"]): dict(planet) for planet in planets}
+    for i in range(1, species_count + 1):
+        url = f"{SWAPI_ENDPOINT}/species/{i}/"
+        fixtures[utl.create_cache_key(url)] = {
+            "url": url,
+            "name": f"Species {i}",
+            "classification": "mammal",
+            "designation": "sentient",
+            "average_lifespan": str(60 + i * 10),
+            "average_height": str(140 + i * 5),
+            "language": f"Language {i}",
+        }
+    return fixtures
+
+
+def write_csv(filepath, rows):
+    """Writes a list of flat dictionaries to a CSV file.
+
+    Parameters:
+        filepath (str): path to file
+        rows (list): dictionaries that share the same keys
+
+    Returns:
+        None
+    """
+
+    with open(filepath, "w", newline="", encoding="utf-8") as file_obj:
+        writer = csv.DictWriter(file_obj, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def verify_parallel_csv(directory, rows=300, seed=506):
+    """Checks that < utl.read_csv_to_dicts_parallel > returns the same rows as
+    < utl.read_csv_to_dicts > for a file whose quoted fields contain delimiters, escaped quotes,
+    and newlines ("\n" and "\r\n"), split into byte ranges small enough that many quoted
+    fields straddle a tentative range boundary.
+
+    Parameters:
+        directory (str): directory for the file written
+        rows (int): number of rows written
+        seed (int): random seed
+
+    Returns:
+        None
+    """
+
+    rng = random.Random(seed)
+    values = (
+        "Tatooine", "Arid, rocky", 'The "Jewel" of the Core', "Line one\nLine two", "A\r\nB", ""
+    )
+    filepath = os.path.join(directory, "parallel.csv")
+    for line_terminator in ("\n", "\r\n"):
+        with open(filepath, "w", newline="", encoding="utf-8") as file_obj:
+            writer = csv.writer(file_obj, lineterminator=line_terminator)
+            writer.writerow(["name", "climate, terrain", 'notes "quoted"', "multi\nline"])
+            writer.writerows([f"{rng.choice(values)} {i}" for _ in range(4)] for i in range(rows))
+        expected = utl.read_csv_to_dicts(filepath)
+        for chunk_size in (1, 7, 64, 1000):
+            if utl.read_csv_to_dicts_parallel(filepath, chunk_size=chunk_size) != expected:
+                raise AssertionError(f"parallel CSV rows differ (chunk_size={chunk_size})")
+    os.remove(filepath)
+
+
+def create_dataset(directory, scale, seed=506):
+    """Generates the synthetic input files for a benchmark run at the passed in < scale > and
+    writes them to < directory >.
+
+    Parameters:
+        directory (str): output directory
+        scale (int): multiplier applied to < BASE_SIZES >
+        seed (int): random seed
+
+    Returns:
+        dict: file paths and record counts
+    """
+
+    rng = random.Random(seed)
+    sizes = {name: size * scale for name, size in BASE_SIZES.items()}
+    planets = generate_planets(sizes["planets"], rng)
+
+    paths = {
+        "episodes": os.path.join(directory, "data-clone_wars_episodes.csv"),
+        "articles": os.path.join(directory, "data-nyt_star_wars_articles.json"),
+        "planets": os.path.join(directory, "data-wookieepedia_planets.csv"),
+        "people": os.path.join(directory, "data-swapi_people.json"),
+        "starships": os.path.join(directory, "data-wookieepedia_starships.csv"),
+        "fixtures": os.path.join(directory, "fixtures.json"),
+        "mandalorian_people": os.path.join(directory, "data-mandalorian_people.csv"),
+        "mandalorian_planets": os.path.join(directory, "data-mandalorian_planets.json"),
+    }
+    write_csv(paths["episodes"], generate_episodes(sizes["episodes"], rng))
+    utl.write_json(paths["articles"], generate_articles(sizes["articles"], rng))
+    write_csv(paths["planets"], planets)
+    utl.write_json(paths["people"], generate_people(sizes["people"], sizes["planets"], rng))
+    write_csv(paths["starships"], generate_starships(sizes["starships"], rng))
+    utl.write_json(paths["fixtures"], generate_swapi_fixtures(planets))
+    write_csv(
+        paths["mandalorian_people"], generate_mandalorian_people(sizes["people"], planets, rng)
+    )
+    utl.write_json(paths["mandalorian_planets"], planets)
+
+    return {"paths": paths, "sizes": sizes}
+
+
+def measure(func, records, repeat=3):
+    """Times the passed in zero-argument < func > (best of < repeat > runs), then runs it once
+    more under < tracemalloc > to record peak memory.
+
+    Parameters:
+        func (callable): stage to measure
+        records (int): number of records the stage processes (used for throughput)
+        repeat (int): number of timed runs
+
+    Returns:
+        tuple: (result of the last run, dict of measurements)
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, {
+        "records": records,
+        "seconds": best,
+        "records_per_sec": records / best if best else None,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_stages(dataset, directory):
+    """Runs each pipeline stage (load, convert, transform, lookup, join, group, sort, write, and
+    the streamed read-to-write pipeline) over the passed in < dataset > and returns the
+    measurements keyed by "<stage>.<step>".
+
+    Parameters:
+        dataset (dict): return value of < create_dataset >
+        directory (str): directory for files written by the "write" stage
+
+    Returns:
+        dict: stage measurements
+    """
+
+    paths, sizes = dataset["paths"], dataset["sizes"]
+    none_values = la.NONE_VALUES
+    results = {}
+
+    # load
+    episodes_raw, results["load.episodes_csv"] = measure(
+        lambda: utl.read_csv_to_dicts(paths["episodes"]), sizes["episodes"]
+    )
+    articles, results["load.articles_json"] = measure(
+        lambda: utl.read_json(paths["articles"]), sizes["articles"]
+    )
+    planets_raw, results["load.planets_csv"] = measure(
+        lambda: utl.read_csv_to_dicts(paths["planets"]), sizes["planets"]
+    )
+    planet_chunk_size = os.path.getsize(paths["planets"]) // PARALLEL_CSV_CHUNKS + 1
+    planets_parallel, results["load.planets_csv_parallel"] = measure(
+        lambda: utl.read_csv_to_dicts_parallel(paths["planets"], chunk_size=planet_chunk_size),
+        sizes["planets"],
+    )
+    if planets_parallel != planets_raw:
+        raise AssertionError("read_csv_to_dicts_parallel rows differ from read_csv_to_dicts")
+    people_raw, results["load.people_json"] = measure(
+        lambda: utl.read_json(paths["people"]), sizes["people"]
+    )
+    starships_raw, results["load.starships_csv"] = measure(
+        lambda: utl.read_csv_to_dicts(paths["starships"]), sizes["starships"]
+    )
+
+    # convert
+    episodes, results["convert.episodes"] = measure(
+        lambda: la.convert_episode_values([dict(row) for row in episodes_raw], none_values),
+        sizes["episodes"],
+    )
+
+    # transform
+    planets, results["transform.planets"] = measure(
+        lambda: [la.transform_planet(planet, KEY_MAPPINGS, none_values) for planet in planets_raw],
+        sizes["planets"],
+    )
+    factory = utl.EntityFactory(KEY_MAPPINGS)
+    _, results["transform.planets_entities"] = measure(
+        lambda: [
+            la.transform_planet(planet, KEY_MAPPINGS, none_values, factory) for planet in planets_raw
+        ],
+        sizes["planets"],
+    )
+    starships, results["transform.starships"] = measure(
+        lambda: [la.transform_starship(ship, KEY_MAPPINGS, none_values) for ship in starships_raw],
+        sizes["starships"],
+    )
+    utl.set_fetch_mode("replay", paths["fixtures"])
+    la.cache = utl.SwapiCache(os.path.join(directory, "CACHE.json"))
+    people, results["transform.people"] = measure(
+        lambda: [
+            la.transform_person(person, KEY_MAPPINGS, none_values, planets_raw)
+            for person in people_raw
+        ],
+        sizes["people"],
+    )
+    utl.set_fetch_mode("live")
+
+    # lookup
+    diameters = [planet["diameter_km"] for planet in planets[:: max(1, len(planets) // 50)]]
+
+    def query_diameters():
+        query = utl.EntityQuery(planets)
+        return [query.first("diameter_km", diameter) for diameter in diameters]
+
+    _, results["lookup.get_nested_dict"] = measure(
+        lambda: [utl.get_nested_dict(planets, "diameter_km", d) for d in diameters], len(diameters)
+    )
+    _, results["lookup.entity_query"] = measure(query_diameters, len(diameters))
+    named = [{"name": name} for name in generate_names(sizes["planets"], random.Random(506))]
+    names = [  # misspelled names (a character dropped)
+        entity["name"][:3] + entity["name"][4:].upper()
+        for entity in named[:: max(1, len(named) // 50)]
+    ]
+    index, results["lookup.fuzzy_index_build"] = measure(
+        lambda: utl.FuzzyIndex(named), sizes["planets"]
+    )
+    _, results["lookup.fuzzy_index"] = measure(
+        lambda: [index.get(name) for name in names], len(names)
+    )
+
+    # join (SWAPI planets enriched with the Wookieepedia planets)
+    swapi_planets = [
+        planet for key, planet in utl.read_json(paths["fixtures"]).items() if "/planets/" in key
+    ]
+
+    def join_per_entity():
+        joined = []
+        for planet in swapi_planets:
+            planet = dict(planet)
+            wookiee_planet = utl.get_nested_dict(planets_raw, "name", planet["name"])
+            if wookiee_planet:
+                planet.update(wookiee_planet)
+            joined.append(planet)
+        return joined
+
+    _, results["join.get_nested_dict"] = measure(join_per_entity, len(swapi_planets))
+    _, results["join.hash_join"] = measure(
+        lambda: utl.hash_join(swapi_planets, planets_raw, "name").rows, len(swapi_planets)
+    )
+
+    # group
+    news_desks, results["group.news_desks"] = measure(
+        lambda: la.get_news_desks(articles, none_values), sizes["articles"]
+    )
+    grouped, results["group.articles_by_news_desk"] = measure(
+        lambda: la.group_articles_by_news_desk(news_desks, articles), sizes["articles"]
+    )
+    _, results["group.mean_word_counts"] = measure(
+        lambda: {
+            desk: la.calculate_articles_mean_word_count(desk_articles)
+            for desk, desk_articles in grouped.items()
+        },
+        sizes["articles"],
+    )
+    _, results["group.word_count_stats_streaming"] = measure(
+        lambda: la.summarize_news_desk_word_counts(
+            utl.iter_json_array(paths["articles"]), none_values
+        ),
+        sizes["articles"],
+    )
+    director_counts, results["group.director_counts"] = measure(
+        lambda: la.count_episodes_by_director(episodes), sizes["episodes"]
+    )
+    summaries = {  # exact vs sketched distinct and top counts
+        "directors": (la.summarize_episode_credits, (episodes, "episode_director"), episodes),
+        "writers": (la.summarize_episode_credits, (episodes, "episode_writers"), episodes),
+        "news_desks": (la.summarize_news_desks, (articles, none_values), articles),
+    }
+    for name, (summarize, args, records) in summaries.items():
+        exact, results[f"group.{name}_summary_exact"] = measure(
+            lambda: summarize(*args), len(records)
+        )
+        sketched, results[f"group.{name}_summary_sketch"] = measure(
+            lambda: summarize(*args, sketch=True), len(records)
+        )
+        tolerance = 3 * sketched.distinct_sketch.error * exact.distinct() + 1
+        if abs(sketched.distinct() - exact.distinct()) > tolerance:
+            raise AssertionError(f"sketched distinct {name} count exceeds its error bound")
+
+    # sort
+    _, results["sort.director_leaderboard"] = measure(
+        lambda: la.rank_episode_counts(director_counts), len(director_counts)
+    )
+    _, results["sort.planets_two_orders"] = measure(
+        lambda: [
+            view.to_list()
+            for collection in [utl.EntityCollection(planets)]
+            for view in (
+                collection.sorted_view(("name", True)),
+                collection.sorted_view(("diameter_km", True), "name"),
+            )
+        ],
+        sizes["planets"],
+    )
+
+    # write
+    output = os.path.join(directory, "stu-output.json")
+    _, results["write.planets"] = measure(
+        lambda: utl.write_json(output, planets), sizes["planets"]
+    )
+    _, results["write.people"] = measure(lambda: utl.write_json(output, people), sizes["people"])
+    _, results["write.starships"] = measure(
+        lambda: utl.write_json(output, starships), sizes["starships"]
+    )
+
+    # pipeline (read -> convert -> join -> transform -> write) materialized vs streamed
+    def pipeline_lists():
+        rows = utl.read_csv_to_dicts(paths["planets"])
+        rows = [utl.convert_none_values(row, none_values) for row in rows]
+        rows = utl.hash_join(rows, swapi_planets, "name", precedence="left").rows
+        rows = [la.transform_planet(row, KEY_MAPPINGS, none_values) for row in rows]
+        return utl.write_json(output, rows)
+
+    def pipeline_stream():
+        return (
+            utl.Pipeline(utl.iter_csv_to_dicts(paths["planets"]))
+            .map(utl.convert_none_values, none_values)
+            .join(swapi_planets, "name", precedence="left")
+            .map(la.transform_planet, KEY_MAPPINGS, none_values)
+            .write_json(stream_output)
+        )
+
+    stream_output = os.path.join(directory, "stu-output-stream.json")
+    _, results["pipeline.planets_lists"] = measure(pipeline_lists, sizes["planets"])
+    _, results["pipeline.planets_stream"] = measure(pipeline_stream, sizes["planets"])
+    if utl.read_json(output) != utl.read_json(stream_output):
+        raise AssertionError("streamed pipeline output differs from the materialized output")
+
+    return results
+
+
+def run_problem_set_11_stages(dataset, directory):
+    """Runs the < problem_set_11 > pipeline stages (load, create, lookup, and write) over the
+    passed in < dataset > and returns the measurements keyed by "ps11.<step>".
+
+    Parameters:
+        dataset (dict): return value of < create_dataset >
+        directory (str): directory for files written by the "write" steps
+
+    Returns:
+        dict: stage measurements
+    """
+
+    paths, sizes = dataset["paths"], dataset["sizes"]
+    results = {}
+
+    # load
+    people_raw, results["ps11.load_people_csv"] = measure(
+        lambda: utl.read_csv_to_dicts(paths["mandalorian_people"]), sizes["people"]
+    )
+    planets_raw, results["ps11.load_planets_json"] = measure(
+        lambda: utl.read_json(paths["mandalorian_planets"]), sizes["planets"]
+    )
+    starships_raw = utl.read_csv_to_dicts(paths["starships"])
+
+    # create (people look up their homeworld in the Wookieepedia planets)
+    planets, results["ps11.create_planets"] = measure(
+        lambda: [ps11.create_planet(planet) for planet in planets_raw], sizes["planets"]
+    )
+    starships, results["ps11.create_starships"] = measure(
+        lambda: [ps11.create_starship(starship) for starship in starships_raw],
+        sizes["starships"],
+    )
+    _, results["ps11.create_vehicles"] = measure(
+        lambda: [ps11.create_vehicle(starship) for starship in starships_raw],
+        sizes["starships"],
+    )
+    people, results["ps11.create_people"] = measure(
+        lambda: [ps11.create_person(person, planets_raw) for person in people_raw],
+        sizes["people"],
+    )
+
+    # lookup (case-insensitive name matching, linear scan vs fuzzy index)
+    names = [planet["name"].lower() for planet in planets_raw[:: max(1, len(planets_raw) // 50)]]
+    _, results["ps11.lookup_linear"] = measure(
+        lambda: [ps11.get_mandalorian_data(planets_raw, name) for name in names], len(names)
+    )
+    index = utl.FuzzyIndex(planets_raw)
+    _, results["ps11.lookup_fuzzy_index"] = measure(
+        lambda: [ps11.get_mandalorian_data(index, name) for name in names], len(names)
+    )
+
+    # write
+    output = os.path.join(directory, "stu-output.json")
+    _, results["ps11.write_people"] = measure(
+        lambda: utl.write_json(output, people), sizes["people"]
+    )
+    _, results["ps11.write_starships"] = measure(
+        lambda: utl.write_json(output, starships), sizes["starships"]
+    )
+    _, results["ps11.write_planets"] = measure(
+        lambda: utl.write_json(output, planets), sizes["planets"]
+    )
+
+    return results
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Compares < results > against a saved < baseline > and returns the names of the stages
+    whose time grew by more than the < threshold > ratio.
+
+    Parameters:
+        results (dict): current measurements keyed by scale then stage
+        baseline (dict): saved measurements in the same format
+        threshold (float): slowdown ratio considered a regression
+
+    Returns:
+        list: "<scale>/<stage>" names of regressed stages
+    """
+
+    regressions = []
+    for scale, stages in results.items():
+        for stage, measurement in stages.items():
+            previous = baseline.get(scale, {}).get(stage)
+            if not previous or not previous["seconds"]:
+                continue
+            ratio = measurement["seconds"] / previous["seconds"]
+            measurement["baseline_ratio"] = round(ratio, 3)
+            if ratio > threshold:
+                regressions.append(f"{scale}/{stage}")
+    return regressions
+
+
+def measure_compression(data, directory, formats=COMPRESSION_FORMATS, repeat=3):
+    """Writes and reads back the passed in < data > with < utl.write_json > and
+    < utl.read_json > in each compression format, both pretty-printed (indent=2) and compact
+    (indent=None), and records the file size and the best encode and decode times. Formats
+    whose optional package is not installed (e.g., "zstd") are skipped.
+
+    Parameters:
+        data (dict|list): document to write
+        directory (str): directory for the files written
+        formats (iterable): compression formats (None means uncompressed)
+        repeat (int): number of timed runs
+
+    Returns:
+        dict: measurements keyed by "<format>.<indent>"
+    """
+
+    results = {}
+    for compression in formats:
+        for indent in (2, None):
+            filepath = os.path.join(directory, "compression.json")
+            write = functools.partial(
+                utl.write_json, filepath, data, indent=indent, compression=compression
+            )
+            try:
+                write()
+            except ImportError:
+                break
+            read = functools.partial(utl.read_json, filepath, compression=compression)
+            write_s = min(_time(write) for _ in range(repeat))
+            read_s = min(_time(read) for _ in range(repeat))
+            results[f"{compression or 'none'}.{'indent' if indent else 'compact'}"] = {
+                "bytes": os.path.getsize(filepath),
+                "write_ms": write_s * 1000,
+                "read_ms": read_s * 1000,
+            }
+            os.remove(filepath)
+    return results
+
+
+def measure_json_backends(dataset, directory, repeat=3):
+    """Writes and reads back the cache file and the people file with < utl.write_json > and
+    < utl.read_json > using each installed JSON backend (see < utl.set_json_backend >) and
+    records the best encode and decode times. The backend in use beforehand is restored.
+
+    Parameters:
+        dataset (dict): return value of < create_dataset >
+        directory (str): directory for the files written
+        repeat (int): number of timed runs
+
+    Returns:
+        dict: measurements keyed by "<file>.<backend>"
+    """
+
+    documents = {
+        "cache": utl.read_json(dataset["paths"]["fixtures"]),
+        "people": utl.read_json(dataset["paths"]["people"]),
+    }
+    current = utl.get_json_backend()
+    results = {}
+    try:
+        for backend in utl.JSON_BACKENDS:
+            try:
+                utl.set_json_backend(backend)
+            except ImportError:
+                continue
+            for name, data in documents.items():
+                filepath = os.path.join(directory, f"{name}.{backend}.json")
+                write = functools.partial(utl.write_json, filepath, data)
+                read = functools.partial(utl.read_json, filepath)
+                write_s = min(_time(write) for _ in range(repeat))
+                read_s = min(_time(read) for _ in range(repeat))
+                if read() != data:
+                    raise AssertionError(f"{backend} round trip of {name} differs")
+                results[f"{name}.{backend}"] = {
+                    "bytes": os.path.getsize(filepath),
+                    "write_ms": write_s * 1000,
+                    "read_ms": read_s * 1000,
+                }
+                os.remove(filepath)
+    finally:
+        utl.set_json_backend(current)
+    return results
+
+
+def measure_loader_memory(dataset, directory, repeat=3):
+    """Measures the memory retained by (and the best load time of) the decoded cache file and
+    Wookieepedia-style input files when loaded as is, with interned strings, and (JSON only)
+    with shared subtrees (see < utl.read_json > and < utl.read_csv_to_dicts >). The cache file
+    stores each planet under its URL and under a search key, as SWAPI searches do.
+
+    Parameters:
+        dataset (dict): return value of < create_dataset >
+        directory (str): directory for the cache file written
+        repeat (int): number of timed loads
+
+    Returns:
+        dict: measurements keyed by "<file>.<option>"
+    """
+
+    paths = dataset["paths"]
+    fixtures = utl.read_json(paths["fixtures"])
+    cache = dict(fixtures)
+    for key, resource in fixtures.items():
+        if "/planets/" in key:
+            search = {"search": resource["name"]}
+            cache[utl.create_cache_key(f"{SWAPI_ENDPOINT}/planets/", search)] = {
+                "count": 1,
+                "next": None,
+                "previous": None,
+                "results": [resource],
+            }
+    cache_filepath = os.path.join(directory, "CACHE.json")
+    utl.write_json(cache_filepath, cache)
+
+    loaders = {
+        "cache_json": lambda **options: utl.read_json(cache_filepath, **options),
+        "people_json": lambda **options: utl.read_json(paths["people"], **options),
+        "planets_csv": lambda **options: utl.read_csv_to_dicts(paths["planets"], **options),
+    }
+
+    results = {}
+    for name, load in loaders.items():
+        variants = {"plain": {}, "intern": {"intern": True}}
+        if name.endswith("_json"):
+            variants["share"] = {"share": True}
+        for variant, options in variants.items():
+            seconds = min(_time(lambda: load(**options)) for _ in range(repeat))
+            gc.collect()
+            tracemalloc.start()
+            data = load(**options)
+            gc.collect()  # also empties the interpreter's free lists
+            retained = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del data
+            results[f"{name}.{variant}"] = {"kib": round(retained / 1024, 1), "ms": seconds * 1000}
+    return results
+
+
+def measure_import_time(cache_sizes=IMPORT_CACHE_SIZES, repeat=5):
+    """Measures the cold-start time of importing < last_assignment > in a fresh interpreter
+    with a cache file of each of the passed in < cache_sizes > (number of entries) in the
+    working directory. Import time should not depend on the cache size because the cache is
+    read on first use rather than at import.
+
+    Parameters:
+        cache_sizes (iterable): numbers of cache entries to test
+        repeat (int): number of imports per size (the fastest is reported)
+
+    Returns:
+        dict: measurements keyed by "import.cache_<size>"
+    """
+
+    code = (
+        "import time; start = time.perf_counter(); import last_assignment; "
+        "print(time.perf_counter() - start)"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_DIRECTORY, env.get("PYTHONPATH")]))
+
+    results = {}
+    for size in cache_sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            planets = generate_planets(size, random.Random(size))
+            utl.write_json(os.path.join(directory, "CACHE.json"), generate_swapi_fixtures(planets, 0))
+            best = min(
+                float(
+                    subprocess.run(
+                        [sys.executable, "-c", code],
+                        cwd=directory,
+                        env=env,
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    ).stdout
+                )
+                for _ in range(repeat)
+            )
+        results[f"import.cache_{size}"] = {
+            "records": size,
+            "seconds": best,
+            "records_per_sec": None,
+            "peak_kib": None,
+        }
+    return results
+
+
+def print_compression_report(results):
+    """Prints a table of the compression measurements.
+
+    Parameters:
+        results (dict): measurements keyed by scale then "<format>.<indent>"
+
+    Returns:
+        None
+    """
+
+    print(f"{'scale':>6} {'format':<20} {'bytes':>12} {'ratio':>7} {'write ms':>10} {'read ms':>10}")
+    for scale, formats in results.items():
+        baseline = formats["none.indent"]["bytes"]
+        for name, m in formats.items():
+            print(
+                f"{scale:>6} {name:<20} {m['bytes']:>12,} {m['bytes'] / baseline:>7.2f} "
+                f"{m['write_ms']:>10.2f} {m['read_ms']:>10.2f}"
+            )
+
+
+def print_json_backend_report(results):
+    """Prints a table of the JSON backend measurements.
+
+    Parameters:
+        results (dict): measurements keyed by scale then "<file>.<backend>"
+
+    Returns:
+        None
+    """
+
+    print(f"{'scale':>6} {'file.backend':<20} {'bytes':>12} {'write ms':>10} {'read ms':>10}")
+    for scale, backends in results.items():
+        for name, m in backends.items():
+            print(
+                f"{scale:>6} {name:<20} {m['bytes']:>12,} {m['write_ms']:>10.2f} "
+                f"{m['read_ms']:>10.2f}"
+            )
+
+
+def print_memory_report(results):
+    """Prints a table of the loader memory measurements.
+
+    Parameters:
+        results (dict): measurements keyed by scale then "<file>.<option>"
+
+    Returns:
+        None
+    """
+
+    print(f"{'scale':>6} {'loader':<24} {'retained KiB':>13} {'vs plain':>9} {'load ms':>10}")
+    for scale, loaders in results.items():
+        for name, m in loaders.items():
+            plain = loaders[f"{name.split('.')[0]}.plain"]["kib"]
+            print(
+                f"{scale:>6} {name:<24} {m['kib']:>13,.1f} {m['kib'] / plain:>8.2f}x "
+                f"{m['ms']:>10.2f}"
+            )
+
+
+def print_report(results):
+    """Prints a table of the measurements.
+
+    Parameters:
+        results (dict): measurements keyed by scale then stage
+
+    Returns:
+        None
+    """
+
+    print(f"{'scale':>6} {'stage':<34} {'records':>9} {'ms':>10} {'rec/s':>12} {'peak KiB':>10} {'vs base':>8}")
+    for scale, stages in results.items():
+        for stage, m in stages.items():
+            rate = f"{m['records_per_sec']:,.0f}" if m["records_per_sec"] else "-"
+            peak = m["peak_kib"] if m["peak_kib"] is not None else "-"
+            ratio = f"{m['baseline_ratio']:.2f}x" if "baseline_ratio" in m else ""
+            print(
+                f"{scale:>6} {stage:<34} {m['records']:>9} {m['seconds'] * 1000:>10.2f} "
+                f"{rate:>12} {peak:>10} {ratio:>8}"
+            )
+
+
+def main():
+    """Entry point for program. Generates synthetic datasets at each requested scale, times each
+    < last_assignment > and < problem_set_11 > pipeline stage, prints a report, and optionally
+    saves or compares against a baseline.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the assignment pipeline stages.")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results to PATH")
+    parser.add_argument("--compare", metavar="PATH", help="compare results to the baseline at PATH")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument(
+        "--import-cache-sizes", type=int, nargs="*", default=list(IMPORT_CACHE_SIZES),
+        help="cache file sizes (entries) for the import-time benchmark; omit values to skip",
+    )
+    parser.add_argument(
+        "--json-backends", action="store_true",
+        help="also measure encode/decode time of each installed JSON backend",
+    )
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="also measure memory retained by the loaders with interning and subtree sharing",
+    )
+    parser.add_argument(
+        "--compression", action="store_true",
+        help="also measure file size and encode/decode time of each compression format",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    compression_results = {}
+    memory_results = {}
+    json_results = {}
+    if args.import_cache_sizes:
+        results["cold"] = measure_import_time(args.import_cache_sizes)
+    with tempfile.TemporaryDirectory() as directory:
+        verify_parallel_csv(directory)
+        for scale in args.scales:
+            dataset = create_dataset(directory, scale)
+            results[f"{scale}x"] = run_stages(dataset, directory)
+            results[f"{scale}x"].update(run_problem_set_11_stages(dataset, directory))
+            if args.json_backends:
+                json_results[f"{scale}x"] = measure_json_backends(dataset, directory)
+            if args.memory:
+                memory_results[f"{scale}x"] = measure_loader_memory(dataset, directory)
+            if args.compression:
+                compression_results[f"{scale}x"] = measure_compression(
+                    utl.read_json(dataset["paths"]["fixtures"]), directory
+                )
+
+    regressions = []
+    if args.compare:
+        regressions = compare(results, utl.read_json(args.compare), args.threshold)
+
+    print_report(results)
+    if compression_results:
+        print()
+        print_compression_report(compression_results)
+    if memory_results:
+        print()
+        print_memory_report(memory_results)
+    if json_results:
+        print()
+        print_json_backend_report(json_results)
+
+    if args.save_baseline:
+        utl.write_json(args.save_baseline, results)
+
+    if regressions:
+        print(f"\nRegressions (> {args.threshold:.2f}x baseline): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
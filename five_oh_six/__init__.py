@@ -0,0 +1,83 @@
+import os
+
+from .aggregate import DEFAULT_QUANTILES, GroupedStats, P2Quantile, RunningStats
+from .build import MANIFEST_FILEPATH, BuildRunner
+from .cache import CACHE_FILEPATH, LATENCY_BUCKETS, CacheStats, create_cache, create_cache_key
+from .convert import (
+    NONE_VALUES,
+    convert_none_values,
+    convert_to_float,
+    convert_to_int,
+    convert_to_list,
+    convert_to_none,
+    to_float,
+    to_gravity_value,
+    to_int,
+    to_list,
+    to_none,
+    to_year_era,
+)
+from .entities import ENTITY_CLASSES, Entity, EntityFactory, entity_class
+from .files import (
+    COMPRESSION_EXTENSIONS,
+    CSV_CHUNK_SIZE,
+    STREAM_CHUNK_SIZE,
+    infer_compression,
+    iter_csv_to_dicts,
+    iter_json_array,
+    read_csv_to_dicts,
+    read_csv_to_dicts_parallel,
+    read_json,
+    write_json,
+    write_json_array,
+)
+from .fuzzy import FUZZY_THRESHOLD, FuzzyIndex, normalize_name
+from .instrument import (
+    INSTRUMENTATION_LOCK,
+    INSTRUMENTED_FUNCTIONS,
+    disable_instrumentation,
+    enable_instrumentation,
+    instrumentation_report,
+    record_cache_access,
+    reset_instrumentation,
+    timed,
+    write_instrumentation_report,
+)
+from .lazy import LazyResource
+from .locking import FileLock
+from .pipeline import PIPELINE_BUFFER_SIZE, Pipeline
+from .records import (
+    EntityCollection,
+    EntityQuery,
+    JoinResult,
+    SortedView,
+    get_nested_dict,
+    hash_join,
+    iter_hash_join,
+)
+from .serialize import JSON_BACKENDS, dumps, get_json_backend, loads, set_json_backend
+from .sketch import (
+    CMS_DEPTH,
+    CMS_WIDTH,
+    HLL_PRECISION,
+    CountMinSketch,
+    HeavyHitters,
+    HyperLogLog,
+    StreamSummary,
+)
+from .swapi import PREFETCH_LINKS, SwapiCache
+from .web import (
+    FETCH_SETTINGS,
+    FIXTURES_LOCK,
+    VALIDATOR_HEADERS,
+    get_resource,
+    get_session,
+    save_fixtures,
+    set_fetch_mode,
+)
+
+
+if os.environ.get("FIVE_OH_SIX_JSON"):
+    set_json_backend(os.environ["FIVE_OH_SIX_JSON"])
+if os.environ.get("FIVE_OH_SIX_INSTRUMENT"):
+    enable_instrumentation(os.environ["FIVE_OH_SIX_INSTRUMENT"])
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+
+from .cache import create_cache
+from .files import read_json, write_json
+
+# Constants
+MANIFEST_FILEPATH = "./.build-manifest.json"
+
+
+class BuildRunner:
+    """Rebuilds JSON outputs (e.g., the "stu-*.json" files) only when their inputs change.
+
+    Each output is produced by a build stage (see < build >) whose inputs are fingerprinted:
+    the SHA-256 digests of the input files (e.g., "data-*.csv" files, upstream outputs, the
+    script itself) and of JSON serializations of input values (e.g., key mappings or SWAPI
+    resources retrieved from the cache). The fingerprint and the digest of the output file are
+    recorded in a manifest file. If a later run computes the same fingerprint and the output
+    file is unchanged the stage is skipped and the output is read back from the file instead.
+
+    File digests are recorded in the manifest with the file's size and modification time and
+    are only recomputed when either changes. Delete the manifest (or pass < force=True >) to
+    rebuild every output.
+
+    Parameters:
+        manifest_filepath (str): path to the manifest file
+        files (iterable): files every stage depends on (e.g., the script's own source)
+        force (bool): if True rebuild every output
+    """
+
+    def __init__(self, manifest_filepath=MANIFEST_FILEPATH, files=(), force=False):
+        self.manifest_filepath = manifest_filepath
+        self.files = tuple(str(filepath) for filepath in files)
+        self.force = force
+        self.manifest = {"stages": {}, "files": {}, **create_cache(manifest_filepath)}
+        self.built = []
+        self.skipped = []
+
+    def __str__(self):
+        return f"build: {len(self.built)} outputs rebuilt, {len(self.skipped)} up to date"
+
+    def build(self, output, compute, files=(), values=(), **kwargs):
+        """Returns the data written to < output >. If the stage's fingerprint (see
+        < fingerprint >) differs from the one recorded in the manifest, or the output file is
+        missing or was modified, < compute > is called and its return value is written to
+        < output > with < write_json >; otherwise the output file is read and returned.
+
+        WARN: < compute > must return JSON compatible data (dictionaries with string keys,
+        lists rather than tuples) so that skipped and rebuilt stages return equal values.
+
+        Parameters:
+            output (str): path to the output file
+            compute (callable): zero-argument function that returns the output data
+            files (iterable): paths to the input files of the stage
+            values (iterable): JSON serializable input values of the stage
+            kwargs (dict): optional keyword arguments passed to < write_json >
+
+        Returns:
+            dict|list: output data
+        """
+
+        output = str(output)
+        fingerprint = self.fingerprint(files, values)
+        stage = self.manifest["stages"].get(output)
+        if (
+            not self.force
+            and stage
+            and stage["fingerprint"] == fingerprint
+            and stage["output"] == self.file_digest(output)
+        ):
+            self.skipped.append(output)
+            return read_json(output)
+
+        data = compute()
+        write_json(output, data, **kwargs)
+        self.manifest["stages"][output] = {
+            "fingerprint": fingerprint,
+            "output": self.file_digest(output),
+        }
+        write_json(self.manifest_filepath, self.manifest)
+        self.built.append(output)
+        return data
+
+    def file_digest(self, filepath):
+        """Returns the SHA-256 digest of the content of the file located at < filepath > or None
+        if the file does not exist. The digest recorded in the manifest is reused if the file's
+        size and modification time are unchanged.
+
+        Parameters:
+            filepath (str): path to file
+
+        Returns:
+            str: hexadecimal digest
+        """
+
+        filepath = str(filepath)
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+
+        entry = self.manifest["files"].get(filepath)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["sha256"]
+
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as file_obj:
+            for chunk in iter(lambda: file_obj.read(1 << 20), b""):
+                digest.update(chunk)
+        self.manifest["files"][filepath] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest.hexdigest(),
+        }
+        return digest.hexdigest()
+
+    def fingerprint(self, files=(), values=()):
+        """Returns a digest of the passed in input < files > (plus the files every stage depends
+        on) and input < values >.
+
+        Parameters:
+            files (iterable): paths to input files
+            values (iterable): JSON serializable input values
+
+        Returns:
+            str: hexadecimal digest
+        """
+
+        digest = hashlib.sha256()
+        for filepath in (*self.files, *files):
+            digest.update(f"{filepath}\0{self.file_digest(filepath)}\n".encode("utf-8"))
+        for value in values:
+            digest.update(
+                json.dumps(value, sort_keys=True, ensure_ascii=False, default=repr).encode("utf-8")
+            )
+            digest.update(b"\n")
+        return digest.hexdigest()
@@ -0,0 +1,320 @@
+import bisect
+import sys
+import threading
+import time
+
+from urllib.parse import quote, urlencode, urljoin
+
+from .files import read_json
+from .instrument import record_cache_access
+
+# Constants
+CACHE_FILEPATH = "./CACHE.json"
+
+# Upper bounds (seconds) of the CacheStats network latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class CacheStats:
+    """Counters that describe how a resource cache is being used: hits, misses, a histogram of
+    network request latencies, deep copies performed (count, time, and optionally bytes),
+    conditional revalidations, background prefetches, writes of the cache to the file system, and
+    replacements (cached entries replaced by a newer copy when a revalidation found them modified;
+    the cache has no eviction policy, so entries are never removed). Counters can be read at any
+    time with < summary > and printed with < format_summary >.
+
+    Counters are updated, read by < summary >, and reset under a lock, so a single instance can
+    be shared by threads and a summary is a consistent snapshot. Hits and misses are also passed
+    to < record_cache_access > so that they appear in the instrumentation report when
+    instrumentation is enabled.
+
+    Parameters:
+        name (str): name of the caching function (e.g., "get_swapi_resource")
+        track_sizes (bool): if True estimate the bytes of each deep copy (adds overhead)
+    """
+
+    def __init__(self, name="get_swapi_resource", track_sizes=False):
+        self.name = name
+        self.track_sizes = track_sizes
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __str__(self):
+        return self.format_summary()
+
+    def deepcopy(self, obj):
+        """Returns a deep copy of < obj > and records the time taken (and the estimated size of
+        the copy if < track_sizes > is True). Objects and arrays that occur more than once in
+        < obj > (e.g., subtrees shared by < read_json >) are copied separately, so mutating one
+        occurrence in the copy never changes another.
+
+        Parameters:
+            obj (dict|list): object to copy
+
+        Returns:
+            dict|list: deep copy of < obj >
+        """
+
+        start = time.perf_counter()
+        duplicate = _copy_tree(obj)
+        elapsed = time.perf_counter() - start
+        size = _deep_sizeof(duplicate) if self.track_sizes else 0
+        with self._lock:
+            self.deepcopies += 1
+            self.deepcopy_s += elapsed
+            self.deepcopy_bytes += size
+        return duplicate
+
+    def format_summary(self):
+        """Returns the < summary > as a human-readable multi-line string.
+
+        Returns:
+            str: formatted summary
+        """
+
+        summary = self.summary()
+        ratio = summary["hit_ratio"]
+        lines = [
+            f"{self.name} cache: {summary['hits']} hits, {summary['misses']} misses"
+            + (f" ({ratio:.1%} hit ratio)" if ratio is not None else ""),
+            f"  network: {summary['network_requests']} requests, {summary['network_s']:.3f}s",
+            f"  deepcopy: {summary['deepcopies']} copies, {summary['deepcopy_s']:.3f}s"
+            + (f", {summary['deepcopy_bytes']:,} bytes" if self.track_sizes else ""),
+            f"  revalidation: {summary['revalidations']} requests, "
+            f"{summary['not_modified']} not modified",
+            f"  prefetch: {summary['prefetches']} resources, "
+            f"{summary['prefetch_failures']} failed",
+            f"  persist: {summary['persist_writes']} writes, {summary['persist_s']:.3f}s",
+            f"  replacements: {summary['replacements']}",
+        ]
+        histogram = ", ".join(
+            f"{bound}: {count}" for bound, count in summary["network_latency_histogram"].items() if count
+        )
+        if histogram:
+            lines.insert(2, f"  network latency (seconds <=): {histogram}")
+        return "\n".join(lines)
+
+    def record_hit(self):
+        """Counts a cache hit.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.hits += 1
+        record_cache_access(self.name, True)
+
+    def record_miss(self):
+        """Counts a cache miss.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.misses += 1
+        record_cache_access(self.name, False)
+
+    def record_network(self, elapsed):
+        """Counts a network request that took < elapsed > seconds.
+
+        Parameters:
+            elapsed (float): request duration in seconds
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.network_requests += 1
+            self.network_s += elapsed
+            self.network_latency[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def record_persist(self, elapsed):
+        """Counts a write of the cache to the file system that took < elapsed > seconds.
+
+        Parameters:
+            elapsed (float): write duration in seconds
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.persist_writes += 1
+            self.persist_s += elapsed
+
+    def record_prefetch(self, failed=False):
+        """Counts a resource fetched in the background ahead of its use (see
+        < SwapiCache.prefetch >).
+
+        Parameters:
+            failed (bool): True if the resource could not be retrieved
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.prefetches += 1
+            if failed:
+                self.prefetch_failures += 1
+
+    def record_replacement(self, count=1):
+        """Counts < count > cached entries replaced by a newer copy of the resource (e.g., when a
+        revalidation finds the resource modified).
+
+        Parameters:
+            count (int): number of replaced entries
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.replacements += count
+
+    def record_revalidation(self, modified):
+        """Counts a conditional request for a cached resource. A resource that was not modified
+        ("304 Not Modified") should also be counted as a hit.
+
+        Parameters:
+            modified (bool): True if the server returned a new copy of the resource
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.revalidations += 1
+            if not modified:
+                self.not_modified += 1
+
+    def reset(self):
+        """Sets every counter to zero.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.network_requests = 0
+            self.network_s = 0.0
+            self.network_latency = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.deepcopies = 0
+            self.deepcopy_s = 0.0
+            self.deepcopy_bytes = 0
+            self.revalidations = 0
+            self.not_modified = 0
+            self.prefetches = 0
+            self.prefetch_failures = 0
+            self.persist_writes = 0
+            self.persist_s = 0.0
+            self.replacements = 0
+
+    def summary(self):
+        """Returns the current counters as a dictionary. The network latency histogram maps
+        each bucket's upper bound in seconds ("inf" for the last bucket) to a request count.
+
+        Returns:
+            dict: cache statistics
+        """
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else None,
+                "network_requests": self.network_requests,
+                "network_s": self.network_s,
+                "network_latency_histogram": dict(
+                    zip([str(bound) for bound in LATENCY_BUCKETS] + ["inf"], self.network_latency)
+                ),
+                "deepcopies": self.deepcopies,
+                "deepcopy_s": self.deepcopy_s,
+                "deepcopy_bytes": self.deepcopy_bytes,
+                "revalidations": self.revalidations,
+                "not_modified": self.not_modified,
+                "prefetches": self.prefetches,
+                "prefetch_failures": self.prefetch_failures,
+                "persist_writes": self.persist_writes,
+                "persist_s": self.persist_s,
+                "replacements": self.replacements,
+            }
+
+
+def _copy_tree(obj):
+    """Returns a copy of the JSON compatible < obj > in which every dictionary and list is a new
+    object. Unlike < copy.deepcopy > repeated occurrences of an object are not kept as one.
+    """
+
+    if isinstance(obj, dict):
+        return {key: _copy_tree(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_tree(item) for item in obj]
+    return obj  # strings, numbers, booleans, and None are immutable
+
+
+def _deep_sizeof(obj):
+    """Returns the approximate memory footprint in bytes of < obj > including the nested
+    dictionaries, lists, and their keys and values.
+    """
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(key) + _deep_sizeof(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_sizeof(item) for item in obj)
+    return size
+
+
+def create_cache(filepath, compression="infer", share=False):
+    """Attempts to retrieve cache contents written to the file system. If successful the
+    cache contents from the previous script run are returned to the caller as the new
+    cache. If unsuccessful an empty cache is returned to the caller.
+
+    Parameters:
+        filepath (str): path to the cache file
+        compression (str): compression format of the cache file (see < read_json >)
+        share (bool): if True store equal strings and entities once (see < read_json >)
+
+    Returns:
+        dict: cache either empty or populated with resources from the previous script run
+    """
+
+    try:
+        return read_json(filepath, compression=compression, share=share)
+    except FileNotFoundError:
+        return {}
+
+
+def create_cache_key(url, params=None):
+    """Returns a lowercase string key comprising the passed in < url >, and, if < params >
+    is not None, the "?" separator, and any URL encoded querystring fields and values.
+    Passes to the function < urllib.parse.urljoin > the optional < quote_via=quote >
+    argument to override the default behavior and encode spaces with '%20' rather
+    than "+".
+
+    Example:
+       url = https://swapi.py4e.com/api/people/
+       params = {'search': 'Anakin Skywalker'}
+       returns 'https://swapi.py4e.com/api/people/?search=anakin%20skywalker'
+
+    Parameters:
+        url (str): string representing a Uniform Resource Locator (URL)
+        params (dict): one or more key-value pairs representing querystring fields and values
+
+    Returns:
+        str: Lowercase "key" comprising the URL and accompanying querystring fields and values
+    """
+
+    if params:
+        return urljoin(
+            url, f"?{urlencode(params, quote_via=quote)}"
+        ).lower()  # space replaced with '%20'
+    else:
+        return url.lower()
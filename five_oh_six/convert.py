@@ -0,0 +1,260 @@
+# Constants
+NONE_VALUES = ("", "n/a", "none", "unknown")
+
+
+def convert_none_values(data, convert):
+    """Attempts to convert certain < data > values to < None > by passing each value in < data >
+    along with < convert > to the function < convert_to_none >.
+
+    Loops over the < data > items and calls < convert_to_none > to transform values found in
+    < convert > from within a dictionary comprehension. Existing < data > keys are used in the new
+    dictionary produced by the comprehension.
+
+    Parameters:
+        data (dict): source data
+        convert (tuple): strings to convert to None
+
+    Returns:
+        dict: new dictionary in which values found in < convert > have been replaced by
+              < None >
+    """
+
+    return {k: convert_to_none(v, convert) for k, v in data.items()}
+
+
+def convert_to_float(value):
+    """Attempts to convert a string, number, or boolean < value > to a float. Can also convert
+    numbers masquerading as strings that include one or more thousand separator commas
+    (e.g., "5,000,000"). Delegates to the function < to_float > the task of converting the
+    < value >.
+
+    Parameters:
+        value (obj): string or number to be converted
+
+    Returns:
+        float|any: float if value successfully converted; otherwise returns value unchanged
+    """
+
+    return to_float(value)
+
+
+def convert_to_int(value):
+    """Attempts to convert a string, number boolean < value > in the < try > block to an integer.
+    Can also convert numbers masquerading as strings that include one or more thousand separator
+    commas (e.g., "5,000,000") or a period that designates a fractional component
+    (e.g., "5,000,000.9999").
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+
+    Parameters:
+        value (str|int): string or number to be converted
+
+    Returns:
+        int|any: integer if value successfully converted else returns value unchanged
+    """
+    try:
+        value = value.replace(",", "")
+        return int(value)
+    except:
+        return value
+
+
+def convert_to_list(value, delimiter=None):
+    """Attempts to convert a string < value > to a list using the provided < delimiter >.
+    Removes leading/trailing spaces before converting < value > to a list. Delegates to the
+    function < to_list > the task of converting the < value >.
+
+    Parameters:
+        value (str): string to be split.
+        delimiter (str): optional delimiter provided for splitting the string
+
+    Returns:
+         list|any: list if value successfully converted else returns value unchanged
+    """
+
+    return to_list(value, delimiter)
+
+
+def convert_to_none(value, convert):
+    """Attempts to convert the passed in < value > to < None > in the < try > block if the < value >
+    matches any of the strings representing null/none values in the passed in tuple < convert >.
+
+    Leading/trailing spaces are removed from the < value > before a case insensitive comparison is
+    performed between the < value > and the < convert > items. If a match is obtained < None > is
+    returned; otherwise the < value > is returned unchanged.
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+
+    Parameters:
+        value (obj): string or number to be converted
+        convert (tuple): strings to convert to None
+
+    Returns:
+        None|any: if value successfully converted; otherwise returns value unchanged
+    """
+
+    try:
+        if value.lower().strip() in convert:
+            return None
+        else:
+            return value
+    except:
+        return value
+
+
+def to_float(value):
+    """Attempts to convert a string, number, or boolean < value > in the < try > block to a float.
+    Can also convert numbers masquerading as strings that include one or more thousand separator
+    commas (e.g., "5,000,000").
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+
+    Parameters:
+        value (obj): string or number to be converted
+
+    Returns:
+        float|any: float if value successfully converted; otherwise returns value unchanged
+    """
+    if isinstance(value, str):
+        value = value.replace(',', '')
+    try:
+        return float(value)
+    except:
+        return value
+
+
+def to_gravity_value(value):
+    """Convert a planet's "gravity" value in the < try > block to a float. Removes the "standard"
+    unit of measure if it exists in the string (case insensitive comparison). Delegates to the
+    function < to_float() > the task of casting the < value > to a float.
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+
+    Parameters:
+        value (obj): string to be converted
+
+    Returns:
+        float: if value successfully converted; otherwise returns value unchanged
+    """
+
+    try:
+        if "standard" in value.lower():
+            return to_float(value.lower().replace("standard", "").strip())
+        else:
+            return to_float(value)
+    except:
+        return value
+
+
+def to_int(value):
+    """Attempts to convert a string, number boolean < value > in the < try > block to an integer.
+    Can also convert numbers masquerading as strings that include one or more thousand separator
+    commas (e.g., "5,000,000") or a period that designates a fractional component
+    (e.g., "5,000,000.9999").
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+
+    Parameters:
+        value (str|int): string or number to be converted
+
+    Returns:
+        int|any: integer if value successfully converted else returns value unchanged
+    """
+    try:
+        return int(to_float(value.replace(",", "")))
+    except:
+        return value
+
+
+def to_list(value, delimiter=None):
+    """Attempts to convert a string < value > to a list in the < try > block using the provided
+    < delimiter >. Removes leading/trailing spaces before converting < value > to a list.
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+
+    Parameters:
+        value (str): string to be split.
+        delimiter (str): optional delimiter provided for splitting the string
+
+    Returns:
+         list|any: list if value successfully converted else returns value unchanged
+    """
+    try:
+        value = value.strip()
+        if delimiter:
+            return value.split(delimiter)
+        else:
+            return value.split()
+    except:
+        return value
+
+
+def to_none(value, none_values):
+    """Attempts to convert the passed in < value > to < None > in the < try > block if the
+    < value > matches any of the strings in the passed in tuple < none_values >.
+
+    Leading/trailing spaces are removed from the < value > before a case insensitive comparison
+    is performed between the < value > and the < none_values > items. If a match is obtained
+    < None > is returned; otherwise the < value > is returned unchanged.
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except
+    block.
+
+    Parameters:
+        value (obj): string or number to be converted
+        none_values (tuple): strings to convert to None
+
+    Returns:
+        None|any: if value successfully converted; otherwise returns value unchanged
+    """
+    try:
+        value = value.strip()
+        if value.lower() in none_values:
+            return None
+        else:
+            return value
+    except:
+        return value
+
+
+def to_year_era(value):
+    """Attempts to separate the Galactic standard calendar "year" and "era" (e.g., 896BBY, 24ABY)
+    segments in < value > in the < try > block for storage in a dictionary.
+
+    In the < try > block the function first checks if the "year" segment of < value > is a number by
+    employing the appropriate string method. If the substring is numeric, the function returns a
+    dictionary literal that maps the necessary slicing expressions to "year" and "era" keys as
+    values. The dictionary is structured as follows:
+
+    {'year': < year > (int), 'era': < era > (str)}
+
+    {'year': 896, 'era': BBY}
+
+    Otherwise, if the "year" segment is not considered numeric return the `value` to the caller
+    unchanged.
+
+    If the year segment is numeric, delegates to the function < to_int() > the task of
+    converting the segment representing the year to an integer. The function is called from within
+    the dictionary literal.
+
+    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+
+    Parameters:
+        value (str): Galactic YearEra string to be converted
+
+    Returns:
+        dict: comprising year and era key-value pairs
+    """
+    try:
+        year_segment = value[:-3].strip()
+        era_segment = value[-3:]
+
+        if year_segment.isnumeric():
+            return {
+                "year": to_int(year_segment),
+                "era": era_segment
+            }
+        else:
+            return value
+    except:
+        return value
@@ -0,0 +1,120 @@
+from collections.abc import Mapping
+
+# Entity classes created by entity_class() keyed by (name, fields)
+ENTITY_CLASSES = {}
+
+
+class Entity(Mapping):
+    """Base class of the compact entity types created by < entity_class >. Each field is stored
+    in a slot rather than in a per-instance dictionary, which takes a fraction of the memory of
+    an equivalent dict. Entities behave like dictionaries whose keys are fixed: fields are read
+    and assigned with < entity[field] > (or < entity.get(field) >), iterate in field order, and
+    compare equal to dictionaries with the same items. Assigning a key that is not a field
+    raises a < KeyError >.
+
+    < write_json > writes entities as JSON objects (see < to_dict >).
+    """
+
+    __slots__ = ()
+    fields = ()
+    field_set = frozenset()
+
+    def __init__(self, data=None, **kwargs):
+        data = {**data, **kwargs} if kwargs else data or {}
+        unknown = data.keys() - self.field_set
+        if unknown:
+            raise KeyError(f"{type(self).__name__} has no fields {sorted(unknown)!r}")
+        get = data.get
+        for field in self.fields:
+            setattr(self, field, get(field))
+
+    def __getitem__(self, field):
+        if field not in self.field_set:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __setitem__(self, field, value):
+        if field not in self.field_set:
+            raise KeyError(f"{type(self).__name__} has no field {field!r}")
+        setattr(self, field, value)
+
+    def to_dict(self):
+        """Returns a new dictionary of the entity's fields and values.
+
+        Returns:
+            dict: field names mapped to values
+        """
+
+        return {field: getattr(self, field) for field in self.fields}
+
+
+class EntityFactory:
+    """Creates compact entities (see < entity_class >) of each kind (e.g., "planet", "person")
+    from the dictionaries produced by the transform and create functions. The fields of each
+    kind are taken from the new key names of the < keys > mapping (e.g., the values of
+    keys["planet"]) or, for kinds not in < keys >, from the keys of the dictionary passed in.
+
+    Usage:
+        factory = utl.EntityFactory(keys)
+        tatooine = transform_planet(swapi_tatooine, keys, NONE_VALUES, factory)
+
+    Parameters:
+        keys (dict): optional mapping of kinds to old key to new key mappings
+    """
+
+    def __init__(self, keys=None):
+        self.keys = keys or {}
+
+    def __call__(self, kind, data):
+        """Returns an entity of the passed in < kind > holding the < data > values.
+
+        Parameters:
+            kind (str): entity kind (e.g., "planet")
+            data (dict): field names mapped to values
+
+        Returns:
+            Entity: new entity
+        """
+
+        fields = self.keys[kind].values() if kind in self.keys else data.keys()
+        return entity_class(kind, fields)(data)
+
+
+def entity_class(name, fields):
+    """Returns a slotted < Entity > subclass named after < name > (e.g., "planet" becomes
+    "Planet") with one slot per field name in < fields >. Classes are created once per name and
+    field list and reused.
+
+    Parameters:
+        name (str): entity kind
+        fields (iterable): field names (valid Python identifiers that do not shadow an
+                           < Entity > attribute such as "keys" or "items")
+
+    Returns:
+        type: Entity subclass
+    """
+
+    fields = tuple(fields)
+    cls = ENTITY_CLASSES.get((name, fields))
+    if cls is None:
+        invalid = [
+            field for field in fields if not field.isidentifier() or hasattr(Entity, field)
+        ]
+        if invalid:
+            raise ValueError(f"Invalid field names for {name}: {invalid}")
+        class_name = "".join(part.capitalize() for part in name.split("_")) or "Entity"
+        cls = ENTITY_CLASSES[(name, fields)] = type(
+            class_name,
+            (Entity,),
+            {"__slots__": fields, "fields": fields, "field_set": frozenset(fields)},
+        )
+    return cls
@@ -0,0 +1,531 @@
+import bz2
+import codecs
+import csv
+import functools
+import gzip
+import io
+import json
+import lzma
+import mmap
+import os
+import re
+
+from .entities import Entity
+from .lazy import LazyResource
+from .serialize import dumps, get_json_backend, loads
+
+# Compression formats supported by read_json() and write_json() keyed by file extension
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+
+# Bytes of CSV parsed by each task of read_csv_to_dicts_parallel()
+CSV_CHUNK_SIZE = 1 << 20
+
+# Characters read at a time by iter_json_array()
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+def _compact_hook(strings, subtrees=None):
+    """Returns a < json.load > object_pairs_hook that replaces each string with the first equal
+    string seen (recorded in < strings >) and, if a < subtrees > dictionary is passed, each
+    object or array with the first structurally equal one seen, so that repeated values and
+    repeated nested objects (e.g., the same SWAPI entity cached under several search keys)
+    are stored once. The hook also returns a function that compacts the top-level value.
+    """
+
+    def identity(value):
+        if isinstance(value, (dict, list)):
+            return id(value)  # children are canonical (and kept alive by < subtrees >)
+        return (type(value), value)
+
+    def compact(value):
+        if isinstance(value, str):
+            return strings.setdefault(value, value)
+        if isinstance(value, list):
+            items = [compact(item) for item in value]
+            if subtrees is None:
+                return items
+            return subtrees.setdefault((list, tuple(identity(item) for item in items)), items)
+        return value  # numbers, None, and objects (already compacted by the hook)
+
+    def hook(pairs):
+        obj = {strings.setdefault(key, key): compact(value) for key, value in pairs}
+        if subtrees is None:
+            return obj
+        return subtrees.setdefault((dict, tuple((k, identity(v)) for k, v in obj.items())), obj)
+
+    return hook, compact
+
+
+def _csv_ranges(data, start, chunk_size, record):
+    """Splits the bytes-like < data > from the record boundary < start > into (start, end) byte
+    ranges of about < chunk_size > bytes that each begin and end on a CSV record boundary (see
+    < _csv_record_end >).
+    """
+
+    ranges = []
+    while start < len(data):
+        end = _csv_record_end(data, start, min(start + chunk_size, len(data)), record)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _csv_record_end(data, start, target, record):
+    """Returns the offset just past the end of the first CSV record of the bytes-like < data >
+    that starts at or after the record boundary < start > and ends after < target >. Records
+    without quote characters end at the next newline; records with quote characters are
+    matched by the < record > pattern (see < _csv_record_pattern >), so a quote only opens a
+    quoted field at the start of a field, as < csv.reader > parses them. Returns len(data) if
+    no record ends after < target > or a record cannot be matched (e.g., an unclosed quote).
+    """
+
+    while True:
+        quote = data.find(b'"', start)
+        if quote == -1:
+            quote = len(data)
+        if quote >= target:
+            newline = data.find(b"\n", target, quote)
+            if newline != -1:
+                return newline + 1  # no quote between < start > and the newline
+            if quote == len(data):
+                return len(data)
+        # parse the record that contains the quote
+        start = max(start, data.rfind(b"\n", start, quote) + 1, data.rfind(b"\r", start, quote) + 1)
+        match = record.match(data, start)
+        if match is None:
+            return len(data)
+        start = match.end()
+        if start > target or start == len(data):
+            return start
+
+
+def _csv_record_pattern(delimiter):
+    """Returns a compiled pattern that matches a CSV record (including its line terminator)
+    whose fields are separated by the byte string < delimiter >. A field that begins with a
+    quote character is quoted up to the next unescaped quote; quotes elsewhere are literal.
+    """
+
+    delimiter = re.escape(delimiter)
+    field = rb'(?:"(?:[^"]|"")*+"[^%s\r\n]*|(?!")[^%s\r\n]*)' % (delimiter, delimiter)
+    return re.compile(rb"%s(?:%s%s)*(?:\r\n|\n|\r|\Z)" % (field, delimiter, field))
+
+
+def _encode_default(obj, resolve_references=True):
+    """Returns a JSON serializable representation of objects the < json > module cannot
+    encode natively. < Entity > objects are encoded as dictionaries. < LazyResource >
+    references are encoded as the resolved dictionary or, if < resolve_references > is False,
+    as the unresolved URL.
+    """
+
+    if isinstance(obj, Entity):
+        return obj.to_dict()
+    if isinstance(obj, LazyResource):
+        return obj.resolve() if resolve_references else obj.url
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _is_utf8(encoding):
+    """Returns True if < encoding > names the UTF-8 codec (e.g., "utf-8", "UTF8")."""
+
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+def _open(filepath, mode, encoding, compression):
+    """Returns a text ("rt", "wt") or binary ("rb", "wb") file object for < filepath > that
+    transparently compresses or decompresses its content with < compression > ("gzip", "bz2",
+    "xz", "zstd", or None). "zstd" requires the optional < zstandard > package.
+    """
+
+    if mode.endswith("b"):
+        encoding = None
+    if compression is None:
+        return open(filepath, mode, encoding=encoding)
+    if compression == "gzip":
+        return gzip.open(filepath, mode, encoding=encoding, compresslevel=6)
+    if compression == "bz2":
+        return bz2.open(filepath, mode, encoding=encoding)
+    if compression == "xz":
+        return lzma.open(filepath, mode, encoding=encoding)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the zstandard package") from None
+        return zstandard.open(filepath, mode, encoding=encoding)
+    raise ValueError(f"Unsupported compression {compression!r}")
+
+
+def _parse_csv_range(filepath, start, end, fieldnames, encoding, delimiter):
+    """Returns the rows of the byte range [< start >, < end >) of the CSV file located at
+    < filepath > as dictionaries keyed by < fieldnames > (the header row of the file). Runs in
+    the worker processes of < read_csv_to_dicts_parallel >.
+    """
+
+    with open(filepath, "rb") as file_obj, mmap.mmap(
+        file_obj.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        text = data[start:end].decode(encoding)
+    return [
+        line
+        for line in csv.DictReader(
+            io.StringIO(text, newline=""), fieldnames=fieldnames, delimiter=delimiter
+        )
+    ]
+
+
+def infer_compression(filepath):
+    """Returns the compression format implied by the extension of < filepath > (see
+    < COMPRESSION_EXTENSIONS >) or None if the file is not compressed.
+
+    Parameters:
+        filepath (str): path to file
+
+    Returns:
+        str: "gzip", "bz2", "xz", "zstd", or None
+    """
+
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(filepath)[1].lower())
+
+
+def iter_csv_to_dicts(filepath, encoding="utf-8", newline="", delimiter=","):
+    """Generator version of < read_csv_to_dicts > that yields one row dictionary at a time, so
+    that only the current row is held in memory. The file is closed once every row is read
+    (or the generator is closed).
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+
+    Returns:
+        generator: dictionaries representing the rows
+    """
+
+    with open(filepath, "r", newline=newline, encoding=encoding) as file_obj:
+        yield from csv.DictReader(file_obj, delimiter=delimiter)
+
+
+def iter_json_array(filepath, encoding="utf-8", compression="infer"):
+    """Yields the items of the JSON array stored in the file located at < filepath > one at a
+    time (e.g., the planets of "stu-planets_sorted_name.json") rather than decoding the whole
+    document. The file is read in chunks of < STREAM_CHUNK_SIZE > characters, so memory use is
+    bounded by the largest item rather than by the size of the file. Compressed documents are
+    decompressed transparently (see < read_json >).
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        compression (str): "gzip", "bz2", "xz", "zstd", None, or "infer"
+
+    Returns:
+        generator: decoded array items
+    """
+
+    if compression == "infer":
+        compression = infer_compression(filepath)
+    decoder = json.JSONDecoder()
+    with _open(filepath, "rt", encoding, compression) as file_obj:
+        buffer = ""
+        position = 0
+        eof = False
+        started = False
+
+        def read_more():
+            nonlocal buffer, position, eof
+            chunk = file_obj.read(max(STREAM_CHUNK_SIZE, len(buffer) - position))
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        while True:
+            skip = " \t\r\n," if started else " \t\r\n"
+            while position < len(buffer) and buffer[position] in skip:
+                position += 1
+            if position == len(buffer):
+                if eof:
+                    state = "ends before the JSON array is closed" if started else "is empty"
+                    raise ValueError(f"{filepath} {state}")
+                read_more()
+                continue
+
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError(f"{filepath} does not contain a JSON array")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more()  # the item continues in the next chunk
+                continue
+            following = end
+            while following < len(buffer) and buffer[following] in " \t\r\n":
+                following += 1
+            if following == len(buffer) or buffer[following] not in ",]":
+                if eof:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, following)
+                read_more()  # the item (e.g., a number) may continue in the next chunk
+                continue
+            position = end
+            yield item
+
+
+def read_csv_to_dicts(filepath, encoding="utf-8", newline="", delimiter=",", intern=False):
+    """Accepts a file path, creates a file object, and returns a list of dictionaries that
+    represent the row values using the cvs.DictReader().
+
+    The rows share the header's key strings. If < intern > is True repeated values (e.g.,
+    "temperate" or "Outer Rim Territories") are also stored once rather than once per row.
+
+    WARN: This function must be implemented using a list comprehension in order to earn points.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        intern (bool): if True share equal value strings between rows
+
+    Returns:
+        list: nested dictionaries representing the file contents
+    """
+
+    with open(filepath, "r", newline=newline, encoding=encoding) as file_obj:
+        # data = []
+        # reader = csv.DictReader(file_obj, delimiter=delimiter)
+        # for line in reader:
+        #     data.append(line) # OrderedDict() | alternative: data.append(dict(line))
+        if not intern:
+            return [line for line in csv.DictReader(file_obj, delimiter=delimiter)]
+
+        strings = {}
+        return [
+            {
+                key: strings.setdefault(value, value) if isinstance(value, str) else value
+                for key, value in line.items()
+            }
+            for line in csv.DictReader(file_obj, delimiter=delimiter)
+        ]
+
+
+def read_csv_to_dicts_parallel(
+    filepath, encoding="utf-8", delimiter=",", max_workers=None, chunk_size=CSV_CHUNK_SIZE
+):
+    """Parallel version of < read_csv_to_dicts > for large files (e.g., episode, planet, or
+    starship exports). The memory-mapped file is split into byte ranges of about < chunk_size >
+    bytes that end on record boundaries, each range is parsed by a worker process with the
+    header row read once by the caller, and the rows are returned in file order.
+
+    Records are split as < csv.reader > splits them: a newline inside a quoted field (e.g., a
+    multi-line description) does not end a record, and a quote character only opens a quoted
+    field at the start of a field, so literal quotes in unquoted fields (e.g., 5'10") are kept
+    as is. Only the records that contain quote characters are parsed by the caller; the rest
+    are split at newlines. Files of a single range are parsed in the calling process.
+
+    The rows equal those returned by < read_csv_to_dicts >. Encodings in which quote, newline,
+    or delimiter characters are not single ASCII bytes (e.g., UTF-16) are read sequentially by
+    < read_csv_to_dicts >.
+
+    WARN: On platforms that start worker processes by spawning an interpreter (Windows, macOS)
+    call this function from code guarded by < if __name__ == "__main__" >.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        delimiter (str): delimiter that separates the row values
+        max_workers (int): maximum number of worker processes; defaults to the CPU count
+        chunk_size (int): approximate number of bytes parsed by each worker task
+
+    Returns:
+        list: nested dictionaries representing the file contents
+    """
+
+    if f'"\n{delimiter}'.encode(encoding) != f'"\n{delimiter}'.encode("ascii", "replace"):
+        return read_csv_to_dicts(filepath, encoding, delimiter=delimiter)
+    if os.path.getsize(filepath) == 0:
+        return []
+
+    with open(filepath, "rb") as file_obj, mmap.mmap(
+        file_obj.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        if data.find(b"\n") == -1:
+            return read_csv_to_dicts(filepath, encoding, delimiter=delimiter)  # one line or "\r"
+        record = _csv_record_pattern(delimiter.encode(encoding))
+        header_end = _csv_record_end(data, 0, 0, record)
+        header = data[:header_end].decode(encoding)
+        fieldnames = next(csv.reader(io.StringIO(header, newline=""), delimiter=delimiter), None)
+        ranges = _csv_ranges(data, header_end, chunk_size, record)
+
+    if fieldnames is None or not ranges:
+        return []
+    if len(ranges) == 1 or max_workers == 1:
+        return [
+            row
+            for start, end in ranges
+            for row in _parse_csv_range(filepath, start, end, fieldnames, encoding, delimiter)
+        ]
+
+    from concurrent.futures import ProcessPoolExecutor  # imported on first use (~20 ms)
+
+    parse = functools.partial(
+        _parse_csv_range, filepath, fieldnames=fieldnames, encoding=encoding, delimiter=delimiter
+    )
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count(), len(ranges))) as pool:
+        return [row for chunk in pool.map(parse, starts, ends) for row in chunk]
+
+
+def read_json(filepath, encoding="utf-8", compression="infer", intern=False, share=False):
+    """Reads a JSON document, decodes the file content, and returns a list or dictionary if
+    provided with a valid filepath. Compressed documents are decompressed transparently. The
+    file content is decoded by the JSON backend (see < set_json_backend >) straight from bytes.
+
+    If < intern > is True repeated string values (e.g., "temperate" or SWAPI URLs) are stored
+    once. If < share > is True structurally equal objects and arrays are also stored once
+    (e.g., a SWAPI entity cached under its URL and under several search keys), which implies
+    < intern >. Both options make decoding slower in exchange for a smaller decoded document
+    and always use the < json > module.
+
+    WARN: Shared subtrees are the same objects, so mutating one mutates every occurrence. Only
+    share subtrees of documents that are copied before they are modified (e.g., the cache).
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        compression (str): "gzip", "bz2", "xz", "zstd", None, or "infer" to choose the format
+                           from the file extension (see < infer_compression >)
+        intern (bool): if True share equal strings
+        share (bool): if True share equal strings, objects, and arrays
+
+    Returns:
+        dict/list: dict or list representations of the decoded JSON document
+    """
+
+    if compression == "infer":
+        compression = infer_compression(filepath)
+    if not (intern or share):
+        with _open(filepath, "rb", encoding, compression) as file_obj:
+            content = file_obj.read()
+        return loads(content if _is_utf8(encoding) else content.decode(encoding))
+
+    with _open(filepath, "rt", encoding, compression) as file_obj:
+        strings, subtrees = {}, {} if share else None
+        hook, compact = _compact_hook(strings, subtrees)
+        try:
+            return compact(json.load(file_obj, object_pairs_hook=hook))
+        finally:
+            # release the lookup tables now rather than when the (recursive) hook is collected
+            strings.clear()
+            if subtrees is not None:
+                subtrees.clear()
+
+
+def write_json(
+    filepath,
+    data,
+    encoding="utf-8",
+    ensure_ascii=False,
+    indent=2,
+    resolve_references=True,
+    compression="infer",
+):
+    """Serializes object as JSON. Writes content to the provided filepath, compressing it if
+    < compression > is set or implied by the file extension (e.g., "stu-planets.json.gz").
+    Compressed output is usually written with < indent=None > since the whitespace is of no
+    use to a reader that must decompress the file first. The data is encoded by the JSON
+    backend (see < set_json_backend >).
+
+    Parameters:
+        filepath (str): the path to the file
+        data (dict)/(list): the data to be encoded as JSON and written to the file
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+        resolve_references (bool): if True < LazyResource > references are written as the
+                                   resolved dictionary; otherwise as the unresolved URL
+        compression (str): "gzip", "bz2", "xz", "zstd", None, or "infer" to choose the format
+                           from the file extension (see < infer_compression >)
+
+    Returns:
+        None
+    """
+
+    if compression == "infer":
+        compression = infer_compression(filepath)
+    content = dumps(
+        data,
+        ensure_ascii=ensure_ascii,
+        indent=indent,
+        default=functools.partial(_encode_default, resolve_references=resolve_references),
+    )
+    with _open(filepath, "wb", encoding, compression) as file_obj:
+        file_obj.write(content if _is_utf8(encoding) else content.decode("utf-8").encode(encoding))
+
+
+def write_json_array(
+    filepath,
+    items,
+    encoding="utf-8",
+    ensure_ascii=False,
+    indent=2,
+    resolve_references=True,
+    compression="infer",
+):
+    """Serializes the passed in < items > as a JSON array and writes it to the provided
+    filepath one item at a time, so that a generator (e.g., a < Pipeline >) can be written
+    without first being collected into a list. The document written is the same as the one
+    written by < write_json > for a list of the items. See < write_json > for the parameters.
+
+    Parameters:
+        filepath (str): the path to the file
+        items (iterable): the values to be encoded as the items of the array
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+        resolve_references (bool): if True < LazyResource > references are written as the
+                                   resolved dictionary; otherwise as the unresolved URL
+        compression (str): "gzip", "bz2", "xz", "zstd", None, or "infer" to choose the format
+                           from the file extension (see < infer_compression >)
+
+    Returns:
+        int: number of items written
+    """
+
+    if compression == "infer":
+        compression = infer_compression(filepath)
+    if indent is None:
+        # match the item separator of the backend's compact encoding
+        separator = b"," if get_json_backend() == "orjson" and not ensure_ascii else b", "
+    else:
+        padding = b"\n" + b" " * indent
+        separator = b"," + padding
+    default = functools.partial(_encode_default, resolve_references=resolve_references)
+    utf8 = _is_utf8(encoding)
+
+    count = 0
+    with _open(filepath, "wb", encoding, compression) as file_obj:
+        file_obj.write(b"[")
+        for item in items:
+            content = dumps(item, ensure_ascii=ensure_ascii, indent=indent, default=default)
+            if indent is not None:
+                content = content.replace(b"\n", padding)
+            if not utf8:
+                content = content.decode("utf-8").encode(encoding)
+            file_obj.write(separator if count else padding if indent is not None else b"")
+            file_obj.write(content)
+            count += 1
+        if count and indent is not None:
+            file_obj.write(b"\n")
+        file_obj.write(b"]")
+    return count
@@ -0,0 +1,140 @@
+import math
+import unicodedata
+
+# Constants
+FUZZY_THRESHOLD = 0.6  # minimum similarity (0.0 - 1.0) of a fuzzy match
+
+
+class FuzzyIndex:
+    """An approximate-match index of entity dictionaries (e.g., Wookieepedia planets or people)
+    keyed on the value of < field >. Names are normalized (see < normalize_name >) so that
+    "Padmé Amidala", "padme amidala" and "Padme  Amidala" are equal, and names that are merely
+    similar (e.g., "Cara Dune" and "Carasynthia Dune") are matched by the similarity of their
+    character n-grams.
+
+    The index maps each normalized name to its entity for exact lookups and each n-gram to the
+    entities whose name contains it. Similarity is the Dice coefficient of the n-gram sets. A
+    lookup only scores candidates that share one of the rarest n-grams of the name looked up:
+    an entity that reaches the < threshold > must share at least a minimum number of n-grams,
+    so it cannot miss all of the (len(n-grams) - minimum + 1) rarest ones. Common n-grams
+    (e.g., "  p" in "Planet ...") therefore do not cause every entity to be scored.
+
+    Parameters:
+        entities (iterable): entity dictionaries
+        field (str): name of the key whose value is indexed
+        threshold (float): minimum similarity (0.0 - 1.0) of a match
+        n (int): n-gram length
+    """
+
+    def __init__(self, entities, field="name", threshold=FUZZY_THRESHOLD, n=3):
+        self.field = field
+        self.threshold = threshold
+        self.n = n
+        self._entities = list(entities)
+        self._exact = {}
+        self._grams = {}
+        self._postings = {}
+
+        for i, entity in enumerate(self._entities):
+            value = entity.get(field)
+            if value is None:
+                continue
+            name = normalize_name(value)
+            self._exact.setdefault(name, i)
+            grams = _ngrams(name, n)
+            self._grams[i] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+
+    def __iter__(self):
+        return iter(self._entities)
+
+    def __len__(self):
+        return len(self._entities)
+
+    def get(self, value, default=None):
+        """Returns the entity whose normalized < field > value equals the normalized < value >
+        or, failing that, the most similar entity whose similarity reaches the threshold. Ties
+        are resolved in favor of the entity that appears first. Returns < default > if no
+        entity matches.
+
+        Parameters:
+            value (str): name to look up
+            default (any): value returned if no entity matches
+
+        Returns:
+            dict|any: matching entity dictionary or < default >
+        """
+
+        if value is None:
+            return default
+        i = self._exact.get(normalize_name(value))
+        if i is not None:
+            return self._entities[i]
+        matches = self.matches(value, limit=1)
+        return matches[0][1] if matches else default
+
+    def matches(self, value, limit=5, threshold=None):
+        """Returns up to < limit > (similarity, entity) pairs for the entities whose similarity
+        to < value > reaches < threshold >, most similar first.
+
+        Parameters:
+            value (str): name to look up
+            limit (int): maximum number of matches returned
+            threshold (float): minimum similarity; defaults to the index's threshold
+
+        Returns:
+            list: (float, dict) tuples
+        """
+
+        threshold = self.threshold if threshold is None else threshold
+        grams = _ngrams(normalize_name(value), self.n)
+        if not grams:
+            return []
+
+        # Dice >= threshold requires 2 * shared >= threshold * (len(grams) + size) and size >=
+        # shared, so entities sharing fewer n-grams than < minimum > cannot match
+        minimum = max(1, math.ceil(threshold * len(grams) / (2 - threshold) - 1e-9))
+        rarest = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        candidates = set()
+        for gram in rarest[: len(grams) - minimum + 1]:
+            candidates.update(self._postings.get(gram, ()))
+
+        scored = []
+        for i in candidates:
+            entity_grams = self._grams[i]
+            score = 2 * len(grams & entity_grams) / (len(grams) + len(entity_grams))
+            if score >= threshold:
+                scored.append((-score, i))
+        scored.sort()
+        return [(-score, self._entities[i]) for score, i in scored[:limit]]
+
+
+def _ngrams(name, n):
+    """Returns the set of character n-grams of each word of the normalized < name >. Words are
+    padded so that n-grams at the start and end of a word are distinguished.
+    """
+
+    grams = set()
+    for word in name.split():
+        padded = f"{' ' * (n - 1)}{word} "
+        grams.update(padded[i : i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+def normalize_name(value):
+    """Returns a normalized form of the passed in name used for matching: accents are removed
+    (e.g., "é" becomes "e"), case is folded, punctuation is replaced by spaces, and runs of
+    whitespace are collapsed (e.g., "Padmé  Amidala" and "IG-11" become "padme amidala" and
+    "ig 11").
+
+    Parameters:
+        value (str): name to normalize
+
+    Returns:
+        str: normalized name
+    """
+
+    text = unicodedata.normalize("NFKD", str(value))
+    text = "".join(char for char in text if not unicodedata.combining(char)).casefold()
+    return " ".join("".join(char if char.isalnum() else " " for char in text).split())
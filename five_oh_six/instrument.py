@@ -0,0 +1,306 @@
+import atexit
+import functools
+import os
+import random
+import sys
+import threading
+import time
+
+from .files import write_json
+
+# Instrumentation (see enable_instrumentation()); disabled unless enabled explicitly or by setting
+# the FIVE_OH_SIX_INSTRUMENT environment variable to a report file path
+INSTRUMENTATION = {"enabled": False, "records": {}, "originals": [], "report_filepath": None}
+INSTRUMENTED_FUNCTIONS = (
+    "convert_none_values",
+    "convert_to_float",
+    "convert_to_int",
+    "convert_to_list",
+    "convert_to_none",
+    "get_resource",
+    "read_csv_to_dicts",
+    "read_json",
+    "to_float",
+    "to_gravity_value",
+    "to_int",
+    "to_list",
+    "to_none",
+    "to_year_era",
+    "write_json",
+)
+LATENCY_SAMPLE_SIZE = 10000
+
+# Guards the instrumentation records, which are updated by every thread that calls an instrumented
+# function (e.g., SwapiCache prefetches and fetch_many)
+INSTRUMENTATION_LOCK = threading.Lock()
+
+
+class _Timer:
+    """Context manager returned by < timed >. Records the elapsed time of the block under
+    < name > if instrumentation is enabled when the block is entered.
+    """
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if INSTRUMENTATION["enabled"]:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.start is not None:
+            _record_call(self.name, time.perf_counter() - self.start)
+
+
+def _instrument(func, name):
+    """Returns a wrapper that records the call count, latency, and (for readers and writers)
+    file bytes of each call to < func > under < name >.
+    """
+
+    reads = name in ("read_csv_to_dicts", "read_json")
+    writes = name == "write_json"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record_call(name, time.perf_counter() - start)
+            if reads or writes:
+                try:
+                    size = os.path.getsize(args[0] if args else kwargs["filepath"])
+                except (KeyError, OSError):
+                    size = 0
+                with INSTRUMENTATION_LOCK:
+                    record = _instrumentation_record(name)
+                    record["bytes_read" if reads else "bytes_written"] += size
+
+    return wrapper
+
+
+def _instrumentation_record(name):
+    """Returns the mutable record of counters kept for < name >, creating it on first use. The
+    caller must hold < INSTRUMENTATION_LOCK >.
+    """
+
+    record = INSTRUMENTATION["records"].get(name)
+    if record is None:
+        record = INSTRUMENTATION["records"][name] = {
+            "calls": 0,
+            "total_s": 0.0,
+            "max_s": 0.0,
+            "samples": [],
+            "bytes_read": 0,
+            "bytes_written": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+        }
+    return record
+
+
+def _percentile(samples, fraction):
+    """Returns the value at the passed in < fraction > (0.0 - 1.0) of the sorted < samples >."""
+
+    if not samples:
+        return None
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def _record_call(name, elapsed):
+    """Adds a call of < elapsed > seconds to the record kept for < name >. Latency samples are
+    kept in a fixed-size reservoir so that hot functions do not grow memory without bound.
+    """
+
+    with INSTRUMENTATION_LOCK:
+        record = _instrumentation_record(name)
+        record["calls"] += 1
+        record["total_s"] += elapsed
+        if elapsed > record["max_s"]:
+            record["max_s"] = elapsed
+
+        samples = record["samples"]
+        if len(samples) < LATENCY_SAMPLE_SIZE:
+            samples.append(elapsed)
+        else:
+            index = random.randrange(record["calls"])
+            if index < LATENCY_SAMPLE_SIZE:
+                samples[index] = elapsed
+
+
+def _write_instrumentation_report_at_exit():
+    """Writes the instrumentation report to the configured report file (registered with
+    < atexit > by < enable_instrumentation >).
+    """
+
+    if INSTRUMENTATION["report_filepath"]:
+        write_instrumentation_report(INSTRUMENTATION["report_filepath"])
+
+
+def disable_instrumentation():
+    """Restores the uninstrumented functions replaced by < enable_instrumentation >. Recorded
+    counters are retained until < reset_instrumentation > is called.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    for namespace, name, func in INSTRUMENTATION["originals"]:
+        namespace[name] = func
+    INSTRUMENTATION["originals"].clear()
+    INSTRUMENTATION["enabled"] = False
+
+
+def enable_instrumentation(report_filepath=None, targets=()):
+    """Starts recording call counts, latencies, file bytes read/written, and cache hit ratios.
+
+    The functions listed in < INSTRUMENTED_FUNCTIONS > (and any < targets >) are replaced by
+    instrumented wrappers while instrumentation is enabled, both on the package and in every
+    package module that references them. Callers reference them as attributes (e.g.,
+    < utl.read_json >), so the wrappers are picked up without changes and cost nothing once
+    < disable_instrumentation > restores the originals.
+
+    If a < report_filepath > is provided the report returned by < instrumentation_report > is
+    written to that file as JSON when the process exits.
+
+    Parameters:
+        report_filepath (str): optional path of the JSON report written at process exit
+        targets (iterable): optional (module, function names) pairs to instrument as well
+                            (e.g., [(last_assignment, ["get_swapi_resource"])])
+
+    Returns:
+        None
+    """
+
+    if not INSTRUMENTATION["enabled"]:
+        package = __name__.rpartition(".")[0]
+        namespaces = [
+            vars(module)
+            for name, module in list(sys.modules.items())
+            if module is not None and (name == package or name.startswith(f"{package}."))
+        ]
+        functions = [(name, vars(sys.modules[package])[name]) for name in INSTRUMENTED_FUNCTIONS]
+        for module, names in targets:
+            namespaces.append(vars(module))
+            functions.extend((name, vars(module)[name]) for name in names)
+
+        for name, func in functions:
+            wrapper = _instrument(func, name)
+            for namespace in namespaces:
+                if namespace.get(name) is func:
+                    INSTRUMENTATION["originals"].append((namespace, name, func))
+                    namespace[name] = wrapper
+        INSTRUMENTATION["enabled"] = True
+
+    if report_filepath:
+        if INSTRUMENTATION["report_filepath"] is None:
+            atexit.register(_write_instrumentation_report_at_exit)
+        INSTRUMENTATION["report_filepath"] = report_filepath
+
+
+def instrumentation_report():
+    """Returns a summary of the recorded instrumentation keyed by function (or < timed > block)
+    name. Each entry includes the call count, cumulative/mean/max latency, p50/p90/p99 latency
+    (estimated from a sample of up to < LATENCY_SAMPLE_SIZE > calls), bytes read/written, and
+    cache hits/misses with the hit ratio.
+
+    Parameters:
+        None
+
+    Returns:
+        dict: per-name instrumentation summary
+    """
+
+    with INSTRUMENTATION_LOCK:
+        records = {
+            name: {**record, "samples": sorted(record["samples"])}
+            for name, record in INSTRUMENTATION["records"].items()
+        }
+
+    report = {}
+    for name, record in sorted(records.items()):
+        samples = record["samples"]
+        lookups = record["cache_hits"] + record["cache_misses"]
+        report[name] = {
+            "calls": record["calls"],
+            "total_s": record["total_s"],
+            "mean_s": record["total_s"] / record["calls"] if record["calls"] else None,
+            "p50_s": _percentile(samples, 0.50),
+            "p90_s": _percentile(samples, 0.90),
+            "p99_s": _percentile(samples, 0.99),
+            "max_s": record["max_s"],
+            "bytes_read": record["bytes_read"],
+            "bytes_written": record["bytes_written"],
+            "cache_hits": record["cache_hits"],
+            "cache_misses": record["cache_misses"],
+            "cache_hit_ratio": record["cache_hits"] / lookups if lookups else None,
+        }
+    return report
+
+
+def record_cache_access(name, hit):
+    """Counts a cache hit or miss under < name > if instrumentation is enabled.
+
+    Parameters:
+        name (str): name of the caching function (e.g., "get_swapi_resource")
+        hit (bool): True if the resource was found in the cache
+
+    Returns:
+        None
+    """
+
+    if INSTRUMENTATION["enabled"]:
+        with INSTRUMENTATION_LOCK:
+            _instrumentation_record(name)["cache_hits" if hit else "cache_misses"] += 1
+
+
+def reset_instrumentation():
+    """Discards all recorded instrumentation counters.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    with INSTRUMENTATION_LOCK:
+        INSTRUMENTATION["records"].clear()
+
+
+def timed(name):
+    """Returns a context manager that records the elapsed time of its block under < name > if
+    instrumentation is enabled; otherwise the block runs untimed.
+
+    Usage:
+        with utl.timed("group_articles"):
+            ...
+
+    Parameters:
+        name (str): name under which the block is reported
+
+    Returns:
+        _Timer: context manager
+    """
+
+    return _Timer(name)
+
+
+def write_instrumentation_report(filepath):
+    """Writes the summary returned by < instrumentation_report > to < filepath > as JSON.
+
+    Parameters:
+        filepath (str): the path to the file
+
+    Returns:
+        None
+    """
+
+    write_json(filepath, instrumentation_report())
@@ -0,0 +1,60 @@
+import threading
+
+from collections.abc import Mapping
+
+
+class LazyResource(Mapping):
+    """A read-only, dictionary-like reference to a linked SWAPI resource (e.g., a person's
+    "homeworld" or "species") that is retrieved and transformed only when one of its values is
+    first accessed. The < loader > is called once with the < url > (even if several threads
+    access the reference at the same time) and its return value is retained for later access.
+
+    When written to a file by < write_json > the reference is encoded either as the resolved
+    dictionary or, if < resolve_references=False > is passed, as the unresolved < url >.
+
+    Parameters:
+        url (str): the resource's URL (or other reference passed to the loader)
+        loader (callable): accepts the < url > and returns the resource dictionary
+    """
+
+    __slots__ = ("url", "_loader", "_value", "_lock")
+
+    def __init__(self, url, loader):
+        self.url = url
+        self._loader = loader
+        self._value = None
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        return (self.resolve() or {})[key]
+
+    def __iter__(self):
+        return iter(self.resolve() or {})
+
+    def __len__(self):
+        return len(self.resolve() or {})
+
+    def __repr__(self):
+        if self.resolved:
+            return repr(self._value)
+        return f"LazyResource({self.url!r})"
+
+    @property
+    def resolved(self):
+        """bool: True if the loader has been called."""
+
+        return self._loader is None
+
+    def resolve(self):
+        """Calls the loader on first use and returns the resource dictionary.
+
+        Returns:
+            dict|None: the resolved resource
+        """
+
+        if self._loader is not None:
+            with self._lock:
+                if self._loader is not None:  # another thread may have resolved the reference
+                    self._value = self._loader(self.url)
+                    self._loader = None
+        return self._value
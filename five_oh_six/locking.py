@@ -0,0 +1,93 @@
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """An exclusive, advisory lock on a lock file that is shared by every process (and thread)
+    that opens the same path. Locks are released automatically by the operating system if the
+    holding process exits.
+
+    Usage:
+        with FileLock("CACHE.json.lock"):
+            ...
+
+    Parameters:
+        filepath (str): path to the lock file (created if it does not exist)
+        timeout (float): optional seconds to wait before raising < TimeoutError >
+        poll_interval (float): seconds between attempts when a < timeout > is set
+    """
+
+    def __init__(self, filepath, timeout=None, poll_interval=0.05):
+        self.filepath = filepath
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def acquire(self):
+        """Blocks until the lock is held (or the < timeout > elapses).
+
+        Returns:
+            None
+        """
+
+        fd = os.open(self.filepath, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        try:
+            while not _try_lock(fd, blocking=deadline is None):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for lock {self.filepath}")
+                time.sleep(self.poll_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self):
+        """Releases the lock if it is held.
+
+        Returns:
+            None
+        """
+
+        if self._fd is not None:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            os.close(self._fd)
+            self._fd = None
+
+
+def _try_lock(fd, blocking):
+    """Attempts to lock the open file < fd >; returns True if the lock is now held."""
+
+    if fcntl:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            time.sleep(0.05)
@@ -0,0 +1,189 @@
+import queue
+import threading
+
+from .files import write_json_array
+from .records import iter_hash_join
+
+# Items held by a buffer() stage by default
+PIPELINE_BUFFER_SIZE = 64
+
+
+class Pipeline:
+    """A chain of generator stages that streams records (e.g., Wookieepedia planets) from a
+    reader to a writer one at a time instead of materializing a full list between stages.
+    Each stage method returns a new < Pipeline > wrapping the stages so far; nothing is read
+    until the pipeline is iterated or written, and then each record passes through every stage
+    before the next record is read, so memory use is bounded by the records in flight rather
+    than by the size of the dataset.
+
+    Usage:
+        count = (
+            utl.Pipeline(utl.iter_csv_to_dicts("data-wookieepedia_planets.csv"))
+            .map(utl.convert_none_values, NONE_VALUES)
+            .join(swapi_planets, "name")
+            .map(transform_planet, keys, NONE_VALUES)
+            .write_json("stu-planets.json")
+        )
+
+    Stages that must see every record (e.g., sorting) cannot stream; collect the records with
+    < to_list > (or pass the pipeline to < EntityCollection >) at that point.
+
+    Parameters:
+        source (iterable): records to stream (e.g., < iter_csv_to_dicts > or < iter_json_array >)
+    """
+
+    def __init__(self, source):
+        self._source = source
+
+    def __iter__(self):
+        return iter(self._source)
+
+    def buffer(self, size=PIPELINE_BUFFER_SIZE):
+        """Returns a pipeline that runs the stages so far in a background thread, which keeps
+        up to < size > records ready ahead of the stages that follow. Reading and parsing the
+        source (or a stage that waits on the network, such as a SWAPI lookup) then overlaps the
+        work of the later stages. An exception raised by an earlier stage is raised again by
+        the stage that follows the buffer.
+
+        Parameters:
+            size (int): maximum number of records held
+
+        Returns:
+            Pipeline: buffered pipeline
+        """
+
+        return Pipeline(_buffered(self._source, size))
+
+    def filter(self, predicate):
+        """Returns a pipeline that keeps only the records for which < predicate > returns a
+        truthy value (e.g., < has_viewer_data >).
+
+        Parameters:
+            predicate (callable): accepts a record and returns True to keep it
+
+        Returns:
+            Pipeline: filtered pipeline
+        """
+
+        return Pipeline(record for record in self._source if predicate(record))
+
+    def join(self, right, key, right_key=None, how="left", precedence="right", result=None):
+        """Returns a pipeline that enriches each record with the fields of the matching
+        < right > row (see < iter_hash_join >). The < right > rows are indexed in memory; the
+        records of the pipeline are streamed.
+
+        Parameters:
+            right (iterable): dictionaries providing the additional fields
+            key (str): name of the key of the records to join on
+            right_key (str): name of the key of the right rows; defaults to < key >
+            how (str): "left" keeps unmatched records; "inner" drops them
+            precedence (str|dict): "left", "right", or field names mapped to "left" or "right"
+            result (JoinResult): optional report of unmatched rows and conflicts
+
+        Returns:
+            Pipeline: joined pipeline
+        """
+
+        return Pipeline(
+            iter_hash_join(self._source, right, key, right_key, how, precedence, result)
+        )
+
+    def lookup(self, mapping, key, field, default=None):
+        """Returns a pipeline that adds to (a copy of) each record the value < mapping > holds
+        for the record's < key > value under the name < field >, e.g., the planet dictionary
+        of a person's homeworld from a dictionary of planets keyed by URL, or the match found
+        by a < FuzzyIndex >.
+
+        Parameters:
+            mapping (dict|FuzzyIndex): object whose < get(value, default) > returns the value
+            key (str): name of the record key whose value is looked up
+            field (str): name of the key added to the record
+            default (any): value added if the lookup fails
+
+        Returns:
+            Pipeline: pipeline of enriched records
+        """
+
+        return Pipeline(
+            {**record, field: mapping.get(record.get(key), default)} for record in self._source
+        )
+
+    def map(self, func, *args, **kwargs):
+        """Returns a pipeline that replaces each record with < func(record, *args, **kwargs) >,
+        e.g., < map(transform_planet, keys, NONE_VALUES) > or
+        < map(utl.convert_none_values, NONE_VALUES) >.
+
+        Parameters:
+            func (callable): accepts a record (and the remaining arguments)
+            args (tuple): additional positional arguments passed to < func >
+            kwargs (dict): additional keyword arguments passed to < func >
+
+        Returns:
+            Pipeline: mapped pipeline
+        """
+
+        return Pipeline(func(record, *args, **kwargs) for record in self._source)
+
+    def to_list(self):
+        """Runs the pipeline and returns the records as a list.
+
+        Returns:
+            list: records
+        """
+
+        return list(self._source)
+
+    def write_json(self, filepath, **kwargs):
+        """Runs the pipeline and writes the records to < filepath > as a JSON array one record
+        at a time (see < write_json_array >).
+
+        Parameters:
+            filepath (str): the path to the file
+            kwargs (dict): optional keyword arguments passed to < write_json_array >
+
+        Returns:
+            int: number of records written
+        """
+
+        return write_json_array(filepath, self._source, **kwargs)
+
+
+def _buffered(source, size):
+    """Yields the items of < source > iterated by a background thread through a queue of at
+    most < size > items. Closing the generator stops the thread.
+    """
+
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in source:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as exc:
+            put((done, exc))
+
+    thread = threading.Thread(target=produce, name="pipeline-buffer", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exc = items.get()
+            if item is done:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,509 @@
+import bisect
+import weakref
+
+
+class _Descending:
+    """Wraps a sort key value and inverts its ordering so that descending and ascending fields
+    can be combined in a single key tuple (strings cannot be negated like numbers).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+class EntityCollection:
+    """A list-like collection of entity dictionaries (e.g., planets, people, starships) that
+    serves reusable sorted views. The sort key component of each field is computed once per
+    entity and cached per (field, direction, None placement) so that repeated, differently
+    ordered exports of the same entities do not rebuild their keys. Views created by
+    < sorted_view > remain ordered as new entities are added with < append > or < extend >.
+
+    The collection holds only weak references to its views: a view that is no longer referenced
+    elsewhere is discarded and is no longer updated by < append >.
+
+    Parameters:
+        entities (iterable): entity dictionaries
+    """
+
+    def __init__(self, entities=()):
+        self._entities = list(entities)
+        self._columns = {}
+        self._views = weakref.WeakSet()
+
+    def __getitem__(self, index):
+        return self._entities[index]
+
+    def __iter__(self):
+        return iter(self._entities)
+
+    def __len__(self):
+        return len(self._entities)
+
+    def append(self, entity):
+        """Adds an < entity > to the collection, extends the cached key columns, and inserts
+        the entity into each existing sorted view at its ordered position.
+
+        Parameters:
+            entity (dict): entity to add
+
+        Returns:
+            None
+        """
+
+        seq = len(self._entities)
+        self._entities.append(entity)
+        for (field, descending, nones), column in self._columns.items():
+            column.append(_sort_component(entity.get(field), descending, nones))
+        for view in self._views:
+            view._insert(self._key(view.order, seq), seq, entity)
+
+    def extend(self, entities):
+        """Adds each of the passed in < entities > to the collection by calling < append >.
+
+        Parameters:
+            entities (iterable): entities to add
+
+        Returns:
+            None
+        """
+
+        for entity in entities:
+            self.append(entity)
+
+    def sorted_view(self, *order):
+        """Returns a < SortedView > of the collection ordered by one or more fields. Each
+        < order > item is either a field name (ascending, None values last) or a tuple of
+        (field, descending) or (field, descending, nones) where < nones > is either "first"
+        or "last". Ties are resolved by the order in which entities were added.
+
+        Example:
+            planets.sorted_view(("diameter_km", True), "name")
+
+        Parameters:
+            order (str|tuple): one or more field specifications
+
+        Returns:
+            SortedView: ordered view that stays current (while referenced) as entities are added
+        """
+
+        order = tuple(_normalize_order_item(item) for item in order)
+        for item in order:
+            self._column(item)
+        view = SortedView(
+            order, [(self._key(order, seq), seq) for seq in range(len(self._entities))],
+            self._entities
+        )
+        self._views.add(view)
+        return view
+
+    def _column(self, item):
+        """Returns the cached list of sort key components for the < item > field specification,
+        building it on first use.
+        """
+
+        if item not in self._columns:
+            field, descending, nones = item
+            self._columns[item] = [
+                _sort_component(entity.get(field), descending, nones) for entity in self._entities
+            ]
+        return self._columns[item]
+
+    def _key(self, order, seq):
+        """Returns the composite sort key of the entity at position < seq >."""
+
+        return tuple(self._columns[item][seq] for item in order)
+
+
+class EntityQuery:
+    """Answers equality and range queries on the numeric fields (e.g., "diameter_km",
+    "population", "length_m") of a collection of entity dictionaries. A sorted index of a field's
+    numeric values is built the first time the field is queried and reused by every later query
+    on that field. Entities whose field value is missing, non-numeric, or NaN are not indexed.
+
+    The index is a snapshot of the < entities > passed in; entities added to the source list
+    afterwards are not visible to the query.
+
+    Parameters:
+        entities (iterable): entity dictionaries
+    """
+
+    def __init__(self, entities):
+        self._entities = list(entities)
+        self._indexes = {}
+
+    def between(self, field, low, high):
+        """Returns the entities whose < field > value is >= < low > and <= < high > ordered by
+        the field value (ascending).
+
+        Parameters:
+            field (str): numeric field name
+            low (int|float): lower bound (inclusive)
+            high (int|float): upper bound (inclusive)
+
+        Returns:
+            list: matching entity dictionaries
+        """
+
+        return self.range(field, low, high)
+
+    def eq(self, field, value):
+        """Returns the entities whose < field > value equals the passed in < value > in their
+        original collection order.
+
+        Parameters:
+            field (str): numeric field name
+            value (int|float): value to match
+
+        Returns:
+            list: matching entity dictionaries
+        """
+
+        if not _is_number(value):
+            return []  # only numeric values are indexed
+
+        values, positions = self._index(field)
+        start = bisect.bisect_left(values, value)
+        stop = bisect.bisect_right(values, value, start)
+        return [self._entities[pos] for pos in sorted(positions[start:stop])]
+
+    def first(self, field, value):
+        """Returns the first entity (in collection order) whose < field > value equals the passed
+        in < value >; otherwise < None >. Equivalent to < get_nested_dict > for numeric fields.
+
+        Parameters:
+            field (str): numeric field name
+            value (int|float): value to match
+
+        Returns:
+            dict|None: matching entity dictionary or None
+        """
+
+        matches = self.eq(field, value)
+        return matches[0] if matches else None
+
+    def ordered(self, field, descending=False):
+        """Yields the indexed entities ordered by their < field > value. Entities that share a
+        value are yielded in collection order.
+
+        Parameters:
+            field (str): numeric field name
+            descending (bool): if True yield the largest values first
+
+        Yields:
+            dict: entity dictionary
+        """
+
+        values, positions = self._index(field)
+        if descending:
+            stop = len(values)
+            while stop:
+                start = bisect.bisect_left(values, values[stop - 1], 0, stop)
+                for pos in positions[start:stop]:
+                    yield self._entities[pos]
+                stop = start
+        else:
+            for pos in positions:
+                yield self._entities[pos]
+
+    def range(self, field, low=None, high=None, include_low=True, include_high=True):
+        """Returns the entities whose < field > value falls between < low > and < high > ordered
+        by the field value (ascending). Either bound may be omitted (e.g., population > 1e9 is
+        < range("population", 1e9, include_low=False) >). As with < eq >, a bound that is not a
+        number (e.g., a string or NaN) matches no entities.
+
+        Parameters:
+            field (str): numeric field name
+            low (int|float): optional lower bound
+            high (int|float): optional upper bound
+            include_low (bool): if True the lower bound is inclusive
+            include_high (bool): if True the upper bound is inclusive
+
+        Returns:
+            list: matching entity dictionaries
+        """
+
+        if not all(_is_number(bound) for bound in (low, high) if bound is not None):
+            return []  # only numeric values are indexed
+
+        values, positions = self._index(field)
+        start, stop = 0, len(values)
+        if low is not None:
+            start = (bisect.bisect_left if include_low else bisect.bisect_right)(values, low)
+        if high is not None:
+            stop = (bisect.bisect_right if include_high else bisect.bisect_left)(values, high)
+        return [self._entities[pos] for pos in positions[start:stop]]
+
+    def _index(self, field):
+        """Returns the (values, positions) index of the < field >, building it on first use.
+        Values are sorted ascending; positions map each value back to its entity.
+        """
+
+        if field not in self._indexes:
+            pairs = sorted(
+                (entity.get(field), pos)
+                for pos, entity in enumerate(self._entities)
+                if _is_number(entity.get(field))
+            )
+            self._indexes[field] = ([value for value, _ in pairs], [pos for _, pos in pairs])
+        return self._indexes[field]
+
+
+class JoinResult:
+    """The outcome of a < hash_join >: the joined rows, the rows of either dataset that found no
+    match, and the number of times each field's values conflicted in a matched pair of rows.
+
+    Attributes:
+        rows (list): merged dictionaries (plus unmatched left rows for a "left" join)
+        matched (int): number of left rows that matched a right row
+        unmatched_left (list): left rows whose key matched no right row
+        unmatched_right (list): right rows whose key matched no left row
+        duplicate_right (list): right rows ignored because an earlier right row has the same key
+        conflicts (dict): field names mapped to the number of matched pairs whose values differ
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.matched = 0
+        self.unmatched_left = []
+        self.unmatched_right = []
+        self.duplicate_right = []
+        self.conflicts = {}
+
+    def summary(self):
+        """Returns the counts of joined, unmatched, and duplicate rows and the field conflicts.
+
+        Returns:
+            dict: join report
+        """
+
+        return {
+            "rows": len(self.rows),
+            "matched": self.matched,
+            "unmatched_left": len(self.unmatched_left),
+            "unmatched_right": len(self.unmatched_right),
+            "duplicate_right": len(self.duplicate_right),
+            "conflicts": dict(self.conflicts),
+        }
+
+
+class SortedView:
+    """An ordered view over the entities of an < EntityCollection >. Created by calling
+    < EntityCollection.sorted_view >; entities added to the collection are inserted into the view
+    by binary search rather than re-sorting the view.
+
+    Parameters:
+        order (tuple): normalized (field, descending, nones) specifications
+        keys (list): (key tuple, sequence number) pairs for the existing entities
+        entities (list): the collection's entities indexed by sequence number
+    """
+
+    def __init__(self, order, keys, entities):
+        self.order = order
+        keys.sort()
+        self._keys = keys
+        self._items = [entities[seq] for _, seq in keys]
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def to_list(self):
+        """Returns a new list of the view's entities in order.
+
+        Returns:
+            list: ordered entity dictionaries
+        """
+
+        return list(self._items)
+
+    def _insert(self, key, seq, entity):
+        """Inserts an < entity > at the position identified by its sort < key >."""
+
+        index = bisect.bisect_right(self._keys, (key, seq))
+        self._keys.insert(index, (key, seq))
+        self._items.insert(index, entity)
+
+
+def _is_number(value):
+    """Returns True if < value > is an int or float (excluding bool and NaN)."""
+
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+
+def _join_rows(left, right, key, right_key, how, prefer_left, left_fields, result):
+    """Yields the rows joined by < iter_hash_join > (whose arguments have been validated)."""
+
+    index = {}
+    for row in right:
+        value = row.get(right_key)
+        if value is None:
+            result.unmatched_right.append(row)
+        elif value in index:
+            result.duplicate_right.append(row)
+        else:
+            index[value] = row
+
+    matched_keys = set()
+    conflicts = result.conflicts
+    for row in left:
+        value = row.get(key)
+        match = index.get(value) if value is not None else None
+        if match is None:
+            result.unmatched_left.append(row)
+            if how == "left":
+                yield dict(row)
+            continue
+
+        matched_keys.add(value)
+        for field, right_value in match.items():
+            if field in row and row[field] != right_value:
+                conflicts[field] = conflicts.get(field, 0) + 1
+        merged = {**row, **match}  # field order of < row.update(match) >
+        if prefer_left:
+            merged.update(row)
+        elif left_fields:
+            for field in left_fields:
+                if field in row:
+                    merged[field] = row[field]
+        result.matched += 1
+        yield merged
+
+    result.unmatched_right.extend(
+        row for value, row in index.items() if value not in matched_keys
+    )
+
+
+def _normalize_order_item(item):
+    """Returns a (field, descending, nones) tuple for a < sorted_view > order item."""
+
+    if isinstance(item, str):
+        return (item, False, "last")
+    field, descending, *nones = item
+    nones = nones[0] if nones else "last"
+    if nones not in ("first", "last"):
+        raise ValueError(f"nones must be 'first' or 'last', not {nones!r}")
+    return (field, bool(descending), nones)
+
+
+def _sort_component(value, descending, nones):
+    """Returns the sort key component of a single field < value >. None values are placed
+    before or after every other value irrespective of sort direction.
+    """
+
+    if value is None:
+        return (-1 if nones == "first" else 1, 0)
+    return (0, _Descending(value) if descending else value)
+
+
+def get_nested_dict(data, key, filter):
+    """Attempts to retrieve a nested dictionary in < data > using the passed in < filter >
+    value. The passed in < key > name is used to identify the key-value pair to evaluate.
+    The value mapped to the < key > is compared to the passed in < filter > value. The comparison
+    made is case sensitive. Any object type can serve as the < filter >. If a case sensitive
+    exact match is obtained (i.e., test for equality) the nested dictionary is returned to the
+    caller; otherwise < None > is returned.
+
+    Parameters:
+        data (list): List of nested dictionaries
+        key (str): key that identifies the value that the < filter > must match
+        filter (any): object provided for the equality test.
+
+    Returns
+        dict|None: nested data dictionary if case sensitive match on the < filter > is
+                   obtained; otherwise < None > is returned
+    """
+
+    for item in data:
+        if item[key] == filter:
+            return item
+
+    return None
+
+
+def hash_join(left, right, key, right_key=None, how="left", precedence="right"):
+    """Joins two datasets of dictionaries (e.g., SWAPI people and Wookieepedia people) on the
+    value of < key > in a single pass over each. The < right > rows are first indexed by their
+    key value in a dictionary; each < left > row then looks up its match in constant time.
+    This replaces calling < get_nested_dict > once per left row, which scans < right > each
+    time. As with < get_nested_dict > keys are compared case sensitively and the first right
+    row with a given key value is used.
+
+    Each matched pair is merged into a new dictionary (the input rows are not modified). Fields
+    present in both rows take the value of the row named by < precedence >: "right" (the
+    default) matches < left_row.update(right_row) >; "left" keeps the left value. < precedence >
+    may also be a dictionary that maps field names to "left" or "right"; unlisted fields take
+    the right value. Fields whose values differ are counted in < JoinResult.conflicts >.
+
+    Rows missing the key are treated as unmatched.
+
+    Parameters:
+        left (iterable): dictionaries to enrich
+        right (iterable): dictionaries providing the additional fields
+        key (str): name of the key of the left rows to join on
+        right_key (str): name of the key of the right rows; defaults to < key >
+        how (str): "left" keeps unmatched left rows (unchanged copies); "inner" drops them
+        precedence (str|dict): "left", "right", or field names mapped to "left" or "right"
+
+    Returns:
+        JoinResult: joined rows and unmatched row reports
+    """
+
+    result = JoinResult()
+    result.rows.extend(iter_hash_join(left, right, key, right_key, how, precedence, result))
+    return result
+
+
+def iter_hash_join(left, right, key, right_key=None, how="left", precedence="right", result=None):
+    """Generator version of < hash_join > that yields the joined rows one at a time as the
+    < left > rows are consumed, so that a stream of rows (see < Pipeline.join >) can be joined
+    without holding it in memory. Only < right > is held in memory (indexed by key value).
+
+    If a < JoinResult > is passed its unmatched, duplicate, and conflict reports (but not its
+    rows) are filled in as rows are joined; < unmatched_right > is complete once the generator
+    is exhausted.
+
+    Parameters:
+        left (iterable): dictionaries to enrich
+        right (iterable): dictionaries providing the additional fields
+        key (str): name of the key of the left rows to join on
+        right_key (str): name of the key of the right rows; defaults to < key >
+        how (str): "left" keeps unmatched left rows (unchanged copies); "inner" drops them
+        precedence (str|dict): "left", "right", or field names mapped to "left" or "right"
+        result (JoinResult): optional report of unmatched rows and conflicts
+
+    Returns:
+        generator: joined rows
+    """
+
+    if how not in ("left", "inner"):
+        raise ValueError(f"how must be 'left' or 'inner', not {how!r}")
+    if right_key is None:
+        right_key = key
+    if isinstance(precedence, str):
+        if precedence not in ("left", "right"):
+            raise ValueError(f"precedence must be 'left' or 'right', not {precedence!r}")
+        left_fields = None
+        prefer_left = precedence == "left"
+    else:
+        invalid = [side for side in precedence.values() if side not in ("left", "right")]
+        if invalid:
+            raise ValueError(f"precedence sides must be 'left' or 'right', not {invalid[0]!r}")
+        left_fields = {field for field, side in precedence.items() if side == "left"}
+        prefer_left = False
+    if result is None:
+        result = JoinResult()
+
+    return _join_rows(left, right, key, right_key, how, prefer_left, left_fields, result)
@@ -0,0 +1,147 @@
+import json
+import re
+
+# JSON backends supported by dumps() and loads() in order of preference (see set_json_backend())
+JSON_BACKENDS = ("orjson", "stdlib")
+
+# Backend used by dumps() and loads(); chosen on first use unless set by set_json_backend() or
+# the FIVE_OH_SIX_JSON environment variable
+JSON_SETTINGS = {"backend": None, "module": None}
+
+# Strings and the float forms orjson writes differently than the json module (e.g., 1e16 and
+# 0.00001 rather than 1e+16 and 1e-05); documents without an exponent (EXPONENT_PATTERN) or
+# "0.0000" contain none of those floats. The lookbehind makes the search skip ahead to each "e".
+EXPONENT_PATTERN = re.compile(rb"e(?<=\de)-?\d")
+FLOAT_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"|(?<![\d.])(-?\d+(?:\.\d+)?e-?\d+|-?0\.0000\d+)')
+
+
+def _format_float(match):
+    """Returns a float matched by < FLOAT_PATTERN > as formatted by the json module (strings are
+    returned unchanged)."""
+
+    if match.group(1) is None:
+        return match.group(0)
+    return repr(float(match.group(1))).encode("ascii")
+
+
+def _backend():
+    """Returns the (name, module) of the current backend, choosing one on first use."""
+
+    if JSON_SETTINGS["backend"] is None:
+        set_json_backend("auto")
+    return JSON_SETTINGS["backend"], JSON_SETTINGS["module"]
+
+
+def dumps(data, ensure_ascii=False, indent=2, sort_keys=False, default=None):
+    """Serializes < data > as a UTF-8 encoded JSON document using the current backend (see
+    < set_json_backend >). The "orjson" backend encodes directly to bytes and supports an
+    < indent > of 2 or None only; other indents, < ensure_ascii=True >, and data orjson cannot
+    encode (e.g., integers wider than 64 bits) are encoded by the < json > module instead.
+
+    Floats orjson writes in a different form than the < json > module (e.g., 1e16 rather than
+    1e+16) are rewritten in the < json > module's form, so documents encoded with an < indent >
+    of 2 are the same with either backend. The backends still differ in two ways: orjson writes
+    NaN and Infinity as null (the < json > module writes the non-standard NaN and Infinity
+    tokens) and omits the spaces after "," and ":" when < indent > is None.
+
+    Parameters:
+        data (any): the data to be encoded as JSON
+        ensure_ascii (bool): if True non-ASCII characters are escaped
+        indent (int): number of "pretty printed" indention spaces or None for a compact document
+        sort_keys (bool): if True object keys are sorted
+        default (callable): returns a serializable version of objects that cannot be encoded
+
+    Returns:
+        bytes: encoded JSON document
+    """
+
+    name, module = _backend()
+    if name == "orjson" and not ensure_ascii and indent in (2, None):
+        option = module.OPT_NON_STR_KEYS
+        if indent:
+            option |= module.OPT_INDENT_2
+        if sort_keys:
+            option |= module.OPT_SORT_KEYS
+        try:
+            content = module.dumps(data, default=default, option=option)
+        except module.JSONEncodeError:
+            pass  # fall back to the json module
+        else:
+            if b"0.0000" in content or EXPONENT_PATTERN.search(content):
+                content = FLOAT_PATTERN.sub(_format_float, content)
+            return content
+
+    return json.dumps(
+        data, ensure_ascii=ensure_ascii, indent=indent, sort_keys=sort_keys, default=default
+    ).encode("utf-8")
+
+
+def get_json_backend():
+    """Returns the name of the backend used by < dumps > and < loads >.
+
+    Parameters:
+        None
+
+    Returns:
+        str: "orjson" or "stdlib"
+    """
+
+    return _backend()[0]
+
+
+def loads(data):
+    """Decodes a JSON document using the current backend (see < set_json_backend >). Bytes
+    (e.g., an HTTP response body) are decoded directly rather than first being copied to a
+    string. Documents the "orjson" backend rejects but the < json > module accepts (e.g., ones
+    containing NaN or integers wider than 64 bits) are decoded by the < json > module.
+
+    Parameters:
+        data (bytes|str): JSON document
+
+    Returns:
+        dict|list: decoded JSON document
+    """
+
+    name, module = _backend()
+    if name == "orjson":
+        try:
+            return module.loads(data)
+        except module.JSONDecodeError:
+            pass  # fall back to the json module (which raises if the document is invalid)
+
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def set_json_backend(backend="auto"):
+    """Sets the backend used by < dumps > and < loads > (and so by < read_json >,
+    < write_json >, and < get_resource >).
+
+    Backends:
+        orjson: the optional < orjson > package, which encodes and decodes several times faster
+        stdlib: the < json > module
+        auto: the first of < JSON_BACKENDS > that is installed (default)
+
+    Parameters:
+        backend (str): "orjson", "stdlib", or "auto"
+
+    Returns:
+        str: name of the backend set
+    """
+
+    if backend not in (*JSON_BACKENDS, "auto"):
+        raise ValueError(f"backend must be one of {(*JSON_BACKENDS, 'auto')}, not {backend!r}")
+
+    module = json
+    if backend != "stdlib":
+        try:
+            import orjson as module
+        except ImportError:
+            if backend == "orjson":
+                raise ImportError("the orjson backend requires the orjson package") from None
+        backend = "stdlib" if module is json else "orjson"
+
+    JSON_SETTINGS["backend"] = backend
+    JSON_SETTINGS["module"] = module
+    return backend
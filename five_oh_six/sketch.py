@@ -0,0 +1,316 @@
+import hashlib
+import heapq
+import math
+
+from array import array
+
+# Default sketch sizes (see HyperLogLog, CountMinSketch)
+HLL_PRECISION = 12  # 4096 registers: ~1.6% standard error
+CMS_WIDTH = 2048  # overestimate <= 0.13% of the total count ...
+CMS_DEPTH = 5  # ... with probability >= 99.3%
+
+
+class CountMinSketch:
+    """Estimates the count (or summed weight, e.g., fractional episode credits) of every item of
+    a stream in a fixed < depth > x < width > table of counters, however many distinct items
+    the stream holds. Each item increments one counter per row, chosen by a per-row hash; its
+    estimate is the smallest of those counters.
+
+    Error: an estimate is never below the true count and, with probability at least
+    1 - e^-depth, exceeds it by at most e / width times the < total > of all counts (e.g., with
+    the defaults at most 0.13% of the total with probability 99.3%). Negative counts are not
+    supported.
+
+    Parameters:
+        width (int): counters per row
+        depth (int): number of rows
+    """
+
+    def __init__(self, width=CMS_WIDTH, depth=CMS_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.total = 0.0
+        self._rows = [array("d", [0.0]) * width for _ in range(depth)]
+
+    @property
+    def error_bound(self):
+        """float: the overestimate that is exceeded with probability at most e^-depth."""
+
+        return math.e / self.width * self.total
+
+    def add(self, item, count=1.0):
+        """Adds < count > to the count of < item > and returns the new estimate.
+
+        Parameters:
+            item (str): item observed
+            count (float): non-negative amount added
+
+        Returns:
+            float: estimated count of < item >
+        """
+
+        self.total += count
+        estimate = math.inf
+        for row, index in zip(self._rows, self._indexes(item)):
+            value = row[index] = row[index] + count
+            if value < estimate:
+                estimate = value
+        return estimate
+
+    def estimate(self, item):
+        """Returns the estimated count of < item > (0.0 if it was never added).
+
+        Parameters:
+            item (str): item to look up
+
+        Returns:
+            float: estimated count
+        """
+
+        return min(row[index] for row, index in zip(self._rows, self._indexes(item)))
+
+    def _indexes(self, item):
+        """Returns the counter index of < item > in each row (double hashing)."""
+
+        value = _hash64(item)
+        first, second = value & 0xFFFFFFFF, (value >> 32) | 1
+        return [(first + i * second) % self.width for i in range(self.depth)]
+
+
+class HeavyHitters:
+    """Tracks the approximately most frequent items of a stream (e.g., the directors credited
+    with the most episodes) in bounded memory: counts are estimated by a < CountMinSketch > and
+    only the < capacity > items with the largest estimates are remembered as candidates.
+
+    Error: reported counts carry the < CountMinSketch > error. An item whose true count is
+    among the top < capacity > is missed only if items with smaller true counts are
+    overestimated above it, so keep < capacity > a few times larger than the number of items
+    reported by < top >.
+
+    Parameters:
+        capacity (int): maximum number of candidate items remembered
+        width (int): counters per row of the sketch
+        depth (int): rows of the sketch
+    """
+
+    def __init__(self, capacity=50, width=CMS_WIDTH, depth=CMS_DEPTH):
+        self.capacity = capacity
+        self.sketch = CountMinSketch(width, depth)
+        self._candidates = {}  # item -> (estimate, order of first appearance)
+        self._heap = []  # (estimate, order, item); entries superseded by a later estimate are stale
+        self._seen = 0
+
+    def add(self, item, count=1.0):
+        """Adds < count > to the count of < item > and updates the candidates.
+
+        Parameters:
+            item (str): item observed
+            count (float): non-negative amount added
+
+        Returns:
+            None
+        """
+
+        estimate = self.sketch.add(item, count)
+        candidate = self._candidates.get(item)
+        if candidate is not None:
+            order = candidate[1]
+        else:
+            self._seen += 1
+            order = self._seen
+            if len(self._candidates) >= self.capacity:
+                smallest = self._smallest()
+                if smallest[0] >= estimate:
+                    return
+                heapq.heappop(self._heap)
+                del self._candidates[smallest[2]]
+        self._candidates[item] = (estimate, order)
+        heapq.heappush(self._heap, (estimate, order, item))
+        if len(self._heap) > 4 * self.capacity:  # drop the stale entries
+            self._heap = [
+                (estimate, order, item) for item, (estimate, order) in self._candidates.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def top(self, n=None):
+        """Returns up to < n > (item, estimated count) pairs, largest first. Ties are ordered by
+        first appearance.
+
+        Parameters:
+            n (int): maximum number of items returned; defaults to every candidate
+
+        Returns:
+            list: (str, float) tuples
+        """
+
+        ranked = sorted(self._candidates.items(), key=lambda entry: (-entry[1][0], entry[1][1]))
+        return [(item, estimate) for item, (estimate, _) in ranked[:n]]
+
+    def _smallest(self):
+        """Returns the heap entry of the candidate with the smallest estimate, discarding the
+        stale entries above it.
+        """
+
+        while True:
+            estimate, order, item = self._heap[0]
+            if self._candidates.get(item) == (estimate, order):
+                return self._heap[0]
+            heapq.heappop(self._heap)
+
+
+class HyperLogLog:
+    """Estimates the number of distinct items of a stream (e.g., news desks or directors) in
+    2^precision bytes, however many distinct items the stream holds (Flajolet et al., 2007). An
+    item's 64-bit hash selects a register and the register keeps the longest run of leading
+    zero bits seen in the rest of the hash; the harmonic mean of the registers estimates the
+    count. Small counts use linear counting on the empty registers, which is nearly exact.
+
+    Error: the relative standard error is 1.04 / sqrt(2^precision) (see < error >), e.g., 1.6%
+    for the default precision of 12; about 95% of estimates fall within twice that.
+
+    Parameters:
+        precision (int): number of index bits (4 - 18)
+    """
+
+    def __init__(self, precision=HLL_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, not {precision!r}")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def __len__(self):
+        return self.count()
+
+    @property
+    def error(self):
+        """float: relative standard error of < count >."""
+
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, item):
+        """Adds < item > to the set of items counted.
+
+        Parameters:
+            item (str): item observed
+
+        Returns:
+            None
+        """
+
+        value = _hash64(item)
+        bits = 64 - self.precision
+        index = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self):
+        """Returns the estimated number of distinct items added.
+
+        Returns:
+            int: distinct count estimate
+        """
+
+        m = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / sum(2.0**-register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def merge(self, other):
+        """Adds the items counted by < other > (a < HyperLogLog > of the same precision), e.g.,
+        to combine the counts of several archive files.
+
+        Parameters:
+            other (HyperLogLog): sketch to merge
+
+        Returns:
+            None
+        """
+
+        if other.precision != self.precision:
+            raise ValueError("cannot merge HyperLogLog sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class StreamSummary:
+    """Counts the distinct items of a stream and their totals (e.g., episode credits per
+    director or articles per news desk) either exactly or, if < sketch > is True, with
+    bounded-memory sketches: a < HyperLogLog > for < distinct > and < HeavyHitters > for
+    < top >. Both modes expose the same methods so that callers can switch modes on the size of
+    the input.
+
+    The exact mode keeps every distinct item and its total. The sketch mode keeps a fixed
+    number of bytes whatever the input size; see < HyperLogLog > and < CountMinSketch > for the
+    error of its estimates.
+
+    Parameters:
+        top_k (int): number of items reported by < top >
+        sketch (bool): if True estimate with sketches instead of counting exactly
+        precision (int): < HyperLogLog > precision (sketch mode)
+        width (int): < CountMinSketch > width (sketch mode)
+        depth (int): < CountMinSketch > depth (sketch mode)
+    """
+
+    def __init__(
+        self, top_k=10, sketch=False, precision=HLL_PRECISION, width=CMS_WIDTH, depth=CMS_DEPTH
+    ):
+        self.top_k = top_k
+        self.sketch = sketch
+        self.counts = None if sketch else {}
+        self.distinct_sketch = HyperLogLog(precision) if sketch else None
+        self.heavy_hitters = HeavyHitters(max(4 * top_k, 50), width, depth) if sketch else None
+
+    def add(self, item, count=1):
+        """Adds < count > to the total of < item >.
+
+        Parameters:
+            item (str): item observed
+            count (float): non-negative amount added
+
+        Returns:
+            None
+        """
+
+        if self.sketch:
+            self.distinct_sketch.add(item)
+            self.heavy_hitters.add(item, count)
+        else:
+            self.counts[item] = self.counts.get(item, 0) + count
+
+    def distinct(self):
+        """Returns the (estimated, in sketch mode) number of distinct items.
+
+        Returns:
+            int: distinct item count
+        """
+
+        return self.distinct_sketch.count() if self.sketch else len(self.counts)
+
+    def top(self, n=None):
+        """Returns the < n > (default < top_k >) items with the largest (estimated, in sketch
+        mode) totals, largest first; ties are ordered by first appearance.
+
+        Parameters:
+            n (int): number of items returned
+
+        Returns:
+            dict: items mapped to totals in descending order
+        """
+
+        n = self.top_k if n is None else n
+        if self.sketch:
+            return dict(self.heavy_hitters.top(n))
+        ranked = sorted(self.counts.items(), key=lambda entry: -entry[1])
+        return dict(ranked[:n])
+
+
+def _hash64(item):
+    """Returns a 64-bit hash of < item > that is stable across processes and runs (unlike the
+    built-in < hash >, which is salted per process for strings).
+    """
+
+    digest = hashlib.blake2b(str(item).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
@@ -0,0 +1,558 @@
+import hashlib
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+from . import web
+from .cache import CACHE_FILEPATH, CacheStats, create_cache, create_cache_key
+from .files import infer_compression, write_json
+from .locking import FileLock
+
+# Constants
+LOCK_STRIPES = 64  # number of lock files used to coalesce in-flight requests across processes
+
+# Link fields prefetched for each SWAPI category when prefetching is enabled (see SwapiCache);
+# these are the links the transform functions follow next
+PREFETCH_LINKS = {
+    "people": ("homeworld", "species"),
+    "starships": ("pilots",),
+    "vehicles": ("pilots",),
+}
+
+
+class _InflightLock:
+    """Context manager returned by < SwapiCache._single_flight >."""
+
+    __slots__ = ("cache", "key", "entry")
+
+    def __init__(self, cache, key, entry):
+        self.cache = cache
+        self.key = key
+        self.entry = entry
+
+    def __enter__(self):
+        self.entry[0].acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.entry[0].release()
+        with self.cache._lock:
+            self.entry[1] -= 1
+            if not self.entry[1]:
+                del self.cache._inflight[self.key]
+
+
+class SwapiCache:
+    """A cache of SWAPI resources that is persisted to the file system and shared by every
+    caller in the process. The cache file is read the first time the cache is used rather than
+    when the cache is created, so creating a cache at module level costs nothing.
+
+    The cache is thread-safe. Concurrent misses for the same cache key are coalesced
+    ("single-flight"): the first thread fetches the resource while the others wait for it and
+    are then served from the cache, so a thread pool (see < fetch_many >) never requests the same
+    resource twice or rewrites the cache file with a stale copy of the cache.
+
+    If < process_safe > is True (the default) the cache file can be shared by concurrent runs
+    on the same host:
+
+    * writes merge the entries added by this process into the current file contents while
+      holding a lock on the file (< filepath >.lock) and replace the file atomically, so entries
+      written by other processes are never lost;
+    * a miss first takes a lock associated with the cache key (one of < LOCK_STRIPES > lock
+      files in < filepath >.inflight/) and reloads the cache file if another process changed it,
+      so a resource already being fetched by another process is fetched only once.
+
+    The response validators (ETag and Last-Modified headers) of each fetched resource are kept
+    in a sidecar file (< filepath >.validators.json) together with the URL and querystring
+    arguments of the request. If < revalidate > is True the first lookup of each cached resource
+    in a run issues a conditional request; a "304 Not Modified" response is counted as a hit and
+    only a modified resource is downloaded again. < revalidate_all > revalidates every entry.
+
+    The cache file is compressed if < compression > is set or implied by the extension of
+    < filepath > (e.g., "CACHE.json.gz"; see < read_json >). Compressed cache files are written
+    without indentation.
+
+    If < compact > is True the cache file is decoded with shared strings and subtrees (see
+    < read_json >), so an entity cached under its URL and under several search keys is held in
+    memory once. This is safe because cached resources are only handed out as deep copies that
+    share no objects or arrays (see < CacheStats.deepcopy >).
+
+    If < prefetch > is set, fetching an entity schedules background fetches of the resources
+    its link fields refer to (e.g., a person's "homeworld" and "species"), so that they are
+    cached by the time the caller asks for them. < prefetch > maps SWAPI categories (the path
+    segment of the entity's URL, e.g., "people") to link fields; True selects
+    < PREFETCH_LINKS >. Entities in search results are followed too. Prefetched resources are
+    themselves followed up to < prefetch_depth > links away from the entity fetched, using up
+    to < prefetch_workers > threads. A caller asking for a resource that is still being
+    prefetched waits for that request rather than sending another (see single-flight above).
+    Prefetching is off unless < prefetch > is set. Prefetched resources are written to the cache
+    file together, once the scheduled fetches are done, rather than after each one (so another
+    process may fetch a resource that is being prefetched). Use < wait_for_prefetch > to block
+    until the scheduled fetches are done.
+
+    < close > waits for the scheduled prefetches, shuts down the prefetch threads, and writes any
+    resources not yet written. Used as a context manager the cache is closed on exit.
+
+    Usage is counted in < stats > (see < CacheStats >).
+
+    Usage:
+        with utl.SwapiCache(CACHE_FILEPATH, prefetch=True) as cache:
+            luke = cache.fetch("https://swapi.py4e.com/api/people/1/")
+
+    Parameters:
+        filepath (str): path to the cache file
+        stats (CacheStats): optional statistics collector
+        process_safe (bool): if True coordinate reads and writes with other processes
+        revalidate (bool): if True revalidate cached resources once per run
+        compression (str): "gzip", "bz2", "xz", "zstd", None, or "infer"
+        compact (bool): if True share equal strings and subtrees of the loaded cache
+        prefetch (bool|dict): True, or a mapping of SWAPI categories to link fields to prefetch
+        prefetch_depth (int): number of links followed from each entity fetched
+        prefetch_workers (int): maximum number of concurrent prefetch requests
+    """
+
+    def __init__(
+        self,
+        filepath=CACHE_FILEPATH,
+        stats=None,
+        process_safe=True,
+        revalidate=False,
+        compression="infer",
+        compact=False,
+        prefetch=None,
+        prefetch_depth=1,
+        prefetch_workers=4,
+    ):
+        self.filepath = filepath
+        self.compact = compact
+        self.compression = infer_compression(filepath) if compression == "infer" else compression
+        self.validators_filepath = f"{filepath}.validators.json"
+        self.stats = stats if stats is not None else CacheStats("get_swapi_resource")
+        self.process_safe = process_safe
+        self.revalidate = revalidate
+        self.prefetch = PREFETCH_LINKS if prefetch is True else prefetch or {}
+        self.prefetch_depth = prefetch_depth
+        self.prefetch_workers = prefetch_workers
+        self._resources = None
+        self._validators = None
+        self._pending = {}
+        self._file_state = None
+        self._revalidated = set()  # cache keys revalidated during this run
+        self._lock = threading.RLock()  # guards the cached entries, _pending, and _inflight
+        self._persist_lock = threading.Lock()  # serializes writes of the cache file
+        self._inflight = {}  # cache key -> [lock held while fetching, number of callers]
+        self._prefetching = {}  # cache key -> future of a scheduled prefetch
+        self._executor = None  # prefetch thread pool, created on first use
+
+    def __contains__(self, key):
+        return key in self.resources
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.resources)
+
+    @property
+    def resources(self):
+        """dict: cache keys mapped to resources, read from the cache file on first access."""
+
+        if self._resources is None:
+            self._load()
+        return self._resources
+
+    @property
+    def validators(self):
+        """dict: cache keys mapped to the response validators and request of each resource."""
+
+        if self._resources is None:
+            self._load()
+        return self._validators
+
+    def close(self):
+        """Waits for the scheduled prefetches (see < wait_for_prefetch >), shuts down the prefetch
+        threads, and writes the resources added since the cache was last written. The cache can
+        still be used afterwards; a later prefetch starts new threads.
+
+        Returns:
+            None
+        """
+
+        self.wait_for_prefetch()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._resources is not None:
+            self._persist(force=False)
+
+    def fetch(self, url, params=None, timeout=10):
+        """Retrieves a deep copy of a SWAPI resource from either the cache or from a remote API
+        if no cached copy exists. Delegates to the function < create_cache_key > the task of
+        minting a key that is used to identify a cached resource. If the desired resource is not
+        located in the cache, delegates to the function < get_resource > the task of retrieving
+        the resource from SWAPI. A deep copy of the resource retrieved remotely is then added to
+        the cache and the mutated cache is written to the file system before the resource is
+        returned to the caller.
+
+        If prefetching is enabled the resources linked to the resource returned are fetched in
+        the background (see < SwapiCache >).
+
+        WARN: Deep copying is required to guard against possible mutatation of the cached
+        objects when dictionaries representing SWAPI entities (e.g., films, people, planets,
+        species, starships, and vehicles) are modified by other processes.
+
+        Parameters:
+            url (str): a uniform resource locator that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            timeout (int): timeout value in seconds
+
+        Returns:
+            dict|list: requested resource sourced from either the cache or a remote API
+        """
+
+        resource = self._fetch(url, params, timeout)
+        if self.prefetch:
+            self._schedule_prefetch(resource, self.prefetch_depth, timeout)
+        return resource
+
+    def fetch_many(self, urls, params=None, timeout=10, max_workers=8):
+        """Retrieves deep copies of several SWAPI resources concurrently using a pool of
+        < max_workers > threads. Each resource is retrieved by < fetch >, so a URL that is
+        passed more than once (or is being fetched by another thread) is requested only once.
+
+        Parameters:
+            urls (iterable): uniform resource locators that specify the resources
+            params (dict): optional dictionary of querystring arguments passed with every URL
+            timeout (int): timeout value in seconds
+            max_workers (int): maximum number of concurrent requests
+
+        Returns:
+            list: requested resources in the order of < urls >
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda url: self.fetch(url, params, timeout), urls))
+
+    def persist(self):
+        """Writes the cache (and the response validators) to the file system. If
+        < process_safe > is True the entries added by this process are merged into the current
+        file contents under the file lock and the files are replaced atomically.
+
+        The cache is copied while the in-memory lock is held and written after it is released,
+        so other threads keep reading and fetching resources while the file is written.
+
+        Returns:
+            None
+        """
+
+        self._persist(force=True)
+
+    def reload(self):
+        """Adds to the in-memory cache any entries written to the cache file by other processes
+        since it was last read. The file is only read if its size or modification time changed.
+
+        Returns:
+            None
+        """
+
+        if self._resources is None:
+            return  # the file is read when the cache is first accessed
+
+        state = self._stat()
+        if state is None or state == self._file_state:
+            return
+        validators = create_cache(self.validators_filepath)
+        resources = create_cache(self.filepath, self.compression, self.compact)
+        with self._lock:
+            for key, resource in resources.items():
+                if key not in self._pending:
+                    self._resources[key] = resource
+                    if key in validators:
+                        self._validators[key] = validators[key]
+            self._file_state = state
+
+    def revalidate_all(self, timeout=10, max_workers=8):
+        """Issues a conditional request for every cached resource using a pool of
+        < max_workers > threads and replaces the resources that were modified. Resources cached
+        without validators are downloaded again. The cache is written to the file system once,
+        after every resource has been revalidated.
+
+        Parameters:
+            timeout (int): timeout value in seconds
+            max_workers (int): maximum number of concurrent requests
+
+        Returns:
+            dict: number of resources "not_modified", "modified", and "failed"
+        """
+
+        counts = {"not_modified": 0, "modified": 0, "failed": 0}
+
+        def revalidate(key):
+            request = self.validators.get(key, {})
+            with self._single_flight(key):
+                try:
+                    modified = self._fetch_remote(
+                        key, request.get("url", key), request.get("params"), timeout, persist=False
+                    )[1]
+                except Exception:
+                    return "failed"
+            return "modified" if modified else "not_modified"
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for outcome in executor.map(revalidate, list(self.resources)):
+                counts[outcome] += 1
+        if counts["modified"]:
+            self.persist()
+        return counts
+
+    def wait_for_prefetch(self, timeout=None):
+        """Blocks until every scheduled prefetch (including the prefetches they schedule) is
+        done or < timeout > seconds have passed.
+
+        Parameters:
+            timeout (float): maximum seconds to wait; None waits indefinitely
+
+        Returns:
+            bool: True if no prefetch is pending
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                futures = list(self._prefetching.values())
+            if not futures:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            wait(futures, remaining)
+
+    def _fetch(self, url, params, timeout, persist=True):
+        """Returns a deep copy of the resource from the cache, fetching it first if it is not
+        cached (see < fetch >). Unless < persist > is True a fetched resource is not written to
+        the cache file.
+        """
+
+        key = create_cache_key(url, params)
+        resource = self._lookup(key)
+        if resource is None:
+            with self._single_flight(key):
+                resource = self._lookup(key)  # another thread may have fetched the resource
+                if resource is None and self.process_safe:
+                    with FileLock(self._inflight_lock_path(key)):
+                        self.reload()  # another process may have fetched the resource
+                        resource = self._lookup(key)
+                        if resource is None:
+                            return self._fetch_remote(key, url, params, timeout, persist)[0]
+                elif resource is None:
+                    return self._fetch_remote(key, url, params, timeout, persist)[0]
+
+        self.stats.record_hit()
+        return self.stats.deepcopy(resource)  # recursive copy of objects
+
+    def _fetch_remote(self, key, url, params, timeout, persist=True):
+        """Retrieves a resource from the remote API (conditionally if it is cached), adds a deep
+        copy of a new or modified resource to the cache, and persists the cache. Returns the
+        resource and True if it was added or replaced.
+        """
+
+        cached = self.resources.get(key)
+        validators = dict(self.validators.get(key, {})) if cached is not None else {}
+        validators.pop("url", None)
+        validators.pop("params", None)
+        if cached is None:
+            self.stats.record_miss()
+
+        start = time.perf_counter()
+        resource = web.get_resource(url, params, timeout, validators=validators)
+        self.stats.record_network(time.perf_counter() - start)
+        self._revalidated.add(key)
+
+        if cached is not None:
+            self.stats.record_revalidation(resource is not None)
+            if resource is None:
+                self.stats.record_hit()
+                return self.stats.deepcopy(cached), False
+            self.stats.record_miss()
+            self.stats.record_replacement()
+
+        with self._lock:
+            self._resources[key] = self._pending[key] = self.stats.deepcopy(resource)
+            if validators:
+                self._validators[key] = {**validators, "url": url, "params": params}
+            else:
+                self._validators.pop(key, None)
+        if persist:
+            self._persist(force=False)  # persist mutated cache
+        return resource, True
+
+    def _inflight_lock_path(self, key):
+        """Returns the path of the lock file associated with the cache < key >."""
+
+        directory = f"{self.filepath}.inflight"
+        os.makedirs(directory, exist_ok=True)
+        stripe = int(hashlib.sha1(key.encode("utf-8")).hexdigest(), 16) % LOCK_STRIPES
+        return os.path.join(directory, f"{stripe:02d}.lock")
+
+    def _load(self):
+        """Reads the cache file and the validators file."""
+
+        with self._lock:
+            if self._resources is None:
+                self._file_state = self._stat()
+                self._validators = create_cache(self.validators_filepath)
+                self._resources = create_cache(self.filepath, self.compression, self.compact)
+
+    def _lookup(self, key):
+        """Returns the cached resource for < key > or None if it is not cached or must first be
+        revalidated.
+        """
+
+        resource = self.resources.get(key)
+        if self.revalidate and key not in self._revalidated:
+            return None
+        return resource
+
+    def _persist(self, force):
+        """Writes the cache (see < persist >). Unless < force > is True nothing is written if
+        every entry added by this process has already been written (e.g., by a concurrent call
+        that was writing when this one started), which coalesces the writes of concurrent misses.
+        """
+
+        start = time.perf_counter()
+        with self._persist_lock:
+            with self._lock:
+                if not force and not self._pending:
+                    return
+            if self.process_safe:
+                with FileLock(f"{self.filepath}.lock"):
+                    self.reload()
+                    resources, validators, pending = self._snapshot()
+                    if validators or os.path.exists(self.validators_filepath):
+                        self._write_atomic(self.validators_filepath, validators)
+                    self._write_atomic(self.filepath, resources, self.compression)
+                    self._file_state = self._stat()
+            else:
+                resources, validators, pending = self._snapshot()
+                if validators or os.path.exists(self.validators_filepath):
+                    write_json(self.validators_filepath, validators)
+                self._write(self.filepath, resources, self.compression)
+            with self._lock:
+                for key, resource in pending.items():
+                    if self._pending.get(key) is resource:
+                        del self._pending[key]  # unless replaced while the file was written
+        self.stats.record_persist(time.perf_counter() - start)
+
+    def _prefetch(self, key, url, depth, timeout):
+        """Fetches < url > in the background and schedules the prefetch of its links if
+        < depth > allows. Failures are counted rather than raised. The last prefetch to finish
+        writes the resources prefetched to the cache file.
+        """
+
+        try:
+            resource = self._fetch(url, None, timeout, persist=False)
+        except Exception:
+            self.stats.record_prefetch(failed=True)
+        else:
+            self.stats.record_prefetch()
+            if depth > 1:
+                self._schedule_prefetch(resource, depth - 1, timeout)
+        finally:
+            with self._lock:
+                self._prefetching.pop(key, None)
+                drained = not self._prefetching
+            if drained:
+                self._persist(force=False)
+
+    def _schedule_prefetch(self, resource, depth, timeout):
+        """Schedules background fetches of the resources linked by the prefetch fields of
+        < resource > (or of the entities in its "results") that are neither cached nor already
+        scheduled.
+        """
+
+        if isinstance(resource, list):
+            entities = resource
+        elif isinstance(resource, dict) and isinstance(resource.get("results"), list):
+            entities = resource["results"]
+        else:
+            entities = [resource]
+
+        for entity in entities:
+            if not isinstance(entity, dict):
+                continue
+            for field in self.prefetch.get(_category(entity.get("url")), ()):
+                links = entity.get(field)
+                for url in links if isinstance(links, list) else [links]:
+                    if not isinstance(url, str) or not url.startswith("http"):
+                        continue
+                    key = create_cache_key(url)
+                    with self._lock:
+                        if key in self._prefetching or self._lookup(key) is not None:
+                            continue
+                        if self._executor is None:
+                            self._executor = ThreadPoolExecutor(
+                                max_workers=self.prefetch_workers,
+                                thread_name_prefix="swapi-prefetch",
+                            )
+                        self._prefetching[key] = self._executor.submit(
+                            self._prefetch, key, url, depth, timeout
+                        )
+
+    def _single_flight(self, key):
+        """Returns a context manager that holds the lock shared by every thread fetching the
+        cache < key > and discards the lock once the last of those threads is done with it.
+        """
+
+        with self._lock:
+            entry = self._inflight.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        return _InflightLock(self, key, entry)
+
+    def _snapshot(self):
+        """Returns shallow copies of the cached resources, the validators, and the entries
+        pending a write, taken under the in-memory lock.
+        """
+
+        with self._lock:
+            return dict(self.resources), dict(self._validators), dict(self._pending)
+
+    def _stat(self):
+        """Returns the (modification time, size) of the cache file or None if it is missing."""
+
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _write(self, filepath, data, compression=None):
+        """Writes < data > to < filepath >, without indentation if it is compressed."""
+
+        write_json(filepath, data, indent=None if compression else 2, compression=compression)
+
+    def _write_atomic(self, filepath, data, compression=None):
+        """Writes < data > to a temporary file and renames it over < filepath > so that readers
+        never observe a partially written file.
+        """
+
+        temp_filepath = f"{filepath}.{os.getpid()}.tmp"
+        self._write(temp_filepath, data, compression)
+        os.replace(temp_filepath, filepath)
+
+
+def _category(url):
+    """Returns the SWAPI category of an entity < url > (e.g., "people" for
+    "https://swapi.py4e.com/api/people/1/") or None if < url > is not an entity URL.
+    """
+
+    if not isinstance(url, str):
+        return None
+    parts = urlsplit(url).path.strip("/").split("/")
+    return parts[-2] if len(parts) >= 2 and parts[-1].isdigit() else None
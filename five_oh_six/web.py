@@ -0,0 +1,188 @@
+import atexit
+import copy
+import threading
+
+from .cache import create_cache, create_cache_key
+from .files import write_json
+from .serialize import loads
+
+# Fetch mode used by get_resource(): "live", "record", or "replay" (see set_fetch_mode())
+FETCH_SETTINGS = {
+    "mode": "live",
+    "fixtures": None,
+    "filepath": None,
+    "endpoint_override": None,
+    "unsaved": False,
+    "save_at_exit": False,
+}
+
+# Guards the fixture store, which record mode fills from several threads (e.g., prefetches)
+FIXTURES_LOCK = threading.Lock()
+
+# Shared HTTP connection pool (see get_session())
+SESSION = {"session": None}
+
+# Response headers kept as validators (see get_resource()) mapped to the conditional request
+# headers they are sent back in
+VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+
+def _request_url(url):
+    """Returns < url > redirected to the endpoint override (see < set_fetch_mode >) if one is
+    set and < url > begins with the original endpoint; otherwise returns < url > unchanged.
+    """
+
+    if FETCH_SETTINGS["endpoint_override"]:
+        endpoint, override = FETCH_SETTINGS["endpoint_override"]
+        if url.startswith(endpoint):
+            return override + url[len(endpoint):]
+    return url
+
+
+def get_resource(url, params=None, timeout=10, validators=None):
+    """Returns a response object decoded into a dictionary. If query string < params > are
+    provided the response object body is returned in the form on an "envelope" with the data
+    payload of one or more entities to be found in ['results'] list; otherwise, response
+    object body is returned as a single dictionary representation of the entity.
+
+    The behavior depends on the fetch mode set by < set_fetch_mode >. In "replay" mode the
+    response is returned from the fixture store (no network request is made); in "record" mode
+    each response is also added to the fixture store (written by < save_fixtures >). If an endpoint override is set, requests
+    for URLs that begin with the original endpoint are sent to the override (e.g., a local
+    < swapi_stand_in.SwapiStandIn > server) instead. Requests are sent through the shared
+    session returned by < get_session > so that connections to the API are reused. The response
+    body is decoded by the JSON backend (see < set_json_backend >).
+
+    If a < validators > dictionary is passed the request is conditional: any validators it
+    holds (see < VALIDATOR_HEADERS >) are sent as "If-None-Match" and "If-Modified-Since"
+    headers, and the dictionary is updated in place with the validators of the response. If the
+    server answers "304 Not Modified" None is returned instead of the resource, and an error
+    status raises < requests.HTTPError >. Pass an empty dictionary to collect the validators of
+    an unconditional request. Replay mode ignores < validators >: the recorded fixture is always
+    returned (never None) and < validators > is left unchanged, so a cache revalidated against
+    a fixture store counts every resource as modified.
+
+    Parameters:
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+        validators (dict): optional response validators (updated in place)
+
+    Returns:
+        dict: dictionary representation of the decoded JSON or None if not modified.
+    """
+
+    mode = FETCH_SETTINGS["mode"]
+    if mode == "replay":
+        key = create_cache_key(url, params)
+        if key not in FETCH_SETTINGS["fixtures"]:
+            raise LookupError(f"No recorded fixture for {key}")
+        return copy.deepcopy(FETCH_SETTINGS["fixtures"][key])
+
+    request_url = _request_url(url)
+
+    if validators is None:
+        if params:
+            response = get_session().get(request_url, params=params, timeout=timeout)
+        else:
+            response = get_session().get(request_url, timeout=timeout)
+    else:
+        headers = {
+            request_header: validators[header]
+            for header, request_header in VALIDATOR_HEADERS.items()
+            if validators.get(header)
+        }
+        response = get_session().get(request_url, params=params, timeout=timeout, headers=headers)
+        validators.update(
+            {header: response.headers[header] for header in VALIDATOR_HEADERS if response.headers.get(header)}
+        )
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()  # never mistake an error body for a modified resource
+    resource = loads(response.content)  # decode the body bytes with the JSON backend
+
+    if mode == "record":
+        with FIXTURES_LOCK:
+            FETCH_SETTINGS["fixtures"][create_cache_key(url, params)] = copy.deepcopy(resource)
+            FETCH_SETTINGS["unsaved"] = True
+
+    return resource
+
+
+def get_session():
+    """Returns the < requests.Session > shared by every caller of < get_resource >. The session
+    (and the < requests > package) is created on first use; reusing it keeps connections to the
+    API open between requests instead of opening a new connection per request.
+
+    Parameters:
+        None
+
+    Returns:
+        requests.Session: shared HTTP session
+    """
+
+    if SESSION["session"] is None:
+        import requests  # deferred so that importing this package does not import requests
+
+        SESSION["session"] = requests.Session()
+    return SESSION["session"]
+
+
+def save_fixtures():
+    """Writes the fixture store to its file if responses were recorded since it was last
+    written. Called by < set_fetch_mode > when the mode changes and at process exit, so record
+    mode writes the store once rather than after every response.
+
+    Parameters:
+        None
+
+    Returns:
+        bool: True if the fixture store was written
+    """
+
+    with FIXTURES_LOCK:
+        if not FETCH_SETTINGS["unsaved"]:
+            return False
+        write_json(FETCH_SETTINGS["filepath"], FETCH_SETTINGS["fixtures"])
+        FETCH_SETTINGS["unsaved"] = False
+        return True
+
+
+def set_fetch_mode(mode="live", fixtures_filepath=None, endpoint_override=None):
+    """Sets how < get_resource > retrieves resources.
+
+    Modes:
+        live: send requests to the remote API (default)
+        record: send requests and capture each response in the fixture store, which is written
+                to < fixtures_filepath > by < save_fixtures > when the mode is changed again or
+                the process exits
+        replay: return responses from the fixture store only; a < LookupError > is raised if a
+                response was not recorded
+
+    The fixture store maps cache keys (see < create_cache_key >) to decoded responses, which is
+    the same structure as the cache file, so an existing cache file can serve as a fixture store.
+
+    Parameters:
+        mode (str): "live", "record", or "replay"
+        fixtures_filepath (str): path to the fixture store (required for "record" and "replay")
+        endpoint_override (tuple): optional (endpoint, replacement) pair; request URLs that
+                                   begin with < endpoint > are redirected to < replacement >
+
+    Returns:
+        None
+    """
+
+    if mode not in ("live", "record", "replay"):
+        raise ValueError(f"mode must be 'live', 'record', or 'replay', not {mode!r}")
+    if mode != "live" and not fixtures_filepath:
+        raise ValueError(f"{mode} mode requires a fixtures_filepath")
+
+    save_fixtures()  # responses recorded in the previous mode
+    with FIXTURES_LOCK:
+        FETCH_SETTINGS["mode"] = mode
+        FETCH_SETTINGS["filepath"] = fixtures_filepath
+        FETCH_SETTINGS["fixtures"] = create_cache(fixtures_filepath) if fixtures_filepath else None
+        FETCH_SETTINGS["endpoint_override"] = endpoint_override
+    if mode == "record" and not FETCH_SETTINGS["save_at_exit"]:
+        atexit.register(save_fixtures)
+        FETCH_SETTINGS["save_at_exit"] = True
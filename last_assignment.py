@@ -1,10 +1,12 @@
-import copy
+import argparse
+import heapq
 import five_oh_six as utl
 
 from pathlib import Path
 
 
 # Constants
+BUILD_MANIFEST_FILEPATH = "./.build-manifest.json"
 CACHE_FILEPATH = "./CACHE.json"
 NONE_VALUES = ("", "n/a", "none", "unknown")
 SWAPI_ENDPOINT = "https://swapi.py4e.com/api"
@@ -14,8 +16,9 @@ SWAPI_PLANETS = f"{SWAPI_ENDPOINT}/planets/"
 SWAPI_SPECIES = f"{SWAPI_ENDPOINT}/species/"
 SWAPI_STARSHIPS = f"{SWAPI_ENDPOINT}/starships/"
 
-# Create/retrieve cache
-cache = utl.create_cache(CACHE_FILEPATH)
+# Cache (the cache file is read on first use); main(prefetch=True) fetches a person's homeworld
+# and species in the background as soon as the person is retrieved (see utl.PREFETCH_LINKS)
+cache = utl.SwapiCache(CACHE_FILEPATH)
 
 
 def assign_crew_members(crew_size, crew_positions, personnel):
@@ -147,6 +150,37 @@ def convert_episode_values(episodes, none_values):
     return episodes
 
 
+def count_episodes_by_credit(episodes, key, delimiter=", "):
+    """Constructs and returns a dictionary of key-value pairs that associate each person credited
+    under the passed in episode < key > (e.g., "episode_director", "episode_writers") with a count
+    of the episodes that they were credited with. The person's name comprises the key and the
+    associated value a count of the number of episodes credited. Duplicate keys are NOT permitted.
+
+    The credit value may be a string of names separated by the passed in < delimiter > or a list
+    of names (e.g., "episode_writers" after < convert_episode_values > has been called). Episodes
+    with no credit value (i.e., < None > or an empty string/list) are skipped.
+
+    Each person's episode count is incremented by < 1.0 > if, and only if, the person is the only
+    person credited. Otherwise, if more than one person is credited each person is allocated a
+    fraction of < 1.0 >. This value is calculated by dividing < 1.0 > by the number of people
+    credited. The counts are accumulated in a single pass over the < episodes >.
+
+    Parameters:
+        episodes (list): nested episode dictionaries
+        key (str): episode key that identifies the credit value
+        delimiter (str): delimiter that separates names in a string credit value
+
+    Returns:
+        dict: a dictionary that stores counts of the number of episodes credited to each person
+    """
+
+    accumulator = {}
+    for credit, increment in iter_episode_credits(episodes, key, delimiter):
+        accumulator[credit] = accumulator.get(credit, 0.0) + increment
+
+    return accumulator
+
+
 def count_episodes_by_director(episodes):
     """Constructs and returns a dictionary of key-value pairs that associate each director with
     a count of the episodes that they directed. The director's name comprises the key and the
@@ -164,7 +198,8 @@ def count_episodes_by_director(episodes):
     the only person credited with directing the episode. Otherwise, if more than one person
     is credited with directing the episode each director is allocated a fraction of < 1.0 >.
     This value is calculated by dividing < 1.0 > by the number of directors credited with
-    directing the episode.
+    directing the episode. Delegates to the function < count_episodes_by_credit > the task of
+    accumulating the counts.
 
     Parameters:
         episodes (list): nested episode dictionaries
@@ -174,19 +209,51 @@ def count_episodes_by_director(episodes):
               by each director
     """
 
-    accumulator = {}
-    for episode in episodes:
-        directors = episode["episode_director"].split(", ")
+    return count_episodes_by_credit(episodes, "episode_director")
 
-        increment = 1.0 / len(directors) if len(directors) > 1 else 1.0
 
-        for director in directors:
-            if director in accumulator:
-                accumulator[director] += increment
-            else:
-                accumulator[director] = increment
+def count_episodes_by_writer(episodes):
+    """Constructs and returns a dictionary of key-value pairs that associate each writer with
+    a count of the episodes that they wrote. Fractional counts are allocated to writers who share
+    a writing credit. Delegates to the function < count_episodes_by_credit > the task of
+    accumulating the counts.
 
-    return accumulator
+    Parameters:
+        episodes (list): nested episode dictionaries
+
+    Returns:
+        dict: a dictionary that stores counts of the number of episodes written
+              by each writer
+    """
+
+    return count_episodes_by_credit(episodes, "episode_writers")
+
+
+def get_linked_resources(data, fields=("homeworld", "species")):
+    """Returns the SWAPI resources linked by the passed in < fields > of the < data > dictionary
+    (e.g., a person's homeworld and species) keyed by URL. Retrieving each resource is delegated
+    to the function < get_swapi_resource() >, so resources are read from the cache if present.
+    Only the first URL of a list of URLs is followed, as in < transform_person() >.
+
+    The resources serve as build inputs (see < utl.BuildRunner >) of outputs whose transforms
+    follow the links, so that an updated cache entry rebuilds the output.
+
+    Parameters:
+        data (dict): SWAPI entity
+        fields (tuple): names of the link fields (URL strings or lists of URL strings)
+
+    Returns:
+        dict: URLs mapped to SWAPI resources
+    """
+
+    resources = {}
+    for field in fields:
+        url = data.get(field)
+        if isinstance(url, list):
+            url = url[0] if url else None
+        if url:
+            resources[url] = get_swapi_resource(url)
+    return resources
 
 
 def get_most_viewed_episode(episodes):
@@ -243,18 +310,21 @@ def get_news_desks(articles, none_values):
 
 def get_swapi_resource(url, params=None, timeout=10):
     """Retrieves a deep copy of a SWAPI resource from either the local < cache >
-    dictionary or from a remote API if no local copy exists. Delegates to the function
-    < utl.create_cache_key > the task of minting a key that is used to identify a cached
-    resource. If the desired resource is not located in the cache, delegates to the
-    function < get_resource > the task of retrieving the resource from SWAPI.
-    A deep copy of the resource retrieved remotely is then added to the local < cache > by
-    mapping it to a new < cache[key] >. The mutated cache is written to the file
-    system before a deep copy of the resource is returned to the caller.
+    or from a remote API if no local copy exists. Delegates to the method
+    < cache.fetch > (see < utl.SwapiCache >) the task of looking up the resource by its cache key,
+    retrieving it from SWAPI if it is not cached, adding a deep copy to the cache, and writing
+    the mutated cache to the file system. A deep copy of the resource is returned to the caller.
 
     WARN: Deep copying is required to guard against possible mutatation of the cached
     objects when dictionaries representing SWAPI entities (e.g., films, people, planets,
     species, starships, and vehicles) are modified by other processes.
 
+    Hits, misses, network latency, deep copies, and cache writes are counted in
+    < cache.stats > (see < utl.CacheStats >).
+
+    The function is thread-safe: concurrent calls for the same resource wait on a single
+    request (e.g., when resources are retrieved with < cache.fetch_many >).
+
     Parameters:
         url (str): a uniform resource locator that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
@@ -264,14 +334,7 @@ def get_swapi_resource(url, params=None, timeout=10):
         dict|list: requested resource sourced from either the local cache or a remote API
     """
 
-    key = utl.create_cache_key(url, params)
-    if key in cache.keys():
-        return copy.deepcopy(cache[key])  # recursive copy of objects
-    else:
-        resource = utl.get_resource(url, params, timeout)
-        cache[key] = copy.deepcopy(resource)  # recursive copy of objects
-        utl.write_json(CACHE_FILEPATH, cache)  # persist mutated cache
-        return resource
+    return cache.fetch(url, params, timeout)
 
 
 def group_articles_by_news_desk(news_desks, articles):
@@ -351,7 +414,151 @@ def has_viewer_data(episode):
     return True if episode["episode_us_viewers_mm"] else False
 
 
-def transform_droid(data, keys, none_values):
+def iter_episode_credits(episodes, key, delimiter=", "):
+    """Yields a (name, increment) tuple for each person credited under the passed in episode
+    < key > (e.g., "episode_director", "episode_writers") of each episode. The increment is
+    < 1.0 > if the person is the only person credited; otherwise < 1.0 > divided by the number
+    of people credited (see < count_episodes_by_credit >).
+
+    The credit value may be a string of names separated by the passed in < delimiter > or a list
+    of names. Episodes with no credit value (i.e., < None > or an empty string/list) are skipped.
+
+    Parameters:
+        episodes (iterable): nested episode dictionaries
+        key (str): episode key that identifies the credit value
+        delimiter (str): delimiter that separates names in a string credit value
+
+    Yields:
+        tuple: person's name and the fraction of the episode credited to them
+    """
+
+    for episode in episodes:
+        credits = episode[key]
+        if not credits:
+            continue
+        if isinstance(credits, str):
+            credits = credits.split(delimiter)
+
+        increment = 1.0 / len(credits)
+        for credit in credits:
+            yield credit, increment
+
+
+def rank_episode_counts(counts, top_k=None):
+    """Returns a new dictionary of the passed in < counts > (e.g., the return value of
+    < count_episodes_by_director >) ordered by count (descending) and last name (ascending).
+    Names that tie on both count and last name retain their original order.
+
+    The sort key of each name is computed once (the last name is split off a single time per
+    name) before ordering. If < top_k > is provided only the first < top_k > names are returned;
+    these are selected with a heap (< heapq.nsmallest >) rather than by sorting every name.
+
+    Parameters:
+        counts (dict): names mapped to episode counts
+        top_k (int): optional maximum number of names to return
+
+    Returns:
+        dict: names mapped to episode counts in leaderboard order
+    """
+
+    ranked = [
+        ((-count, name.split()[-1]), i, name, count)
+        for i, (name, count) in enumerate(counts.items())
+    ]
+
+    if top_k is None:
+        ranked.sort()
+    else:
+        ranked = heapq.nsmallest(top_k, ranked)
+
+    return {name: count for _, _, name, count in ranked}
+
+
+def summarize_episode_credits(episodes, key, top_k=10, sketch=False, delimiter=", "):
+    """Returns a < utl.StreamSummary > of the people credited under the passed in episode < key >
+    (e.g., "episode_director", "episode_writers"): the number of distinct people and the
+    < top_k > people with the most episode credits. Credits are allocated as in
+    < count_episodes_by_credit > (shared credits count as a fraction of < 1.0 >).
+
+    If < sketch > is True the summary is estimated in bounded memory (a HyperLogLog sketch for
+    the distinct count and a Count-Min heavy-hitters sketch for the top credits) for archive
+    dumps too large to count exactly; see < utl.StreamSummary > for the error of the estimates.
+    Otherwise the counts are exact.
+
+    Parameters:
+        episodes (iterable): nested episode dictionaries
+        key (str): episode key that identifies the credit value
+        top_k (int): number of people reported by the summary's < top >
+        sketch (bool): if True estimate with sketches instead of counting exactly
+        delimiter (str): delimiter that separates names in a string credit value
+
+    Returns:
+        utl.StreamSummary: distinct and top credit counts
+    """
+
+    summary = utl.StreamSummary(top_k, sketch=sketch)
+    for credit, increment in iter_episode_credits(episodes, key, delimiter):
+        summary.add(credit, increment)
+    return summary
+
+
+def summarize_news_desk_word_counts(articles, none_values, quantiles=(0.5, 0.9)):
+    """Returns streaming word count statistics (count, mean, variance, minimum, maximum, and
+    estimated < quantiles >) of the passed in < articles > per news desk. Each article is read
+    once and not retained, so < articles > may be a generator over an archive of any size (e.g.,
+    < utl.iter_json_array >) and memory use grows only with the number of news desks.
+
+    As in < calculate_articles_mean_word_count > articles with a word count of zero (0) or
+    < None > are excluded from the statistics; as in < group_articles_by_news_desk > the news
+    desk is converted with < utl.to_none > and articles without a news desk are skipped. A news
+    desk whose articles all lack a word count has a count of zero and a mean of < None >.
+
+    Parameters:
+        articles (iterable): nested dictionary representations of New York Times articles
+        none_values (tuple): strings to convert to None
+        quantiles (tuple): quantiles (0.0 - 1.0) to estimate
+
+    Returns:
+        utl.GroupedStats: < utl.RunningStats > keyed by news desk in order of first appearance
+    """
+
+    stats = utl.GroupedStats(
+        lambda article: utl.to_none(article["news_desk"], none_values),
+        lambda article: article["word_count"] or None,
+        quantiles,
+    )
+    stats.update(articles)
+    return stats
+
+
+def summarize_news_desks(articles, none_values, top_k=10, sketch=False):
+    """Returns a < utl.StreamSummary > of the news desks of the passed in < articles >: the
+    number of distinct news desks (see < get_news_desks >) and the < top_k > news desks with
+    the most articles. News desk values are converted with < utl.to_none > and articles without
+    a news desk are skipped.
+
+    If < sketch > is True the summary is estimated in bounded memory; see
+    < summarize_episode_credits >.
+
+    Parameters:
+        articles (iterable): nested dictionary representations of New York Times articles
+        none_values (tuple): strings to convert to None
+        top_k (int): number of news desks reported by the summary's < top >
+        sketch (bool): if True estimate with sketches instead of counting exactly
+
+    Returns:
+        utl.StreamSummary: distinct and top news desk counts
+    """
+
+    summary = utl.StreamSummary(top_k, sketch=sketch)
+    for article in articles:
+        desk = utl.to_none(article["news_desk"], none_values)
+        if desk is not None:
+            summary.add(desk)
+    return summary
+
+
+def transform_droid(data, keys, none_values, factory=None):
     """Returns a new "thinned" dictionary representation of a droid based on the passed in
      < data > dictionary with string values converted to more appropriate types.
 
@@ -389,9 +596,10 @@ def transform_droid(data, keys, none_values):
          data (dict): source data
          keys (dict): old key to new key mappings
          none_values (tuple): strings to convert to None
+         factory (callable): optional < utl.EntityFactory > used to create a compact entity
 
      Returns:
-         dict: new dictionary representation of a droid
+         dict|utl.Entity: new dictionary representation of a droid
     """
 
     new_dict = {}
@@ -411,10 +619,38 @@ def transform_droid(data, keys, none_values):
         else:
             new_dict[new_key] = utl.to_none(data.get(old_key), none_values)
 
-    return new_dict
+    return factory("droid", new_dict) if factory else new_dict
+
 
+def transform_homeworld(url, keys, none_values, planets=None, factory=None):
+    """Returns a new "thinned" dictionary representation of the planet identified by the passed
+    in SWAPI < url >. Retrieving the planet is delegated to the function < get_swapi_resource() >.
+    If the caller passes in a Wookieepedia-sourced < planets > list this function delegates to the
+    function < utl.get_nested_dict() > the task of retrieving the Wookieepedia representation of
+    the planet from < planets >. If the planet is found in < planets > the SWAPI and Wookieepedia
+    dictionaries are combined. Cleaning the planet dictionary is delegated to the function
+    < transform_planet() >.
 
-def transform_person(data, keys, none_values, planets=None):
+    Parameters:
+        url (str): SWAPI planet URL
+        keys (dict): old key to new key mappings
+        none_values (tuple): strings to convert to None
+        planets (list): Supplementary planet data
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity
+
+    Returns:
+        dict|utl.Entity: new dictionary representation of a planet
+    """
+
+    home_planet = get_swapi_resource(url)
+    if planets:
+        wookiee_homeworld = utl.get_nested_dict(planets, "name", home_planet["name"])
+        if wookiee_homeworld:
+            home_planet.update(wookiee_homeworld)
+    return transform_planet(home_planet, keys, none_values, factory)
+
+
+def transform_person(data, keys, none_values, planets=None, lazy=False, factory=None):
     """Returns a new "thinned" dictionary representation of a person based on the passed in
     < data > dictionary with string values converted to more appropriate types.
 
@@ -439,17 +675,18 @@ def transform_person(data, keys, none_values, planets=None):
 
     Both the "homeworld" and "species" values require special handling.
 
-    Retrieving a dictionary representation of the person's home planet is delegated to the
-    function < get_swapi_resource() >. If the caller passes in a Wookieepedia-sourced
-    < planets > list this function delegates to the function < utl.get_nested_dict() > the task
-    of retrieving the Wookieepedia representation of the homeworld from < planets >.
-    If the homeworld is found in < planets > the SWAPI and Wookieepedia dictionaries are
-    combined. Cleaning the homeworld dictionary is delegated to the function < transform_planet() >.
+    Retrieving a dictionary representation of the person's home planet (combined with the
+    Wookieepedia representation in < planets > if provided) is delegated to the function
+    < transform_homeworld() >.
 
     Likewise, retrieving a representation of the person's species is delegated to the function
     < get_swapi_resource() >. Cleaning the species dictionary is delegated to the function
     < transform_species() >.
 
+    If < lazy > is True the "homeworld" and "species" values are < utl.LazyResource > references
+    that retrieve and transform the linked resource only when first accessed, so callers that only
+    need the person's own values avoid the SWAPI requests and transforms.
+
     Mappings (old key -> new key):
         url (str) -> url (str)
         name (str) -> name (str | None)
@@ -465,9 +702,11 @@ def transform_person(data, keys, none_values, planets=None):
         keys (dict): old key to new key mappings
         none_values (tuple): strings to convert to None
         planets (list): Supplementary planet data
+        lazy (bool): if True defer retrieving the homeworld and species until accessed
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity
 
     Returns:
-        dict: new dictionary representation of a person
+        dict|utl.Entity: new dictionary representation of a person
     """
     new_dict = {}
 
@@ -482,23 +721,31 @@ def transform_person(data, keys, none_values, planets=None):
             new_dict[new_key] = utl.to_float(utl.to_none(data.get(old_key), none_values))
 
         elif old_key == "homeworld":
-            home_planet = get_swapi_resource(data.get("homeworld"))
-            if planets:
-                wookiee_homeworld = utl.get_nested_dict(planets, "name", home_planet["name"])
-                if wookiee_homeworld:
-                    home_planet.update(wookiee_homeworld)
-            new_dict[new_key] = transform_planet(home_planet, keys, none_values)
+
+            def load_homeworld(url):
+                return transform_homeworld(url, keys, none_values, planets, factory)
+
+            if lazy:
+                new_dict[new_key] = utl.LazyResource(data.get(old_key), load_homeworld)
+            else:
+                new_dict[new_key] = load_homeworld(data.get(old_key))
 
         elif old_key == "species":
-            species_data = get_swapi_resource(data.get(old_key)[0])
-            new_dict[new_key] = transform_species(species_data, keys, none_values)
+
+            def load_species(url):
+                return transform_species(get_swapi_resource(url), keys, none_values, factory)
+
+            if lazy:
+                new_dict[new_key] = utl.LazyResource(data.get(old_key)[0], load_species)
+            else:
+                new_dict[new_key] = load_species(data.get(old_key)[0])
 
         else:
             new_dict[new_key] = utl.to_none(data.get(old_key), none_values)
-    return new_dict
+    return factory("person", new_dict) if factory else new_dict
 
 
-def transform_planet(data, keys, none_values):
+def transform_planet(data, keys, none_values, factory=None):
     """Returns a new "thinned" dictionary representation of a planet based on the passed in
     < data > dictionary with string values converted to more appropriate types.
 
@@ -539,9 +786,10 @@ def transform_planet(data, keys, none_values):
         data (dict): source data
         keys (dict): old key to new key mappings
         none_values (tuple): strings to convert to None
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity
 
     Returns:
-        dict: new dictionary representation of a planet
+        dict|utl.Entity: new dictionary representation of a planet
     """
     transformed_planet = {}
     for old_key, new_key in keys["planet"].items():
@@ -562,10 +810,10 @@ def transform_planet(data, keys, none_values):
 
         else:
             transformed_planet[new_key] = utl.to_none(data.get(old_key), none_values)
-    return transformed_planet
+    return factory("planet", transformed_planet) if factory else transformed_planet
 
 
-def transform_species(data, keys, none_values):
+def transform_species(data, keys, none_values, factory=None):
     """Returns a new "thinned" dictionary representation of a species based on the passed in
     < data > dictionary with string values converted to more appropriate types.
 
@@ -601,9 +849,10 @@ def transform_species(data, keys, none_values):
         data (dict): source data
         keys (dict): old key to new key mappings
         none_values (tuple): strings to convert to None
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity
 
     Returns:
-        dict: new dictionary representation of a planet
+        dict|utl.Entity: new dictionary representation of a planet
     """
     new_dict = {}
 
@@ -620,10 +869,10 @@ def transform_species(data, keys, none_values):
         else:
             new_dict[new_key] = utl.to_none(data.get(old_key), none_values)
 
-    return new_dict
+    return factory("species", new_dict) if factory else new_dict
 
 
-def transform_starship(data, keys, none_values):
+def transform_starship(data, keys, none_values, factory=None):
     """Returns a new "thinned" dictionary representation of a starship based on the passed in
     < data > dictionary with string values converted to more appropriate types.
 
@@ -670,9 +919,10 @@ def transform_starship(data, keys, none_values):
         data (dict): source data
         keys (dict): old key to new key mappings
         none_values (tuple): strings to convert to None
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity
 
     Returns:
-        dict: new dictionary representation of a planet
+        dict|utl.Entity: new dictionary representation of a planet
     """
     new_dict = {}
 
@@ -695,19 +945,29 @@ def transform_starship(data, keys, none_values):
         else:
             new_dict[new_key] = utl.to_none(data.get(old_key), none_values)
 
-    return new_dict
+    return factory("starship", new_dict) if factory else new_dict
 
 
-def main():
-    """Entry point for program.
+def main(verbose=False, prefetch=False):
+    """Entry point for program. Every "stu-*.json" output is produced by a build stage (see
+    < utl.BuildRunner >) and only rewritten when its inputs change: the input files, this
+    script and the five_oh_six package, and the cached SWAPI resources the output is built from.
 
     Parameters:
-        None
+        verbose (bool): if True print the cache and build statistics when done
+        prefetch (bool): if True prefetch the resources linked to each person fetched
 
     Returns:
         None
     """
 
+    if prefetch:
+        cache.prefetch = utl.PREFETCH_LINKS
+
+    runner = utl.BuildRunner(
+        BUILD_MANIFEST_FILEPATH, files=[__file__, *sorted(Path(utl.__file__).parent.glob("*.py"))]
+    )
+
     # 3.1 CHALLENGE 01
 
     assert utl.to_float("4") == 4.0
@@ -740,48 +1000,68 @@ def main():
             accumulator += 1
 
     # 3.4 CHALLENGE 04
-    clone_wars_episodes = convert_episode_values(clone_wars_episodes, NONE_VALUES)
-    utl.write_json("stu-clone_wars_episodes_converted.json", clone_wars_episodes)
+    clone_wars_episodes = runner.build(
+        "stu-clone_wars_episodes_converted.json",
+        lambda: convert_episode_values(clone_wars_episodes, NONE_VALUES),
+        files=["data-clone_wars_episodes.csv"],
+        values=[NONE_VALUES],
+    )
     # 3.5 CHALLENGE 05
     most_viewed_episode = get_most_viewed_episode(clone_wars_episodes)
     print(most_viewed_episode)
     # 3.6 CHALLENGE 06
-    director_episode_counts = count_episodes_by_director(clone_wars_episodes)
-    # TODO Uncomment
     # Sort by count (descending), last name (ascending)
-    director_episode_counts = {
-        director: count
-        for director, count in sorted(
-            director_episode_counts.items(), key=lambda x: (-x[1], x[0].split()[-1])
-        )
-    }
-    utl.write_json("stu-clone_wars-director_episode_counts.json", director_episode_counts)
+    director_episode_counts = runner.build(
+        "stu-clone_wars-director_episode_counts.json",
+        lambda: rank_episode_counts(count_episodes_by_director(clone_wars_episodes)),
+        files=["stu-clone_wars_episodes_converted.json"],
+    )
     # 3.7 CHALLENGE 07
     articles = utl.read_json("data-nyt_star_wars_articles.json")
-    news_desks = get_news_desks(articles, NONE_VALUES)
-    utl.write_json("stu-nyt_news_desks.json", news_desks)
+    news_desks = runner.build(
+        "stu-nyt_news_desks.json",
+        lambda: get_news_desks(articles, NONE_VALUES),
+        files=["data-nyt_star_wars_articles.json"],
+        values=[NONE_VALUES],
+    )
     # 3.8 CHALLENGE 08
-    news_desk_articles = group_articles_by_news_desk(news_desks, articles)
-    utl.write_json("stu-nyt_news_desk_articles.json", news_desk_articles)
+    news_desk_articles = runner.build(
+        "stu-nyt_news_desk_articles.json",
+        lambda: group_articles_by_news_desk(news_desks, articles),
+        files=["data-nyt_star_wars_articles.json", "stu-nyt_news_desks.json"],
+    )
     # 3.9 CHALLENGE 09
 
     ignore = ("Business Day", "Movies")
-    mean_word_counts = {}
-
-    for key, value in news_desk_articles.items():
-        if key not in ignore:
-            mean_word_count = calculate_articles_mean_word_count(value)
-            mean_word_counts[key] = mean_word_count
 
-    utl.write_json("stu-nyt_news_desk_mean_word_counts.json", mean_word_counts)
+    def compute_mean_word_counts():
+        # single pass over the articles (same means as calculate_articles_mean_word_count())
+        mean_word_counts = {}
+        for key, stats in summarize_news_desk_word_counts(articles, NONE_VALUES).items():
+            if key not in ignore:
+                mean_word_counts[key] = round(stats.mean or 0.0, 2)
+        return mean_word_counts
+
+    mean_word_counts = runner.build(
+        "stu-nyt_news_desk_mean_word_counts.json",
+        compute_mean_word_counts,
+        files=["data-nyt_star_wars_articles.json"],
+        values=[ignore, NONE_VALUES],
+    )
 
     # 3.10 CHALLENGE 10
     wookiee_planets = utl.read_csv_to_dicts("data-wookieepedia_planets.csv")
-    wookiee_dagobah = utl.get_nested_dict(wookiee_planets, "name", "Dagobah")
-    utl.write_json("stu-wookiee_dagobah.json", wookiee_dagobah)
+    wookiee_dagobah = runner.build(
+        "stu-wookiee_dagobah.json",
+        lambda: utl.get_nested_dict(wookiee_planets, "name", "Dagobah"),
+        files=["data-wookieepedia_planets.csv"],
+    )
 
-    wookiee_haruun_kal = utl.get_nested_dict(wookiee_planets, "system", "Al'Har system")
-    utl.write_json("stu-wookiee_haruun_kal.json", wookiee_haruun_kal)
+    wookiee_haruun_kal = runner.build(
+        "stu-wookiee_haruun_kal.json",
+        lambda: utl.get_nested_dict(wookiee_planets, "system", "Al'Har system"),
+        files=["data-wookieepedia_planets.csv"],
+    )
     # 3.11 CHALLENGE 11
     assert utl.to_gravity_value("1 standard") == 1.0
     assert utl.to_gravity_value("5STANDARD") == 5.0
@@ -804,10 +1084,12 @@ def main():
     wookiee_tatooine = utl.get_nested_dict(wookiee_planets, "name", swapi_tatooine["name"])
     # 3.12.2.5
     swapi_tatooine.update(wookiee_tatooine)
-    # 3.12.2.6
-    tatooine = transform_planet(swapi_tatooine, keys, NONE_VALUES)
-    # 3.12.2.7
-    utl.write_json("stu-tatooine.json", tatooine)
+    # 3.12.2.6 - 3.12.2.7
+    tatooine = runner.build(
+        "stu-tatooine.json",
+        lambda: transform_planet(swapi_tatooine, keys, NONE_VALUES),
+        values=[swapi_tatooine, keys, NONE_VALUES],
+    )
 
     # 3.13 CHALLENGE 13
     # 3.13.2.1
@@ -818,18 +1100,22 @@ def main():
     wookiee_r2_d2 = utl.get_nested_dict(wookiee_droids, "name", swapi_r2_d2["name"])
     # 3.13.2.4
     swapi_r2_d2.update(wookiee_r2_d2)
-    # 3.13.2.5
-    r2_d2 = transform_droid(swapi_r2_d2, keys, NONE_VALUES)
-    # 3.13.2.6
-    utl.write_json("stu-r2_d2.json", r2_d2)
+    # 3.13.2.5 - 3.13.2.6
+    r2_d2 = runner.build(
+        "stu-r2_d2.json",
+        lambda: transform_droid(swapi_r2_d2, keys, NONE_VALUES),
+        values=[swapi_r2_d2, keys, NONE_VALUES],
+    )
 
     # 3.14 CHALLENGE 14
     # 3.14.2.1
     swapi_human_species = get_swapi_resource(SWAPI_SPECIES, {"search": "human"})["results"][0]
-    # 3.14.2.2
-    human_species = transform_species(swapi_human_species, keys, NONE_VALUES)
-    # 3.14.2.3
-    utl.write_json("stu-human_species.json", human_species)
+    # 3.14.2.2 - 3.14.2.3
+    human_species = runner.build(
+        "stu-human_species.json",
+        lambda: transform_species(swapi_human_species, keys, NONE_VALUES),
+        values=[swapi_human_species, keys, NONE_VALUES],
+    )
 
     # 3.15 CHALLENGE 15
     # 3.15.2.1
@@ -840,44 +1126,60 @@ def main():
     wookiee_anakin = utl.get_nested_dict(wookiee_people, "name", swapi_anakin["name"])
     # 3.15.2.4
     swapi_anakin.update(wookiee_anakin)
-    # 3.15.2.5
-    anakin = transform_person(swapi_anakin, keys, NONE_VALUES, wookiee_planets)
-    # 3.15.2.6
-    utl.write_json("stu-anakin_skywalker.json", anakin)
+    # 3.15.2.5 - 3.15.2.6
+    anakin = runner.build(
+        "stu-anakin_skywalker.json",
+        lambda: transform_person(swapi_anakin, keys, NONE_VALUES, wookiee_planets),
+        files=["data-wookieepedia_planets.csv"],
+        values=[swapi_anakin, get_linked_resources(swapi_anakin), keys, NONE_VALUES],
+    )
 
     # 3.15.2.7 - 3.15.2.8
     swapi_obi_wan = get_swapi_resource(SWAPI_PEOPLE, {"search": "Obi-Wan Kenobi"})["results"][0]
     wookiee_obi_wan = utl.get_nested_dict(wookiee_people, "name", swapi_obi_wan["name"])
     swapi_obi_wan.update(wookiee_obi_wan)
-    obi_wan = transform_person(swapi_obi_wan, keys, NONE_VALUES, wookiee_planets)
-    utl.write_json("stu-obi_wan_kenobi.json", obi_wan)
+    obi_wan = runner.build(
+        "stu-obi_wan_kenobi.json",
+        lambda: transform_person(swapi_obi_wan, keys, NONE_VALUES, wookiee_planets),
+        files=["data-wookieepedia_planets.csv"],
+        values=[swapi_obi_wan, get_linked_resources(swapi_obi_wan), keys, NONE_VALUES],
+    )
 
     # 3.16 CHALLENGE 16
     # 3.16.2.1
     wookiee_starships = utl.read_csv_to_dicts("data-wookieepedia_starships.csv")
     # 3.16.2.2
     wookiee_twilight = utl.get_nested_dict(wookiee_starships, "name", "Twilight")
-    # 3.16.2.3
-    twilight = transform_starship(wookiee_twilight, keys, NONE_VALUES)
-    # 3.16.2.4
-    utl.write_json("stu-twilight.json", twilight)
+    # 3.16.2.3 - 3.16.2.4
+    twilight = runner.build(
+        "stu-twilight.json",
+        lambda: transform_starship(wookiee_twilight, keys, NONE_VALUES),
+        values=[wookiee_twilight, keys, NONE_VALUES],
+    )
 
     # 3.17 CHALLENGE 17
     # 3.17.2.1
     swapi_padme = get_swapi_resource(SWAPI_PEOPLE, {"search": "Padmé Amidala"})["results"][0]
     wookiee_padme = utl.get_nested_dict(wookiee_people, "name", swapi_padme["name"])
     swapi_padme.update(wookiee_padme)
-    padme = transform_person(swapi_padme, keys, NONE_VALUES, wookiee_planets)
     # 3.17.2.2
-    utl.write_json("stu-padme_amidala.json", padme)
+    padme = runner.build(
+        "stu-padme_amidala.json",
+        lambda: transform_person(swapi_padme, keys, NONE_VALUES, wookiee_planets),
+        files=["data-wookieepedia_planets.csv"],
+        values=[swapi_padme, get_linked_resources(swapi_padme), keys, NONE_VALUES],
+    )
 
     # 3.17.2.3
     swapi_c_3po = get_swapi_resource(SWAPI_PEOPLE, {"search": "C-3PO"})["results"][0]
     wookiee_c_3po = utl.get_nested_dict(wookiee_droids, "name", swapi_c_3po["name"])
     swapi_c_3po.update(wookiee_c_3po)
-    c_3po = transform_droid(swapi_c_3po, keys, NONE_VALUES)
     # 3.17.2.4
-    utl.write_json("stu-c_3po.json", c_3po)
+    c_3po = runner.build(
+        "stu-c_3po.json",
+        lambda: transform_droid(swapi_c_3po, keys, NONE_VALUES),
+        values=[swapi_c_3po, keys, NONE_VALUES],
+    )
 
     # 3.17.2.5
     filepath = Path("data-jedi.json").absolute()
@@ -911,17 +1213,20 @@ def main():
     # 3.18.3
     r2_d2["instructions"] = ["Power up the engines"]
     # 3.19 CHALLENGE 19
-    # 3.19.1.1
-    planets = [transform_planet(planet, keys, NONE_VALUES) for planet in wookiee_planets]
-
-    # 3.19.1.2
-    planets.sort(key=lambda planet: planet["name"], reverse=True)
-
-    # 3.19.1.3
-    utl.write_json("stu-planets_sorted_name.json", planets)
+    # 3.19.1.1 - 3.19.1.3 (the planets are only transformed if the output must be rebuilt)
+    planet_inputs = {"files": ["data-wookieepedia_planets.csv"], "values": [keys, NONE_VALUES]}
+    planets_name = runner.build(
+        "stu-planets_sorted_name.json",
+        lambda: sorted(
+            (transform_planet(planet, keys, NONE_VALUES) for planet in wookiee_planets),
+            key=lambda planet: planet["name"],
+            reverse=True,
+        ),
+        **planet_inputs,
+    )
 
     # 3.19.2.1
-    naboo = utl.get_nested_dict(planets, "diameter_km", 12120)
+    naboo = utl.EntityQuery(planets_name).first("diameter_km", 12120)
 
     # 3.19.2.2
     region = naboo.get("region")
@@ -932,19 +1237,35 @@ def main():
     r2_d2["instructions"].append(naboo_direction)
 
     # 3.19.3
-    # 3.19.3.1 - 3.19.3.3
-    planets_diameter_km = sorted(planets, key=lambda x: (-x['diameter_km'] if x['diameter_km'] else 0, x['name']))
-
-    # 3.19.4
-    utl.write_json("stu-planets_sorted_diameter.json", planets_diameter_km)
+    # 3.19.3.1 - 3.19.4
+    planets_diameter_km = runner.build(
+        "stu-planets_sorted_diameter.json",
+        lambda: sorted(
+            planets_name,
+            key=lambda x: (-x["diameter_km"] if x["diameter_km"] else 0, x["name"]),
+        ),
+        **planet_inputs,
+    )
 
     # 3.20 CHALLENGE 20
     # 3.20.1 Release the docking clamp
     r2_d2["instructions"].append("Release the docking clamp")
 
-    # 3.20.2 Escape from the Malevolence
-    utl.write_json("stu-twilight_departs.json", twilight)
+    # 3.20.2 Escape from the Malevolence (built from every input above, so fingerprint the result)
+    runner.build("stu-twilight_departs.json", lambda: twilight, values=[twilight])
+
+    cache.close()
+    if verbose:
+        print(f"\n{cache.stats}")
+        print(runner)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Star Wars last assignment.")
+    parser.add_argument(
+        "--verbose", action="store_true", help="print the cache and build statistics"
+    )
+    parser.add_argument(
+        "--prefetch", action="store_true", help="prefetch each person's homeworld and species"
+    )
+    main(**vars(parser.parse_args()))
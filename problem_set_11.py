@@ -1,9 +1,9 @@
 # PROBLEM SET 11
-import copy
+import argparse
 import five_oh_six as utl
 
-# Cache
-cache = utl.create_cache(utl.CACHE_FILEPATH)
+# Cache (the cache file is read on first use)
+cache = utl.SwapiCache(utl.CACHE_FILEPATH)
 
 SWAPI_ENDPOINT = "https://swapi.py4e.com/api"
 SWAPI_CATEGORIES = f"{SWAPI_ENDPOINT}/"
@@ -63,7 +63,7 @@ def convert_gravity_value(value):
     except:
         return utl.convert_to_none(value, utl.NONE_VALUES)
 
-def create_droid(data):
+def create_droid(data, factory=None):
     """Returns a new dictionary representation of a droid from the passed in < data >,
     converting string values to the appropriate type whenever possible.
 
@@ -92,9 +92,10 @@ def create_droid(data):
 
     Parameters:
         data (dict): source data.
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity.
 
     Returns:
-        dict: new dictionary.
+        dict|utl.Entity: new dictionary.
     """
     droid = utl.convert_none_values(data, utl.NONE_VALUES)
     dictionary = {
@@ -108,19 +109,15 @@ def create_droid(data):
         'equipment': utl.convert_to_list(droid.get('equipment'), '|'),
         'instructions': droid.get('instructions')
     }
-    return dictionary
+    return factory('droid', dictionary) if factory else dictionary
 
-def create_person(data, planets=None):
+def create_person(data, planets=None, lazy=False, factory=None):
     """Returns a new dictionary representation of a person from the passed in < data >,
     converting string values to the appropriate type whenever possible.
 
-    If an optional Wookieepedia-sourced < planets > list is provided, the task of retrieving
-    the appropriate nested dictionary (filtered on the passed in homeworld planet name) is
-    delegated to the function < get_mandalorian_data >.
-
-    If a < planets > list is not provided, the task of retrieving
-    the appropriate nested dictionary (filtered on the passed in homeworld/planet)
-    is delegated to the function < get_swapi_resource >.
+    Retrieving the person's homeworld, either from an optional Wookieepedia-sourced < planets >
+    list or from SWAPI, is delegated to the function < get_homeworld >. If < lazy > is True the
+    homeworld is a < utl.LazyResource > reference that is retrieved only when first accessed.
 
     < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison)
     are first converted to < None > by calling < utl.convert_none_values > and returning
@@ -150,26 +147,20 @@ def create_person(data, planets=None):
     Parameters:
         data (dict): source data.
         planets (list): optional supplemental planetary data.
+        lazy (bool): if True defer retrieving the homeworld until accessed.
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity.
 
     Returns:
-        dict: new dictionary.
+        dict|utl.Entity: new dictionary.
     """
     person = utl.convert_none_values(data, utl.NONE_VALUES)
 
-    homeworld = None
-
-    if planets:
-        mandalorian_planet = get_mandalorian_data(planets, person.get('homeworld'))
-        if mandalorian_planet:
-            homeworld = create_planet(mandalorian_planet)
-    elif person.get('homeworld'):
-        try:
-            swapi_planet = get_swapi_resource(person.get('homeworld'))
-            homeworld = create_planet(swapi_planet)
-        except:
-            homeworld = None
+    if lazy and person.get('homeworld'):
+        homeworld = utl.LazyResource(
+            person.get('homeworld'), lambda ref: get_homeworld(ref, planets, factory)
+        )
     else:
-        homeworld = None
+        homeworld = get_homeworld(person.get('homeworld'), planets, factory)
 
     dictionary = {
         'url': person.get('url'),
@@ -181,9 +172,9 @@ def create_person(data, planets=None):
         'force_sensitive': person.get('force_sensitive')
     }
 
-    return dictionary
+    return factory('person', dictionary) if factory else dictionary
 
-def create_planet(data):
+def create_planet(data, factory=None):
     """Returns a new dictionary representation of a planet from the passed in < data >,
     converting string values to the appropriate type whenever possible.
 
@@ -220,9 +211,10 @@ def create_planet(data):
 
     Parameters:
         data (dict): source data.
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity.
 
     Returns:
-        dict: new dictionary.
+        dict|utl.Entity: new dictionary.
     """
 
     planet = utl.convert_none_values(data, utl.NONE_VALUES)
@@ -242,10 +234,10 @@ def create_planet(data):
         'population': utl.convert_to_int(data.get('population'))
     }
 
-    return dictionary
+    return factory('planet', dictionary) if factory else dictionary
 
 
-def create_starship(data):
+def create_starship(data, factory=None):
     """Returns a new starship dictionary from the passed in < data >, converting string
     values to the appropriate type whenever possible.
 
@@ -282,9 +274,10 @@ def create_starship(data):
 
     Parameters:
         data (dict): source data.
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity.
 
     Returns:
-        dict: new dictionary.
+        dict|utl.Entity: new dictionary.
     """
     starship = utl.convert_none_values(data, utl.NONE_VALUES)
     dictionary = {
@@ -305,10 +298,10 @@ def create_starship(data):
         'cargo_capacity_kg': utl.convert_to_int(starship.get('cargo_capacity')),
         'consumables': starship.get('consumables')
     }
-    return dictionary
+    return factory('starship', dictionary) if factory else dictionary
 
 
-def create_vehicle(data):
+def create_vehicle(data, factory=None):
     """Returns a new vehicle dictionary from the passed in < data >, converting string
     values to the appropriate type whenever possible.
 
@@ -342,9 +335,10 @@ def create_vehicle(data):
 
     Parameters:
         data (dict): source data.
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity.
 
     Returns:
-        dict: new dictionary.
+        dict|utl.Entity: new dictionary.
     """
 
     vehicle = utl.convert_none_values(data, utl.NONE_VALUES)
@@ -364,8 +358,38 @@ def create_vehicle(data):
         'cargo_capacity_kg': utl.convert_to_int(vehicle.get('cargo_capacity')),
         'consumables': vehicle.get('consumables')
     }
-    return dictionary
+    return factory('vehicle', dictionary) if factory else dictionary
+
+
+def get_homeworld(homeworld, planets=None, factory=None):
+    """Returns a new dictionary representation of a person's < homeworld > or None if the
+    homeworld cannot be retrieved.
+
+    If an optional Wookieepedia-sourced < planets > list is provided, the task of retrieving
+    the appropriate nested dictionary (filtered on the passed in homeworld planet name) is
+    delegated to the function < get_mandalorian_data >. Otherwise the task of retrieving the
+    planet is delegated to the function < get_swapi_resource >. The planet is then passed to
+    < create_planet >.
+
+    Parameters:
+        homeworld (str): homeworld name or SWAPI URL.
+        planets (list): optional supplemental planetary data.
+        factory (callable): optional < utl.EntityFactory > used to create a compact entity.
+
+    Returns:
+        dict|utl.Entity|None: new dictionary or None.
+    """
 
+    if planets:
+        mandalorian_planet = get_mandalorian_data(planets, homeworld)
+        if mandalorian_planet:
+            return create_planet(mandalorian_planet, factory)
+    elif homeworld:
+        try:
+            return create_planet(get_swapi_resource(homeworld), factory)
+        except:
+            return None
+    return None
 
 def get_mandalorian_data(mandalorian_data, filter):
     """Attempts to retrieve a Wookieepedia sourced dictionary representation of a
@@ -375,14 +399,21 @@ def get_mandalorian_data(mandalorian_data, filter):
     passed in < filter > value. If a match is obtained the dictionary is returned to the
     caller; otherwise None is returned.
 
+    If < mandalorian_data > is a < utl.FuzzyIndex > built on the "name" values the lookup is
+    delegated to the index instead, which also matches names that differ in accents,
+    punctuation, or spelling (e.g., "Cara Dune" matches "Carasynthia Dune").
+
     Parameters:
-        mandalorian_data (list): Wookieepedia-sourced data stored in a list of nested dictionaries.
+        mandalorian_data (list|utl.FuzzyIndex): Wookieepedia-sourced data stored in a list of
+                                                nested dictionaries or a fuzzy index of it.
         filter (str): name value used to match on a dictionary's "name" value.
 
     Returns
         dict|None: Wookieepedia-sourced data dictionary if match on the filter is obtained;
                    otherwise returns None.
     """
+    if isinstance(mandalorian_data, utl.FuzzyIndex):
+        return mandalorian_data.get(filter)
     try:
         for data in mandalorian_data:
             if data['name'].lower() == filter.lower():
@@ -393,18 +424,21 @@ def get_mandalorian_data(mandalorian_data, filter):
 
 def get_swapi_resource(url, params=None, timeout=10):
     """Retrieves a deep copy of a SWAPI resource from either the local < cache >
-    dictionary or from a remote API if no local copy exists. Delegates to the function
-    < utl.create_cache_key > the task of minting a key that is used to identify a cached
-    resource. If the desired resource is not located in the cache, delegates to the
-    function < get_resource > the task of retrieving the resource from SWAPI.
-    A deep copy of the resource retrieved remotely is then added to the local < cache > by
-    mapping it to a new < cache[key] >. The mutated cache is written to the file
-    system before a deep copy of the resource is returned to the caller.
+    or from a remote API if no local copy exists. Delegates to the method
+    < cache.fetch > (see < utl.SwapiCache >) the task of looking up the resource by its cache key,
+    retrieving it from SWAPI if it is not cached, adding a deep copy to the cache, and writing
+    the mutated cache to the file system. A deep copy of the resource is returned to the caller.
 
     WARN: Deep copying is required to guard against possible mutatation of the cached
     objects when dictionaries representing SWAPI entities (e.g., films, people, planets,
     species, starships, and vehicles) are modified by other processes.
 
+    Hits, misses, network latency, deep copies, and cache writes are counted in
+    < cache.stats > (see < utl.CacheStats >).
+
+    The function is thread-safe: concurrent calls for the same resource wait on a single
+    request (e.g., when resources are retrieved with < cache.fetch_many >).
+
     Parameters:
         url (str): a uniform resource locator that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
@@ -414,15 +448,7 @@ def get_swapi_resource(url, params=None, timeout=10):
         dict|list: requested resource sourced from either the local cache or a remote API
     """
 
-    key = utl.create_cache_key(url, params)
-    if key in cache.keys():
-        return copy.deepcopy(cache[key])  # recursive copy of objects
-    else:
-        resource = utl.get_resource(url, params, timeout)
-        cache[key] = copy.deepcopy(resource)  # recursive copy of objects
-        utl.write_json(utl.CACHE_FILEPATH, cache)  # persist mutated cache
-
-        return resource
+    return cache.fetch(url, params, timeout)
 
 
 def update_planets_visited(data, planet):
@@ -445,11 +471,11 @@ def update_planets_visited(data, planet):
     return data
 
 
-def main():
+def main(verbose=False):
     """Entry point for program.
 
     Parameters:
-        None
+        verbose (bool): if True print the cache statistics when done
 
     Returns:
         None
@@ -691,8 +717,13 @@ def main():
     # TODO call function
     utl.write_json('stu-razor_crest_departs.json', razor_crest)
     # PERSIST util.cache (DO NOT COMMENT OUT BELOW)
-    utl.write_json(utl.CACHE_FILEPATH, cache)
+    cache.persist()
+
+    if verbose:
+        print(f"\n{cache.stats}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Star Wars problem set 11.")
+    parser.add_argument("--verbose", action="store_true", help="print the cache statistics")
+    main(**vars(parser.parse_args()))
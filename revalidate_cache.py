@@ -0,0 +1,60 @@
+import five_oh_six as utl
+
+
+def revalidate_cache(filepath=utl.CACHE_FILEPATH, timeout=10, max_workers=8):
+    """Revalidates every resource in the cache file located at < filepath > with conditional
+    requests (see < utl.SwapiCache.revalidate_all >). Resources that were not modified cost a
+    "304 Not Modified" response rather than a full download; modified resources are replaced
+    and the cache file is rewritten.
+
+    Parameters:
+        filepath (str): path to the cache file
+        timeout (int): timeout value in seconds
+        max_workers (int): maximum number of concurrent requests
+
+    Returns:
+        tuple: dictionary of outcome counts and the cache's < utl.CacheStats >
+    """
+
+    cache = utl.SwapiCache(filepath)
+    counts = cache.revalidate_all(timeout=timeout, max_workers=max_workers)
+    return counts, cache.stats
+
+
+def main():
+    """Entry point for program. Revalidates a cache file and prints a summary.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Revalidate cached SWAPI resources.")
+    parser.add_argument("filepath", nargs="?", default=utl.CACHE_FILEPATH, help="cache file")
+    parser.add_argument("--timeout", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument(
+        "--endpoint-override",
+        nargs=2,
+        metavar=("ENDPOINT", "REPLACEMENT"),
+        help="send requests for ENDPOINT to REPLACEMENT (e.g., a swapi_stand_in server)",
+    )
+    args = parser.parse_args()
+
+    if args.endpoint_override:
+        utl.set_fetch_mode(endpoint_override=tuple(args.endpoint_override))
+
+    counts, stats = revalidate_cache(args.filepath, args.timeout, args.workers)
+    print(
+        f"{counts['not_modified']} not modified, {counts['modified']} modified, "
+        f"{counts['failed']} failed"
+    )
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
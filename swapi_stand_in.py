@@ -0,0 +1,256 @@
+import hashlib
+import json
+import random
+import threading
+import time
+import five_oh_six as utl
+
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+# Constants
+SWAPI_ORIGIN = "https://swapi.py4e.com"
+
+
+class SwapiStandIn:
+    """A local, in-process HTTP server that stands in for SWAPI by serving responses from a
+    fixture store (see < utl.set_fetch_mode >; a cache file also serves as a fixture store).
+    Latency and errors can be injected in order to benchmark the fetch, cache, and concurrency
+    paths deterministically without network access.
+
+    Each request path and querystring is combined with < origin > and passed to
+    < utl.create_cache_key > to look up the fixture, so "/api/people/?search=Anakin+Skywalker"
+    serves the fixture recorded for "https://swapi.py4e.com/api/people/?search=anakin%20skywalker".
+    Unknown keys return a 404.
+
+    Responses carry an ETag (a hash of the body) and a Last-Modified header (the time the
+    stand-in was created). Conditional requests are honored: "If-None-Match" is compared with
+    the ETag and, if absent, "If-Modified-Since" with Last-Modified, and a matching request is
+    answered with "304 Not Modified" and no body. Changing a fixture changes its ETag.
+
+    Usage:
+        with SwapiStandIn("CACHE.json", latency=0.05) as stand_in:
+            utl.set_fetch_mode(endpoint_override=(SWAPI_ENDPOINT, stand_in.endpoint))
+            ...
+
+    Parameters:
+        fixtures (dict|str): fixture store or path to a fixture store file
+        latency (float): seconds to wait before each response
+        jitter (float): maximum random seconds added to < latency >
+        error_rate (float): fraction (0.0 - 1.0) of requests answered with < error_status >
+        error_status (int): HTTP status code returned for injected errors
+        seed (int): random seed that makes jitter and error injection repeatable
+        host (str): interface to bind
+        port (int): port to bind; 0 selects a free port
+        origin (str): scheme and host of the API being stood in for
+    """
+
+    def __init__(
+        self,
+        fixtures,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        error_status=503,
+        seed=None,
+        host="127.0.0.1",
+        port=0,
+        origin=SWAPI_ORIGIN,
+    ):
+        self.fixtures = utl.read_json(fixtures) if isinstance(fixtures, str) else fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.origin = origin
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.stats = {"requests": 0, "served": 0, "errors": 0, "not_found": 0, "not_modified": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _create_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def base_url(self):
+        """str: scheme, host, and port of the running server (e.g., "http://127.0.0.1:8000")."""
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def endpoint(self):
+        """str: the stand-in equivalent of SWAPI's "/api" endpoint."""
+
+        return f"{self.base_url}/api"
+
+    def respond(self, path, headers=None):
+        """Returns the (status, body, headers) served for a request < path > (including any
+        querystring), applying the configured latency and error injection.
+
+        Parameters:
+            path (str): request path and querystring
+            headers (dict): optional request headers (e.g., "If-None-Match")
+
+        Returns:
+            tuple: HTTP status code (int), response body (bytes), and response headers (dict)
+        """
+
+        headers = headers or {}
+
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate and self._random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        if fail:
+            self._count("errors")
+            return self.error_status, json.dumps({"detail": "Injected error"}).encode("utf-8"), {}
+
+        parts = urlsplit(path)
+        key = utl.create_cache_key(f"{self.origin}{parts.path}", dict(parse_qsl(parts.query)))
+        if key not in self.fixtures:
+            self._count("not_found")
+            return 404, json.dumps({"detail": "Not found"}).encode("utf-8"), {}
+
+        body = json.dumps(self.fixtures[key], ensure_ascii=False).encode("utf-8")
+        validators = {
+            "ETag": f'"{hashlib.sha1(body).hexdigest()}"',
+            "Last-Modified": self.last_modified,
+        }
+        if self._not_modified(headers, validators):
+            self._count("not_modified")
+            return 304, b"", validators
+
+        self._count("served")
+        return 200, body, validators
+
+    def serve_forever(self):
+        """Serves requests on the calling thread until interrupted (e.g., by Ctrl+C), then
+        releases the server's socket.
+
+        Returns:
+            None
+        """
+
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def start(self):
+        """Starts serving requests on a background (daemon) thread.
+
+        Returns:
+            str: the server's base URL
+        """
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stops the server and releases its socket.
+
+        Returns:
+            None
+        """
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def _count(self, stat):
+        """Increments the < stat > counter."""
+
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _not_modified(self, headers, validators):
+        """Returns True if the conditional request < headers > match the < validators >."""
+
+        if headers.get("If-None-Match"):
+            etags = [etag.strip() for etag in headers["If-None-Match"].split(",")]
+            return "*" in etags or validators["ETag"] in etags
+        if headers.get("If-Modified-Since"):
+            try:
+                since = parsedate_to_datetime(headers["If-Modified-Since"])
+            except (TypeError, ValueError):
+                return False
+            return since >= parsedate_to_datetime(validators["Last-Modified"])
+        return False
+
+
+def _create_handler(stand_in):
+    """Returns a request handler class bound to the passed in < stand_in > server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, body, headers = stand_in.respond(self.path, self.headers)
+            self.send_response(status)
+            for header, value in headers.items():
+                self.send_header(header, value)
+            if status != 304:
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # keep benchmark output quiet
+
+    return Handler
+
+
+def main():
+    """Entry point for program. Serves a fixture store until interrupted.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve recorded SWAPI responses locally.")
+    parser.add_argument("fixtures", help="fixture store or cache file (e.g., CACHE.json)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    stand_in = SwapiStandIn(
+        args.fixtures,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        port=args.port,
+    )
+    print(f"Serving {len(stand_in.fixtures)} fixtures at {stand_in.endpoint}")
+    stand_in.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
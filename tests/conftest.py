@@ -0,0 +1,47 @@
+import pytest
+
+import five_oh_six as utl
+
+from swapi_stand_in import SwapiStandIn
+
+
+# Constants
+SWAPI_ENDPOINT = "https://swapi.py4e.com/api"
+
+
+def create_fixtures(count=20):
+    """Returns a fixture store of < count > people, planets, and species keyed as SWAPI caches
+    them."""
+
+    fixtures = {}
+    for i in range(1, count + 1):
+        fixtures[f"{SWAPI_ENDPOINT}/planets/{i}/"] = {
+            "name": f"Planet {i}",
+            "diameter": str(i),
+            "url": f"{SWAPI_ENDPOINT}/planets/{i}/",
+        }
+        fixtures[f"{SWAPI_ENDPOINT}/people/{i}/"] = {
+            "name": f"Person {i}",
+            "homeworld": f"{SWAPI_ENDPOINT}/planets/{i}/",
+            "species": [],
+            "url": f"{SWAPI_ENDPOINT}/people/{i}/",
+        }
+        fixtures[f"{SWAPI_ENDPOINT}/species/{i}/"] = {
+            "name": f"Species {i}",
+            "classification": "mammal",
+            "url": f"{SWAPI_ENDPOINT}/species/{i}/",
+        }
+    return fixtures
+
+
+@pytest.fixture
+def stand_in():
+    """Yields a running < SwapiStandIn > that receives every SWAPI request."""
+
+    pytest.importorskip("requests")
+    with SwapiStandIn(create_fixtures(), latency=0.01) as server:
+        utl.set_fetch_mode(endpoint_override=(SWAPI_ENDPOINT, server.endpoint))
+        try:
+            yield server
+        finally:
+            utl.set_fetch_mode()
@@ -0,0 +1,108 @@
+import bisect
+import random
+import statistics
+
+import pytest
+
+import five_oh_six as utl
+
+
+def _rank_error(values, p, estimate):
+    """Returns how far the rank of < estimate > in < values > is from the < p > quantile, as a
+    fraction of the number of values."""
+
+    ordered = sorted(values)
+    return abs(bisect.bisect_left(ordered, estimate) / len(ordered) - p)
+
+
+def test_p2_quantile_is_exact_for_the_first_five_values():
+    median = utl.P2Quantile(0.5)
+    assert median.value() is None
+    for value in (3, 1, 4, 1):
+        median.add(value)
+
+    assert median.value() == 2.0
+    median.add(5)
+    assert median.value() == 3
+    with pytest.raises(ValueError):
+        utl.P2Quantile(1.5)
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "normal", "exponential"])
+@pytest.mark.parametrize("p", [0.1, 0.5, 0.9, 0.99])
+def test_p2_quantile_estimates_are_within_one_percent_of_the_rank(distribution, p):
+    rng = random.Random(49)
+    if distribution == "normal":
+        values = [rng.gauss(100, 15) for _ in range(20000)]
+    elif distribution == "exponential":
+        values = [rng.expovariate(0.01) for _ in range(20000)]
+    else:
+        values = [rng.random() for _ in range(20000)]
+
+    estimator = utl.P2Quantile(p)
+    for value in values:
+        estimator.add(value)
+
+    assert estimator.count == len(values)
+    assert _rank_error(values, p, estimator.value()) < 0.01
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("p", [0.1, 0.5, 0.9, 0.99])
+def test_p2_quantile_estimates_of_sorted_streams(reverse, p):
+    rng = random.Random(49)
+    values = sorted((rng.random() for _ in range(20000)), reverse=reverse)
+
+    estimator = utl.P2Quantile(p)
+    for value in values:
+        estimator.add(value)
+
+    assert _rank_error(values, p, estimator.value()) < 0.1  # see the P2Quantile warning
+
+
+def test_running_stats_match_the_statistics_module():
+    rng = random.Random(49)
+    values = [rng.uniform(-1e6, 1e6) + 1e9 for _ in range(5000)]
+    stats = utl.RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.fmean(values), rel=1e-12)
+    assert stats.variance == pytest.approx(statistics.variance(values), rel=1e-9)
+    assert stats.stdev == pytest.approx(statistics.stdev(values), rel=1e-9)
+    assert (stats.min, stats.max) == (min(values), max(values))
+    assert _rank_error(values, 0.9, stats.quantile(0.9)) < 0.01
+
+
+def test_running_stats_of_integers_have_an_exact_mean():
+    stats = utl.RunningStats(quantiles=(0.5,))
+    assert stats.mean is None and stats.variance is None
+    for value in (10**17 + 1, 10**17 + 2, 10**17 + 4):
+        stats.add(value)
+
+    assert stats.total == 3 * 10**17 + 7
+    assert stats.mean == (3 * 10**17 + 7) / 3
+    assert stats.summary()["count"] == 3
+
+
+def test_grouped_stats_group_records_by_key():
+    articles = [
+        {"news_desk": "Culture", "word_count": 1200},
+        {"news_desk": "Culture", "word_count": 800},
+        {"news_desk": "Business", "word_count": None},
+        {"news_desk": None, "word_count": 500},
+        {"news_desk": "Business", "word_count": 300},
+    ]
+    stats = utl.GroupedStats("news_desk", "word_count", quantiles=(0.5,))
+    stats.update(iter(articles))
+
+    assert list(stats) == ["Culture", "Business"]
+    assert None not in stats
+    assert stats["Culture"].mean == 1000
+    assert stats["Business"].count == 1
+    assert stats.summary()["Culture"]["p50"] == 1000.0
+
+    by_length = utl.GroupedStats(lambda article: len(article["news_desk"] or ""), "word_count")
+    by_length.update(articles)
+    assert sorted(by_length) == [0, 7, 8]
@@ -0,0 +1,91 @@
+import os
+
+import five_oh_six as utl
+
+
+def _runner(tmp_path, **kwargs):
+    """Returns a build runner whose manifest is kept in < tmp_path >."""
+
+    return utl.BuildRunner(str(tmp_path / "manifest.json"), **kwargs)
+
+
+def _stage(tmp_path, runner, calls, values=("value",)):
+    """Builds "out.json" from "in.csv" and < values >, recording each call of the stage."""
+
+    def compute():
+        calls.append(1)
+        return {"rows": (tmp_path / "in.csv").read_text(encoding="utf-8").splitlines()}
+
+    return runner.build(
+        str(tmp_path / "out.json"), compute, files=[str(tmp_path / "in.csv")], values=values
+    )
+
+
+def test_a_stage_with_unchanged_inputs_and_output_is_skipped(tmp_path):
+    (tmp_path / "in.csv").write_text("name\nLuke\n", encoding="utf-8")
+    calls = []
+    built = _stage(tmp_path, _runner(tmp_path), calls)
+
+    runner = _runner(tmp_path)
+    skipped = _stage(tmp_path, runner, calls)
+
+    assert calls == [1]
+    assert skipped == built
+    assert runner.skipped == [str(tmp_path / "out.json")] and runner.built == []
+
+
+def test_changed_input_content_rebuilds_the_stage(tmp_path):
+    filepath = tmp_path / "in.csv"
+    filepath.write_text("name\nLuke\n", encoding="utf-8")
+    calls = []
+    _stage(tmp_path, _runner(tmp_path), calls)
+
+    filepath.write_text("name\nLeia\n", encoding="utf-8")  # same size
+    stat = filepath.stat()
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    rebuilt = _stage(tmp_path, _runner(tmp_path), calls)
+    revalued = _stage(tmp_path, _runner(tmp_path), calls, values=("other value",))
+
+    assert calls == [1, 1, 1]
+    assert rebuilt == revalued == {"rows": ["name", "Leia"]}
+
+
+def test_an_edited_or_deleted_output_is_rebuilt(tmp_path):
+    (tmp_path / "in.csv").write_text("name\nLuke\n", encoding="utf-8")
+    output = tmp_path / "out.json"
+    calls = []
+    built = _stage(tmp_path, _runner(tmp_path), calls)
+
+    output.write_text('{"rows": []}', encoding="utf-8")
+    assert _stage(tmp_path, _runner(tmp_path), calls) == built
+
+    output.unlink()
+    assert _stage(tmp_path, _runner(tmp_path), calls) == built
+    assert calls == [1, 1, 1]
+    assert utl.read_json(str(output)) == built
+
+
+def test_force_rebuilds_every_stage(tmp_path):
+    (tmp_path / "in.csv").write_text("name\nLuke\n", encoding="utf-8")
+    calls = []
+    _stage(tmp_path, _runner(tmp_path), calls)
+
+    runner = _runner(tmp_path, force=True)
+    _stage(tmp_path, runner, calls)
+
+    assert calls == [1, 1]
+    assert runner.built == [str(tmp_path / "out.json")] and runner.skipped == []
+
+
+def test_outputs_match_a_non_incremental_write(tmp_path):
+    (tmp_path / "in.csv").write_text("name\nLuke\nPadmé\n", encoding="utf-8")
+    calls = []
+    built = _stage(tmp_path, _runner(tmp_path), calls)
+    content = (tmp_path / "out.json").read_bytes()
+    skipped = _stage(tmp_path, _runner(tmp_path), calls)
+
+    utl.write_json(str(tmp_path / "plain.json"), built)
+
+    assert calls == [1]
+    assert content == (tmp_path / "plain.json").read_bytes()
+    assert (tmp_path / "out.json").read_bytes() == content and skipped == built
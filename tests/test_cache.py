@@ -0,0 +1,77 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import five_oh_six as utl
+
+from .conftest import SWAPI_ENDPOINT
+
+
+def test_cache_stats_count_hits_misses_and_writes(stand_in, tmp_path):
+    cache = utl.SwapiCache(str(tmp_path / "CACHE.json"))
+    urls = [f"{SWAPI_ENDPOINT}/people/{i}/" for i in (1, 2, 1, 3, 2, 1)]
+
+    for url in urls:
+        cache.fetch(url)
+    summary = cache.stats.summary()
+
+    assert (summary["hits"], summary["misses"]) == (3, 3)
+    assert summary["hit_ratio"] == 0.5
+    assert summary["network_requests"] == stand_in.stats["requests"] == 3
+    assert sum(summary["network_latency_histogram"].values()) == 3
+    assert summary["persist_writes"] == 3  # one write per stored resource
+    assert summary["deepcopies"] == 3 + 3  # one per hit and one per stored resource
+    assert summary["replacements"] == 0
+    assert "3 hits, 3 misses (50.0% hit ratio)" in str(cache.stats)
+
+    cache.stats.reset()
+    assert cache.stats.summary()["hits"] == 0
+    assert cache.stats.summary()["hit_ratio"] is None
+
+
+def test_cache_stats_summaries_are_consistent_while_counting():
+    stats = utl.CacheStats("test")
+    stop = threading.Event()
+    snapshots = []
+
+    def count():
+        while not stop.is_set():
+            stats.record_hit()
+            stats.record_miss()
+
+    def summarize():
+        for _ in range(2000):
+            summary = stats.summary()
+            snapshots.append(summary["hits"] - summary["misses"])
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        counters = [executor.submit(count) for _ in range(4)]
+        executor.submit(summarize).result()
+        stop.set()
+        for counter in counters:
+            counter.result()
+
+    summary = stats.summary()
+    assert summary["hits"] == summary["misses"] > 0
+    assert all(difference in (0, 1, 2, 3, 4) for difference in snapshots)
+
+
+def test_compact_cache_hands_out_unshared_copies(tmp_path):
+    filepath = str(tmp_path / "CACHE.json")
+    url = f"{SWAPI_ENDPOINT}/people/1/"
+    search = utl.create_cache_key(f"{SWAPI_ENDPOINT}/people/", {"search": "luke"})
+    luke = {"name": "Luke Skywalker", "films": [], "species": [], "url": url}
+    utl.write_json(filepath, {url: luke, search: {"count": 1, "results": [dict(luke)]}})
+
+    cache = utl.SwapiCache(filepath, compact=True)
+    person = cache.fetch(url)
+    assert person == luke
+    assert cache.fetch(f"{SWAPI_ENDPOINT}/people/", {"search": "luke"})["results"] == [luke]
+
+    person["films"].append(f"{SWAPI_ENDPOINT}/films/1/")
+    person["name"] = "Red Five"
+
+    assert person["species"] == []  # equal arrays shared in the cache are copied separately
+    assert cache.fetch(url) == luke
+    assert cache.fetch(f"{SWAPI_ENDPOINT}/people/", {"search": "luke"})["results"] == [luke]
+    assert utl.read_json(filepath) == {url: luke, search: {"count": 1, "results": [luke]}}
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+import five_oh_six as utl
+
+
+def test_entities_store_fields_in_slots():
+    planet = utl.entity_class("planet", ("name", "diameter_km"))({"name": "Tatooine"})
+
+    assert not hasattr(planet, "__dict__")
+    assert planet["name"] == "Tatooine"
+    assert planet["diameter_km"] is None
+    assert list(planet) == ["name", "diameter_km"]
+    assert len(planet) == 2
+    with pytest.raises(AttributeError):
+        planet.climate = "arid"
+
+
+def test_entities_behave_like_dicts_with_fixed_keys():
+    planet_class = utl.entity_class("planet", ("name", "diameter_km"))
+    planet = planet_class({"name": "Tatooine"}, diameter_km=10465)
+
+    assert planet == {"name": "Tatooine", "diameter_km": 10465}
+    assert planet.to_dict() == {"name": "Tatooine", "diameter_km": 10465}
+    assert planet.get("climate", "arid") == "arid"
+    assert "climate" not in planet
+    planet["diameter_km"] = 10466
+    assert planet["diameter_km"] == 10466
+    with pytest.raises(KeyError):
+        planet["climate"]
+    with pytest.raises(KeyError):
+        planet["climate"] = "arid"
+    with pytest.raises(KeyError):
+        planet_class({"name": "Tatooine", "climate": "arid"})
+
+
+def test_entity_classes_are_reused_and_validated():
+    system_class = utl.entity_class("star_system", ["name"])
+
+    assert system_class is utl.entity_class("star_system", ("name",))
+    assert system_class.__name__ == "StarSystem"
+    assert system_class is not utl.entity_class("star_system", ("name", "sector"))
+    with pytest.raises(ValueError):
+        utl.entity_class("planet", ("name", "orbital-period"))
+    with pytest.raises(ValueError):
+        utl.entity_class("planet", ("name", "items"))
+
+
+def test_entity_factory_uses_the_new_key_names():
+    keys = {"planet": {"name": "name", "diameter": "diameter_km"}}
+    factory = utl.EntityFactory(keys)
+    planet = factory("planet", {"name": "Hoth", "diameter_km": 7200})
+    person = factory("person", {"name": "Han Solo"})
+
+    assert planet.fields == ("name", "diameter_km")
+    assert type(planet) is type(factory("planet", {"name": "Naboo"}))
+    assert person.fields == ("name",)
+    assert json.loads(json.dumps(planet.to_dict())) == planet
@@ -0,0 +1,171 @@
+import csv
+
+import pytest
+
+import five_oh_six as utl
+
+from .conftest import SWAPI_ENDPOINT
+
+# File signatures of the compression formats, keyed by file extension
+MAGIC_NUMBERS = {
+    ".gz": b"\x1f\x8b",
+    ".bz2": b"BZh",
+    ".xz": b"\xfd7zXZ\x00",
+    ".zst": b"\x28\xb5\x2f\xfd",
+}
+
+
+def _write_csv(filepath, rows, newline="\n"):
+    """Writes < rows > (the first is the header) to < filepath > with the csv module."""
+
+    with open(filepath, "w", encoding="utf-8", newline="") as file_obj:
+        csv.writer(file_obj, lineterminator=newline).writerows(rows)
+
+
+def _require_codec(extension):
+    """Skips the calling test if the package that implements < extension > is missing."""
+
+    if extension == ".zst":
+        pytest.importorskip("zstandard")
+
+
+def _rows(count):
+    """Returns a header and < count > rows mixing multi-line quoted fields and quoted fields
+    with escaped quotes (the csv module quotes 5'10")."""
+
+    rows = [["name", "height", "description"]]
+    for i in range(count):
+        if i % 10 == 0:
+            rows.append([f"p{i}", "1.8", f'Line one\nline "two", of {i}\r\nline three'])
+        else:
+            rows.append([f"p{i}", "5'10\"", "x"])
+    return rows
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_parallel_reader_matches_the_serial_reader(tmp_path, chunk_size, newline):
+    filepath = str(tmp_path / "people.csv")
+    _write_csv(filepath, _rows(200), newline)
+
+    serial = utl.read_csv_to_dicts(filepath)
+    assert len(serial) == 200
+    assert utl.read_csv_to_dicts_parallel(filepath, max_workers=1, chunk_size=chunk_size) == serial
+
+
+def test_literal_quotes_in_unquoted_fields(tmp_path):
+    filepath = tmp_path / "people.csv"
+    lines = ["name,height,description"]
+    for i in range(200):
+        lines.append(f'p{i},5\'10",x' if i % 3 else f'p{i},"6\'2""","a\nb"c"')
+    filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    serial = utl.read_csv_to_dicts(str(filepath))
+    for chunk_size in (1, 13, 256):
+        parallel = utl.read_csv_to_dicts_parallel(
+            str(filepath), max_workers=1, chunk_size=chunk_size
+        )
+        assert parallel == serial
+    assert len(serial) == 200
+
+
+def test_parallel_reader_with_worker_processes(tmp_path):
+    filepath = str(tmp_path / "people.csv")
+    _write_csv(filepath, _rows(200))
+
+    parallel = utl.read_csv_to_dicts_parallel(filepath, max_workers=2, chunk_size=512)
+
+    assert parallel == utl.read_csv_to_dicts(filepath)
+
+
+@pytest.mark.parametrize("extension", list(MAGIC_NUMBERS))
+def test_json_round_trips_through_each_codec(tmp_path, extension):
+    _require_codec(extension)
+    filepath = tmp_path / f"data.json{extension}"
+    data = {"name": "Tatooine", "terrain": ["desert"], "diameter": 10465, "note": "Mos Eisley"}
+
+    utl.write_json(str(filepath), data)
+
+    assert filepath.read_bytes().startswith(MAGIC_NUMBERS[extension])
+    assert utl.read_json(str(filepath)) == data
+
+
+@pytest.mark.parametrize("extension", list(MAGIC_NUMBERS))
+def test_json_arrays_round_trip_through_each_codec(tmp_path, extension):
+    _require_codec(extension)
+    filepath = tmp_path / f"planets.json{extension}"
+    planets = [
+        {"name": f"planet {i}", "diameter": i * 1000, "moons": [i] * (i % 3)} for i in range(50)
+    ]
+
+    utl.write_json_array(str(filepath), iter(planets))
+
+    assert filepath.read_bytes().startswith(MAGIC_NUMBERS[extension])
+    assert list(utl.iter_json_array(str(filepath))) == planets
+    assert utl.read_json(str(filepath)) == planets
+
+
+def test_a_compressed_cache_file_survives_persist_and_reload(stand_in, tmp_path):
+    filepath = str(tmp_path / "CACHE.json.gz")
+    urls = [f"{SWAPI_ENDPOINT}/planets/{i}/" for i in range(1, 4)]
+    with utl.SwapiCache(filepath) as cache:
+        planets = cache.fetch_many(urls)
+        cache.persist()
+    requests = stand_in.stats["requests"]
+
+    assert utl.infer_compression(filepath) == "gzip"
+    assert sorted(utl.read_json(filepath)) == sorted(urls)
+    reloaded = utl.SwapiCache(filepath)
+    assert reloaded.fetch_many(urls) == planets
+    assert stand_in.stats["requests"] == requests  # every lookup was a hit
+
+
+def _swapi_document():
+    """Returns a cache-like document that repeats strings, entities, and empty arrays."""
+
+    luke = {
+        "name": "Luke Skywalker",
+        "homeworld": "https://swapi.py4e.com/api/planets/1/",
+        "films": [],
+        "species": [],
+        "vehicles": ["https://swapi.py4e.com/api/vehicles/14/"],
+        "url": "https://swapi.py4e.com/api/people/1/",
+    }
+    return {
+        luke["url"]: luke,
+        "https://swapi.py4e.com/api/people/?search=luke": {"count": 1, "results": [dict(luke)]},
+        "https://swapi.py4e.com/api/planets/1/": {"name": "Tatooine", "residents": [luke["url"]]},
+    }
+
+
+@pytest.mark.parametrize("options", [{"intern": True}, {"share": True}])
+def test_compact_json_loads_equal_a_plain_load(tmp_path, options):
+    filepath = str(tmp_path / "CACHE.json")
+    utl.write_json(filepath, _swapi_document())
+
+    assert utl.read_json(filepath, **options) == utl.read_json(filepath) == _swapi_document()
+
+
+def test_shared_json_subtrees_are_the_same_objects(tmp_path):
+    filepath = str(tmp_path / "CACHE.json")
+    utl.write_json(filepath, _swapi_document())
+    url, search = list(_swapi_document())[:2]
+
+    document = utl.read_json(filepath, share=True)
+
+    assert document[url] is document[search]["results"][0]  # as documented
+    assert document[url]["films"] is document[url]["species"]
+
+
+def test_interned_csv_rows_equal_a_plain_load(tmp_path):
+    filepath = str(tmp_path / "planets.csv")
+    rows = [["name", "climate", "terrain"]]
+    rows += [[f"p{i}", "temperate", "grasslands, mountains"] for i in range(20)]
+    _write_csv(filepath, rows)
+
+    interned = utl.read_csv_to_dicts(filepath, intern=True)
+
+    assert interned == utl.read_csv_to_dicts(filepath)
+    assert interned[0]["climate"] is interned[1]["climate"]
+    interned[0]["climate"] = "arid"  # strings are immutable: rebinding touches one row only
+    assert interned[1]["climate"] == "temperate"
@@ -0,0 +1,51 @@
+import five_oh_six as utl
+
+
+PEOPLE = [
+    {"name": "Din Djarin"},
+    {"name": "Carasynthia Dune"},
+    {"name": "Padmé Amidala"},
+    {"name": "IG-11"},
+    {"name": "Greef Karga"},
+]
+
+
+def test_normalize_name():
+    assert utl.normalize_name("Padmé  Amidala") == "padme amidala"
+    assert utl.normalize_name("IG-11") == "ig 11"
+    assert utl.normalize_name(" Greef\tKARGA ") == "greef karga"
+
+
+def test_exact_lookups_ignore_accents_case_and_punctuation():
+    index = utl.FuzzyIndex(PEOPLE)
+
+    assert index.get("padme amidala") is PEOPLE[2]
+    assert index.get("ig 11") is PEOPLE[3]
+    assert index.get("GREEF KARGA") is PEOPLE[4]
+
+
+def test_similar_names_match_only_above_the_threshold():
+    index = utl.FuzzyIndex(PEOPLE)
+    score = index.matches("Cara Dune", threshold=0.0)[0][0]
+
+    assert 0.6 <= score < 1.0
+    assert index.get("Cara Dune") is PEOPLE[1]
+    assert utl.FuzzyIndex(PEOPLE, threshold=score + 0.01).get("Cara Dune") is None
+    assert utl.FuzzyIndex(PEOPLE, threshold=score).get("Cara Dune") is PEOPLE[1]
+    assert index.get("Moff Gideon", "missing") == "missing"
+
+
+def test_candidate_pruning_finds_every_match_a_full_scan_finds():
+    names = [f"Planet {i:04d}" for i in range(300)] + ["Nevarro", "Navarro Prime", "Arvala-7"]
+    index = utl.FuzzyIndex({"name": name} for name in names)
+
+    for query in ("Nevaro", "Planet 0042", "Arvala 7", "Navaro Prim"):
+        for threshold in (0.3, 0.5, 0.6, 0.8):
+            grams = utl.fuzzy._ngrams(utl.normalize_name(query), 3)
+            expected = set()
+            for name in names:
+                other = utl.fuzzy._ngrams(utl.normalize_name(name), 3)
+                if 2 * len(grams & other) / (len(grams) + len(other)) >= threshold:
+                    expected.add(name)
+            found = {entity["name"] for _, entity in index.matches(query, 1000, threshold)}
+            assert found == expected
@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+import five_oh_six as utl
+
+
+@pytest.fixture
+def instrumentation():
+    utl.reset_instrumentation()
+    utl.enable_instrumentation()
+    try:
+        yield
+    finally:
+        utl.disable_instrumentation()
+        utl.reset_instrumentation()
+
+
+def test_counters_are_exact_when_updated_from_several_threads(instrumentation):
+    def work():
+        for _ in range(2000):
+            with utl.timed("block"):
+                pass
+            utl.record_cache_access("lookup", hit=True)
+            utl.to_int("506")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = utl.instrumentation_report()
+    assert report["block"]["calls"] == 16000
+    assert report["lookup"]["cache_hits"] == 16000
+    assert report["to_int"]["calls"] == 16000
+
+
+def test_disabled_instrumentation_records_nothing():
+    utl.reset_instrumentation()
+    with utl.timed("block"):
+        utl.to_int("506")
+
+    assert utl.instrumentation_report() == {}
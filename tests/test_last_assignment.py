@@ -0,0 +1,72 @@
+import last_assignment as la
+
+
+EPISODES = [
+    {"episode_director": "Dave Filoni", "episode_writers": ["Henry Gilroy", "Steven Melching"]},
+    {"episode_director": "Brian Kalin O'Connell", "episode_writers": "Katie Lucas"},
+    {"episode_director": None, "episode_writers": "Steven Melching, Katie Lucas, Dave Filoni"},
+    {"episode_director": "Dave Filoni", "episode_writers": []},
+]
+
+
+def test_credit_counts_and_summaries_split_credits_alike():
+    credits = list(la.iter_episode_credits(EPISODES, "episode_writers"))
+    counts = la.count_episodes_by_credit(EPISODES, "episode_writers")
+
+    assert credits[:3] == [("Henry Gilroy", 0.5), ("Steven Melching", 0.5), ("Katie Lucas", 1.0)]
+    assert counts == {
+        "Henry Gilroy": 0.5,
+        "Steven Melching": 0.5 + 1 / 3,
+        "Katie Lucas": 1.0 + 1 / 3,
+        "Dave Filoni": 1 / 3,
+    }
+    for sketch in (False, True):
+        summary = la.summarize_episode_credits(EPISODES, "episode_writers", sketch=sketch)
+        assert summary.distinct() == len(counts)
+        assert summary.top() == dict(sorted(counts.items(), key=lambda item: -item[1]))
+    assert la.count_episodes_by_credit(EPISODES, "episode_director") == {
+        "Dave Filoni": 2.0,
+        "Brian Kalin O'Connell": 1.0,
+    }
+
+
+def test_rank_episode_counts_matches_a_full_sort_including_ties():
+    counts = {
+        "Dave Filoni": 3.0,
+        "Kyle Dunlevy": 2.0,
+        "Brian Kalin O'Connell": 2.0,
+        "Justin Ridge": 2.0,
+        "Steward Lee": 1.0,
+        "Giancarlo Volpe": 2.0,
+        "Atsushi Takeuchi": 1.0,
+        "Walter Murch": 2.0,
+        "Rob Coleman": 3.0,
+        "Bosco Ng": 1.0,
+        "Danny Keller": 2.0,  # ties "Kyle Dunlevy" on count but not on last name
+        "Jesse Yeh": 1.0,
+        "Anne Murch": 2.0,  # ties "Walter Murch" on count and last name: original order kept
+    }
+    expected = dict(sorted(counts.items(), key=lambda x: (-x[1], x[0].split()[-1])))
+
+    assert list(la.rank_episode_counts(counts)) == list(expected)
+    for top_k in range(len(counts) + 2):
+        ranked = la.rank_episode_counts(counts, top_k)
+        assert list(ranked.items()) == list(expected.items())[:top_k]
+
+
+def test_linked_resources_follow_only_the_first_species(monkeypatch):
+    fetched = []
+    monkeypatch.setattr(la, "get_swapi_resource", lambda url: fetched.append(url) or {"url": url})
+    person = {
+        "homeworld": "https://swapi.py4e.com/api/planets/1/",
+        "species": [
+            "https://swapi.py4e.com/api/species/1/",
+            "https://swapi.py4e.com/api/species/2/",
+        ],
+    }
+
+    resources = la.get_linked_resources(person)
+
+    assert fetched == [person["homeworld"], person["species"][0]]
+    assert list(resources) == fetched
+    assert la.get_linked_resources({"homeworld": None, "species": []}) == {}
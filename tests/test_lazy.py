@@ -0,0 +1,82 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import five_oh_six as utl
+import last_assignment as la
+
+from .conftest import SWAPI_ENDPOINT
+
+
+KEYS = {
+    "person": {"url": "url", "name": "name", "homeworld": "homeworld", "species": "species"},
+    "planet": {"url": "url", "name": "name", "diameter": "diameter_km"},
+    "species": {"url": "url", "name": "name", "classification": "classification"},
+}
+LUKE = {
+    "url": f"{SWAPI_ENDPOINT}/people/1/",
+    "name": "Luke Skywalker",
+    "homeworld": f"{SWAPI_ENDPOINT}/planets/1/",
+    "species": [f"{SWAPI_ENDPOINT}/species/1/"],
+}
+
+
+def test_lazy_resources_load_once_on_first_access():
+    calls = []
+
+    def load(url):
+        calls.append(url)
+        time.sleep(0.05)
+        return {"name": "Tatooine", "url": url}
+
+    tatooine = utl.LazyResource(f"{SWAPI_ENDPOINT}/planets/1/", load)
+    assert not tatooine.resolved and not calls
+    assert repr(tatooine) == f"LazyResource({SWAPI_ENDPOINT + '/planets/1/'!r})"
+
+    start = threading.Barrier(16)
+
+    def read(_):
+        start.wait()
+        return tatooine["name"]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        names = list(executor.map(read, range(16)))
+
+    assert names == ["Tatooine"] * 16
+    assert calls == [f"{SWAPI_ENDPOINT}/planets/1/"]
+    assert tatooine.resolved and dict(tatooine) == load(tatooine.url)
+
+
+def test_lazy_person_fetches_links_on_first_access(stand_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(la, "cache", utl.SwapiCache(str(tmp_path / "CACHE.json")))
+
+    person = la.transform_person(LUKE, KEYS, la.NONE_VALUES, lazy=True)
+    assert stand_in.stats["requests"] == 0
+    assert person["homeworld"]["name"] == "Planet 1"
+    assert stand_in.stats["requests"] == 1
+    assert not person["species"].resolved
+
+    assert person == la.transform_person(LUKE, KEYS, la.NONE_VALUES)
+    assert stand_in.stats["requests"] == 2
+
+
+def test_references_are_written_resolved_unless_disabled(tmp_path):
+    def load(url):
+        return {"name": "Tatooine", "url": url}
+
+    url = f"{SWAPI_ENDPOINT}/planets/1/"
+    person = {"name": "Luke Skywalker", "homeworld": utl.LazyResource(url, load)}
+    resolved = {"name": "Luke Skywalker", "homeworld": {"name": "Tatooine", "url": url}}
+
+    utl.write_json(str(tmp_path / "unresolved.json"), person, resolve_references=False)
+    assert utl.read_json(str(tmp_path / "unresolved.json")) == {**person, "homeworld": url}
+    assert not person["homeworld"].resolved
+
+    utl.write_json(str(tmp_path / "resolved.json"), person)
+    assert utl.read_json(str(tmp_path / "resolved.json")) == resolved
+
+    utl.write_json_array(str(tmp_path / "people.json"), [person], resolve_references=False)
+    assert utl.read_json(str(tmp_path / "people.json")) == [{**person, "homeworld": url}]
+    utl.write_json_array(str(tmp_path / "people.json"), [person])
+    assert utl.read_json(str(tmp_path / "people.json")) == [resolved]
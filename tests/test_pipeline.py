@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+import five_oh_six as utl
+
+
+def _planets(count, fail_at=None):
+    """Yields < count > planet dictionaries, raising a ValueError before the < fail_at >th."""
+
+    for i in range(count):
+        if i == fail_at:
+            raise ValueError(f"bad row {i}")
+        yield {"name": f"Planet {i}", "diameter": str(i * 1000)}
+
+
+def _buffer_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "pipeline-buffer"]
+
+
+def test_buffer_raises_the_exception_of_an_earlier_stage():
+    records = []
+    pipeline = utl.Pipeline(_planets(10, fail_at=5)).buffer(2).map(dict, climate="arid")
+
+    with pytest.raises(ValueError, match="bad row 5"):
+        for record in pipeline:
+            records.append(record)
+
+    assert [record["name"] for record in records] == [f"Planet {i}" for i in range(5)]
+
+
+def test_closing_a_buffered_pipeline_stops_its_thread():
+    def endless():
+        i = 0
+        while True:
+            yield {"name": f"Planet {i}"}
+            i += 1
+
+    records = iter(utl.Pipeline(endless()).buffer(4))
+    assert next(records) == {"name": "Planet 0"}
+    assert _buffer_threads()
+    records.close()
+
+    for _ in range(100):
+        if not _buffer_threads():
+            break
+        time.sleep(0.01)
+    assert not _buffer_threads()
+
+
+def test_stages_stream_the_same_records_as_a_list(tmp_path):
+    swapi_planets = [{"name": f"Planet {i}", "climate": "arid"} for i in range(0, 20, 2)]
+    filepath = str(tmp_path / "planets.json")
+
+    count = (
+        utl.Pipeline(_planets(20))
+        .buffer(3)
+        .filter(lambda planet: planet["diameter"] != "0")
+        .join(swapi_planets, "name", how="inner")
+        .lookup({"Planet 4": "Tatooine"}, "name", "alias")
+        .write_json(filepath)
+    )
+
+    expected = [
+        {**planet, "climate": "arid", "alias": "Tatooine" if planet["name"] == "Planet 4" else None}
+        for planet in list(_planets(20))[2:20:2]
+    ]
+    assert count == len(expected) == 9
+    assert utl.read_json(filepath) == expected
+    assert list(utl.iter_json_array(filepath)) == expected
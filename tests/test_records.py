@@ -0,0 +1,156 @@
+import gc
+
+import pytest
+
+import five_oh_six as utl
+
+
+def test_sorted_view_combines_descending_and_ascending_fields():
+    planets = utl.EntityCollection(
+        [
+            {"name": "Naboo", "diameter_km": 12120},
+            {"name": "Hoth", "diameter_km": 7200},
+            {"name": "Alderaan", "diameter_km": 12500},
+            {"name": "Bespin", "diameter_km": 118000},
+            {"name": "Dagobah", "diameter_km": 8900},
+            {"name": "Endor", "diameter_km": None},
+            {"name": "Kamino", "diameter_km": 19720},
+            {"name": "Utapau", "diameter_km": 12900},
+            {"name": "Zeltros", "diameter_km": 12120},
+        ]
+    )
+
+    view = planets.sorted_view(("diameter_km", True), "name")
+
+    assert [planet["name"] for planet in view] == [
+        "Bespin",
+        "Kamino",
+        "Utapau",
+        "Alderaan",
+        "Naboo",
+        "Zeltros",
+        "Dagobah",
+        "Hoth",
+        "Endor",
+    ]
+
+
+def test_sorted_view_stays_ordered_as_entities_are_appended():
+    planets = utl.EntityCollection([{"name": "Hoth"}, {"name": "Tatooine"}])
+    view = planets.sorted_view(("name", True))
+
+    planets.extend([{"name": "Naboo"}, {"name": "Yavin IV"}, {"name": "Hoth"}])
+
+    assert [planet["name"] for planet in view] == [
+        "Yavin IV",
+        "Tatooine",
+        "Naboo",
+        "Hoth",
+        "Hoth",
+    ]
+    assert view[3] is planets[0]  # ties keep the order in which entities were added
+
+
+def test_unreferenced_sorted_views_are_released():
+    planets = utl.EntityCollection([{"name": "Hoth"}])
+    kept = planets.sorted_view("name")
+    planets.sorted_view(("name", True))
+    gc.collect()
+
+    planets.append({"name": "Dagobah"})
+
+    assert len(planets._views) == 1
+    assert [planet["name"] for planet in kept] == ["Dagobah", "Hoth"]
+
+
+def test_entity_query_matches_get_nested_dict():
+    planets = [
+        {"name": "Endor", "diameter_km": None},
+        {"name": "Naboo", "diameter_km": 12120},
+        {"name": "Hoth", "diameter_km": 7200},
+        {"name": "Zeltros", "diameter_km": 12120},
+        {"name": "Mustafar", "diameter_km": "unknown"},
+    ]
+    query = utl.EntityQuery(planets)
+
+    assert query.first("diameter_km", 12120) is utl.get_nested_dict(
+        planets, "diameter_km", 12120
+    )
+    assert query.eq("diameter_km", 12120) == [planets[1], planets[3]]
+    assert query.eq("diameter_km", "unknown") == []
+    assert query.first("diameter_km", 10465) is None
+
+
+def test_entity_query_ranges():
+    planets = [{"name": name, "diameter_km": km} for name, km in (("a", 3), ("b", 1), ("c", 2))]
+    query = utl.EntityQuery(planets)
+
+    assert [p["name"] for p in query.range("diameter_km", 2)] == ["c", "a"]
+    assert [p["name"] for p in query.range("diameter_km", 1, 3, False, False)] == ["c"]
+    assert [p["name"] for p in query.ordered("diameter_km", descending=True)] == ["a", "c", "b"]
+
+
+def test_entity_query_ignores_non_numeric_values_and_bounds():
+    planets = [{"name": "a", "diameter_km": 1}, {"name": "b", "diameter_km": "unknown"}]
+    query = utl.EntityQuery(planets)
+
+    assert query.eq("diameter_km", "unknown") == []
+    assert query.range("diameter_km", "a") == []
+    assert query.range("diameter_km", 0, float("nan")) == []
+    assert query.range("diameter_km", None, 1) == planets[:1]
+
+
+def test_hash_join_matches_the_get_nested_dict_loop():
+    swapi = [{"name": "Tatooine", "climate": "arid"}, {"name": "Hoth", "climate": "frozen"}]
+    wookiee = [{"name": "Hoth", "climate": "frozen, icy", "region": "Outer Rim"}]
+
+    expected = []
+    for planet in swapi:
+        planet = dict(planet)
+        planet.update(utl.get_nested_dict(wookiee, "name", planet["name"]) or {})
+        expected.append(planet)
+
+    assert utl.hash_join(swapi, wookiee, "name").rows == expected
+    assert swapi[1] == {"name": "Hoth", "climate": "frozen"}  # inputs are not modified
+
+
+def test_hash_join_precedence_and_conflicts():
+    left = [{"name": "Hoth", "climate": "frozen", "terrain": "tundra", "moons": "3"}]
+    right = [{"name": "Hoth", "climate": "frozen, icy", "terrain": "ice caves", "moons": "3"}]
+
+    assert utl.hash_join(left, right, "name").rows[0]["climate"] == "frozen, icy"
+    assert utl.hash_join(left, right, "name", precedence="left").rows[0]["climate"] == "frozen"
+
+    result = utl.hash_join(left, right, "name", precedence={"terrain": "left"})
+    assert result.rows == [
+        {"name": "Hoth", "climate": "frozen, icy", "terrain": "tundra", "moons": "3"}
+    ]
+    assert result.conflicts == {"climate": 1, "terrain": 1}
+
+
+def test_hash_join_reports_unmatched_and_duplicate_rows():
+    left = [{"name": "Hoth"}, {"name": "Kessel"}, {"title": "no key"}]
+    right = [{"name": "Hoth", "n": 1}, {"name": "Hoth", "n": 2}, {"name": "Jakku"}, {"n": 3}]
+
+    inner = utl.hash_join(left, right, "name", how="inner")
+    outer = utl.hash_join(left, right, "name")
+
+    assert inner.rows == [{"name": "Hoth", "n": 1}]
+    assert outer.rows == [{"name": "Hoth", "n": 1}, {"name": "Kessel"}, {"title": "no key"}]
+    assert inner.summary() == {
+        "rows": 1,
+        "matched": 1,
+        "unmatched_left": 2,
+        "unmatched_right": 2,
+        "duplicate_right": 1,
+        "conflicts": {},
+    }
+
+
+def test_hash_join_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        utl.hash_join([], [], "name", how="outer")
+    with pytest.raises(ValueError):
+        utl.iter_hash_join([], [], "name", precedence="both")  # raised before iteration
+    with pytest.raises(ValueError):
+        utl.hash_join([], [], "name", precedence={"climate": "left", "terrain": "lft"})
@@ -0,0 +1,36 @@
+import json
+import math
+import random
+
+import pytest
+
+import five_oh_six as utl
+
+
+@pytest.fixture
+def orjson_backend():
+    pytest.importorskip("orjson")
+    current = utl.get_json_backend()
+    utl.set_json_backend("orjson")
+    yield
+    utl.set_json_backend(current)
+
+
+def test_orjson_documents_match_the_json_module(orjson_backend):
+    rng = random.Random(45)
+    floats = [1e16, -1e16, 1e-05, 5e-05, 10.00001, 0.0001, 1.5e300, 5e-324, 0.1, 3.0]
+    floats += [rng.uniform(-1, 1) * 10 ** rng.randint(-30, 30) for _ in range(5000)]
+    data = {
+        "floats": floats,
+        "strings": ["1e16", '0.00001 "1e-05"', "10.00001", "Padmé"],
+        "nested": {"1e16": [2e16, {"diameter_km": 1e-07}], "name": "Naboo"},
+    }
+
+    assert utl.dumps(data) == json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    assert utl.loads(utl.dumps(data)) == data
+
+
+def test_orjson_differences_are_limited_to_nan_and_compact_separators(orjson_backend):
+    assert utl.dumps([math.nan, math.inf]) == json.dumps([None, None], indent=2).encode()
+    assert utl.dumps({"a": [1e16, 1]}, indent=None) == b'{"a":[1e+16,1]}'
+    assert utl.dumps(2**70) == str(2**70).encode()  # encoded by the json module
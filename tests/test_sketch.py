@@ -0,0 +1,86 @@
+import math
+import random
+
+from collections import Counter
+
+import pytest
+
+import five_oh_six as utl
+
+
+def _zipf_stream(count, seed=50):
+    """Returns < count > items whose frequencies follow a power law (a few directors credited
+    with many episodes, many with one)."""
+
+    rng = random.Random(seed)
+    return [f"director {int(rng.paretovariate(1.1))}" for _ in range(count)]
+
+
+@pytest.mark.parametrize("count", [100, 1000, 10000, 100000])
+def test_hyperloglog_counts_are_within_the_error_bound(count):
+    sketch = utl.HyperLogLog()
+    for i in range(count):
+        sketch.add(f"item {i}")
+        sketch.add(f"item {i // 2}")  # repeats are not counted again
+
+    assert abs(len(sketch) - count) <= 2 * sketch.error * count
+    if count <= 1000:
+        assert abs(len(sketch) - count) <= 0.01 * count  # linear counting
+
+
+def test_hyperloglog_merge_counts_the_union():
+    first, second, union = utl.HyperLogLog(10), utl.HyperLogLog(10), utl.HyperLogLog(10)
+    for i in range(20000):
+        (first if i % 2 else second).add(f"item {i % 15000}")
+        union.add(f"item {i % 15000}")
+
+    first.merge(second)
+    assert first.registers == union.registers
+    assert abs(first.count() - 15000) <= 2 * first.error * 15000
+    with pytest.raises(ValueError):
+        first.merge(utl.HyperLogLog(12))
+    with pytest.raises(ValueError):
+        utl.HyperLogLog(3)
+
+
+@pytest.mark.parametrize("width,depth", [(32, 2), (64, 3), (2048, 5)])
+def test_count_min_estimates_are_within_the_error_bound(width, depth):
+    rng = random.Random(50)
+    items = _zipf_stream(10000) + [f"writer {rng.randrange(5000)}" for _ in range(10000)]
+    counts = Counter()
+    sketch = utl.CountMinSketch(width, depth)
+    for item in items:
+        sketch.add(item, 0.5)
+        counts[item] += 0.5
+
+    overestimates = [sketch.estimate(item) - count for item, count in counts.items()]
+    assert sketch.total == sum(counts.values())
+    assert min(overestimates) >= 0
+    exceeded = sum(overestimate > sketch.error_bound for overestimate in overestimates)
+    assert exceeded / len(counts) <= math.exp(-depth)
+    assert sketch.estimate("never added") <= sketch.error_bound
+
+
+def test_heavy_hitters_report_the_most_frequent_items():
+    items = _zipf_stream(20000)
+    heavy_hitters = utl.HeavyHitters(capacity=40, width=256, depth=4)
+    for item in items:
+        heavy_hitters.add(item)
+
+    expected = Counter(items).most_common(10)
+    top = heavy_hitters.top(10)
+    assert [item for item, _ in top] == [item for item, _ in expected]
+    for (_, estimate), (_, count) in zip(top, expected):
+        assert count <= estimate <= count + heavy_hitters.sketch.error_bound
+
+
+def test_stream_summary_sketch_mode_agrees_with_exact_mode():
+    items = _zipf_stream(20000)
+    exact, sketch = utl.StreamSummary(5), utl.StreamSummary(5, sketch=True)
+    for item in items:
+        exact.add(item)
+        sketch.add(item)
+
+    assert list(sketch.top()) == list(exact.top())
+    error = sketch.distinct_sketch.error
+    assert abs(sketch.distinct() - exact.distinct()) <= 2 * error * exact.distinct()
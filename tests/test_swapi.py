@@ -0,0 +1,192 @@
+import multiprocessing
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+import five_oh_six as utl
+
+from .conftest import SWAPI_ENDPOINT
+
+
+def _fetch_in_process(filepath, endpoint, urls):
+    """Fetches < urls > through a new cache in a separate process."""
+
+    utl.set_fetch_mode(endpoint_override=(SWAPI_ENDPOINT, endpoint))
+    cache = utl.SwapiCache(filepath)
+    return [cache.fetch(url) for url in urls]
+
+
+def test_concurrent_misses_for_a_resource_send_one_request(stand_in, tmp_path):
+    stand_in.latency = 0.1
+    cache = utl.SwapiCache(str(tmp_path / "CACHE.json"))
+    url = f"{SWAPI_ENDPOINT}/people/1/"
+
+    people = cache.fetch_many([url] * 16, max_workers=16)
+
+    assert stand_in.stats["requests"] == 1
+    assert all(person == people[0] for person in people)
+    assert cache.stats.misses == 1 and cache.stats.hits == 15
+
+
+def test_processes_sharing_a_cache_file_fetch_each_resource_once(stand_in, tmp_path):
+    stand_in.latency = 0.1
+    filepath = str(tmp_path / "CACHE.json")
+    urls = [f"{SWAPI_ENDPOINT}/planets/{i}/" for i in range(1, 6)]
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+        futures = [
+            executor.submit(_fetch_in_process, filepath, stand_in.endpoint, urls)
+            for _ in range(2)
+        ]
+        first, second = [future.result() for future in futures]
+
+    assert first == second
+    assert stand_in.stats["requests"] == len(urls)
+    assert sorted(utl.read_json(filepath)) == sorted(urls)
+
+
+def test_writes_merge_entries_added_by_other_caches(stand_in, tmp_path):
+    filepath = str(tmp_path / "CACHE.json")
+    first = utl.SwapiCache(filepath)
+    second = utl.SwapiCache(filepath)
+    assert len(first) == len(second) == 0  # both read the (missing) file before any write
+
+    first.fetch(f"{SWAPI_ENDPOINT}/people/1/")
+    second.fetch(f"{SWAPI_ENDPOINT}/people/2/")
+    first.fetch(f"{SWAPI_ENDPOINT}/people/3/")
+
+    assert sorted(utl.read_json(filepath)) == [
+        f"{SWAPI_ENDPOINT}/people/{i}/" for i in (1, 2, 3)
+    ]
+    assert f"{SWAPI_ENDPOINT}/people/2/" in first  # reloaded while merging
+
+
+def test_fetches_proceed_while_the_cache_is_written(stand_in, tmp_path):
+    cache = utl.SwapiCache(str(tmp_path / "CACHE.json"))
+    person = cache.fetch(f"{SWAPI_ENDPOINT}/people/1/")
+
+    writing, release = threading.Event(), threading.Event()
+    write_atomic = cache._write_atomic
+
+    def slow_write_atomic(*args, **kwargs):
+        writing.set()
+        release.wait(5)
+        write_atomic(*args, **kwargs)
+
+    cache._write_atomic = slow_write_atomic
+    writer = threading.Thread(target=cache.persist)
+    writer.start()
+    try:
+        assert writing.wait(5)
+        assert cache.fetch(f"{SWAPI_ENDPOINT}/people/1/") == person  # hit
+        miss = threading.Thread(target=cache.fetch, args=(f"{SWAPI_ENDPOINT}/people/2/",))
+        miss.start()
+        for _ in range(200):  # the miss is requested before the write completes
+            if f"{SWAPI_ENDPOINT}/people/2/" in cache:
+                break
+            time.sleep(0.01)
+        assert f"{SWAPI_ENDPOINT}/people/2/" in cache
+    finally:
+        release.set()
+        writer.join()
+    miss.join()
+    assert len(utl.read_json(cache.filepath)) == 2
+
+
+def test_prefetched_resources_are_written_together(stand_in, tmp_path):
+    filepath = str(tmp_path / "CACHE.json")
+    urls = [f"{SWAPI_ENDPOINT}/people/{i}/" for i in range(1, 21)]
+    utl.SwapiCache(filepath).fetch_many(urls)
+
+    stand_in.latency = 0.05
+    cache = utl.SwapiCache(filepath, prefetch=True)
+    assert not utl.SwapiCache(filepath).prefetch  # prefetching is opt-in
+    for url in urls:
+        cache.fetch(url)  # hits that prefetch each person's homeworld
+    cache.close()
+
+    assert cache.stats.prefetches == 20
+    assert cache.stats.persist_writes == 1
+    assert cache._executor is None
+    assert len(utl.read_json(filepath)) == 40
+
+
+def test_closing_the_cache_waits_for_prefetches(stand_in, tmp_path):
+    filepath = str(tmp_path / "CACHE.json")
+    with utl.SwapiCache(filepath, prefetch=True) as cache:
+        cache.fetch(f"{SWAPI_ENDPOINT}/people/1/")
+
+    assert cache._executor is None
+    assert sorted(utl.read_json(filepath)) == [
+        f"{SWAPI_ENDPOINT}/people/1/", f"{SWAPI_ENDPOINT}/planets/1/"
+    ]
+
+
+def test_the_cache_file_is_read_once_on_first_use(stand_in, tmp_path, monkeypatch):
+    filepath = str(tmp_path / "CACHE.json")
+    urls = [f"{SWAPI_ENDPOINT}/people/{i}/" for i in range(1, 5)]
+    utl.SwapiCache(filepath).fetch_many(urls)
+    requests = stand_in.stats["requests"]
+
+    reads = []
+    create_cache = utl.swapi.create_cache
+
+    def slow_create_cache(path, *args):
+        reads.append(path)
+        time.sleep(0.05)  # widen the window for concurrent first lookups
+        return create_cache(path, *args)
+
+    monkeypatch.setattr(utl.swapi, "create_cache", slow_create_cache)
+    cache = utl.SwapiCache(filepath)
+    assert reads == []  # creating the cache does not read the file
+
+    people = cache.fetch_many(urls * 4, max_workers=16)
+
+    assert reads == [cache.validators_filepath, filepath]
+    assert stand_in.stats["requests"] == requests  # every lookup was a hit
+    assert cache.stats.hits == 16 and people[:4] == people[4:8]
+
+
+def test_revalidating_unchanged_resources_leaves_the_cache_file_untouched(stand_in, tmp_path):
+    filepath = tmp_path / "CACHE.json"
+    cache = utl.SwapiCache(str(filepath))
+    cache.fetch_many([f"{SWAPI_ENDPOINT}/people/{i}/" for i in range(1, 4)])
+    content, mtime = filepath.read_bytes(), filepath.stat().st_mtime_ns
+
+    counts = cache.revalidate_all()
+
+    assert counts == {"not_modified": 3, "modified": 0, "failed": 0}
+    assert stand_in.stats["not_modified"] == 3
+    assert filepath.read_bytes() == content and filepath.stat().st_mtime_ns == mtime
+
+
+def test_revalidating_a_changed_resource_replaces_the_entry(stand_in, tmp_path):
+    filepath = str(tmp_path / "CACHE.json")
+    url = f"{SWAPI_ENDPOINT}/planets/1/"
+    cache = utl.SwapiCache(filepath)
+    cache.fetch(url)
+    stand_in.fixtures[url] = {**stand_in.fixtures[url], "name": "Renamed"}
+
+    counts = cache.revalidate_all()
+
+    assert counts == {"not_modified": 0, "modified": 1, "failed": 0}
+    assert cache.fetch(url)["name"] == "Renamed"
+    assert utl.read_json(filepath)[url]["name"] == "Renamed"
+    assert cache.stats.replacements == 1
+
+
+def test_a_failed_revalidation_keeps_the_stale_entry(stand_in, tmp_path):
+    filepath = tmp_path / "CACHE.json"
+    url = f"{SWAPI_ENDPOINT}/planets/1/"
+    cache = utl.SwapiCache(str(filepath))
+    planet = cache.fetch(url)
+    content = filepath.read_bytes()
+    stand_in.error_rate = 1.0
+
+    counts = cache.revalidate_all()
+
+    assert counts == {"not_modified": 0, "modified": 0, "failed": 1}
+    assert cache.fetch(url) == planet
+    assert filepath.read_bytes() == content
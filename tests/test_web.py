@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import five_oh_six as utl
+
+from .conftest import SWAPI_ENDPOINT
+
+
+def test_record_mode_writes_the_fixture_store_once(stand_in, tmp_path):
+    filepath = str(tmp_path / "fixtures.json")
+    urls = [f"{SWAPI_ENDPOINT}/people/{i}/" for i in range(1, 21)]
+    utl.set_fetch_mode(
+        "record", filepath, endpoint_override=(SWAPI_ENDPOINT, stand_in.endpoint)
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        people = list(executor.map(utl.get_resource, urls))
+
+    assert not (tmp_path / "fixtures.json").exists()  # not rewritten per response
+    assert utl.save_fixtures()
+    assert not utl.save_fixtures()  # nothing recorded since
+    assert utl.read_json(filepath) == dict(zip(urls, people))
+
+
+def test_changing_the_fetch_mode_saves_recorded_responses(stand_in, tmp_path):
+    filepath = str(tmp_path / "fixtures.json")
+    url = f"{SWAPI_ENDPOINT}/planets/3/"
+    utl.set_fetch_mode("record", filepath, (SWAPI_ENDPOINT, stand_in.endpoint))
+    planet = utl.get_resource(url)
+
+    utl.set_fetch_mode("replay", filepath)
+
+    assert utl.get_resource(url) == planet
+    assert stand_in.stats["requests"] == 1